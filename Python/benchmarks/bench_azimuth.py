@@ -0,0 +1,135 @@
+################################################################
+########                                                ########
+########   BENCHMARK: AZIMUTH/HOUR ANGLE RESOLUTION     ########
+########                                                ########
+################################################################
+
+# Compares the previous candidate-comparison method of EquIToHor() and
+# HorToEquI() (asin() and acos() solutions, compared with a ±3° window)
+# to the atan2() formulation, in scalar and in batch (NumPy) mode
+#
+# Run from the Python directory:
+# python benchmarks/bench_azimuth.py [NumberOfDirections]
+
+import math
+import os
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from csillesz.core import EquIToHor, HorToEquI, NormalizeZeroBounded, NormalizeSymmetricallyBoundedPI, NormalizeSymmetricallyBoundedPI_2
+from csillesz.batch import EquIToHorBatch, HorToEquIBatch
+
+
+# Previous method of EquIToHor(), kept here only for comparison
+def EquIToHorCandidates(Latitude, Declination, LocalHourAngle):
+
+    Latitude = NormalizeSymmetricallyBoundedPI(Latitude)
+    Declination = NormalizeSymmetricallyBoundedPI_2(Declination)
+
+    LocalHourAngleDegrees = LocalHourAngle * 15
+
+    Altitude = math.degrees(math.asin(
+            math.sin(math.radians(Declination)) * math.sin(math.radians(Latitude)) +
+            math.cos(math.radians(Declination)) * math.cos(math.radians(Latitude)) * math.cos(math.radians(LocalHourAngleDegrees))
+            ))
+
+    Azimuth1 = math.degrees(math.asin(
+            - math.sin(math.radians(LocalHourAngleDegrees)) * math.cos(math.radians(Declination)) / math.cos(math.radians(Altitude))
+            ))
+    Azimuth1 = NormalizeZeroBounded(Azimuth1, 360)
+
+    if(Azimuth1 <= 180):
+        Azimuth2 = 180 - Azimuth1
+    else:
+        Azimuth2 = 540 - Azimuth1
+
+    Azimuth3 = math.degrees(math.acos(max(-1, min(1,
+            (math.sin(math.radians(Declination)) - math.sin(math.radians(Latitude)) * math.sin(math.radians(Altitude))) /
+            (math.cos(math.radians(Latitude)) * math.cos(math.radians(Altitude)))
+            ))))
+    Azimuth4 = NormalizeZeroBounded(- Azimuth3, 360)
+
+    if(Azimuth1 + 3 > Azimuth3 and Azimuth1 - 3 < Azimuth3):
+        Azimuth = Azimuth1
+    elif(Azimuth1 + 3 > Azimuth4 and Azimuth1 - 3 < Azimuth4):
+        Azimuth = Azimuth1
+    elif(Azimuth2 + 3 > Azimuth3 and Azimuth2 - 3 < Azimuth3):
+        Azimuth = Azimuth2
+    else:
+        Azimuth = Azimuth2
+
+    Altitude = NormalizeSymmetricallyBoundedPI_2(Altitude)
+
+    return(Altitude, NormalizeZeroBounded(Azimuth, 360))
+
+# Previous method of HorToEquI(), kept here only for comparison
+def HorToEquICandidates(Latitude, Altitude, Azimuth):
+
+    Latitude = NormalizeSymmetricallyBoundedPI(Latitude)
+    Altitude = NormalizeSymmetricallyBoundedPI_2(Altitude)
+    Azimuth = NormalizeZeroBounded(Azimuth, 360)
+
+    Declination = math.degrees(math.asin(
+                  math.sin(math.radians(Altitude)) * math.sin(math.radians(Latitude)) +
+                  math.cos(math.radians(Altitude)) * math.cos(math.radians(Latitude)) * math.cos(math.radians(Azimuth))
+                  ))
+    Declination = NormalizeSymmetricallyBoundedPI_2(Declination)
+
+    LocalHourAngleDegrees1_1 = math.degrees(math.asin(max(-1, min(1,
+                            - math.sin(math.radians(Azimuth)) * math.cos(math.radians(Altitude)) / math.cos(math.radians(Declination))
+                            ))))
+    LocalHourAngleDegrees1_2 = 180 - LocalHourAngleDegrees1_1
+
+    LHAcos2_1 = ((math.sin(math.radians(Altitude)) - math.sin(math.radians(Declination)) * math.sin(math.radians(Latitude))) /
+                (math.cos(math.radians(Declination)) * math.cos(math.radians(Latitude))))
+    LocalHourAngleDegrees2_1 = math.degrees(math.acos(max(-1, min(1, LHAcos2_1))))
+    LocalHourAngleDegrees2_2 = - LocalHourAngleDegrees2_1
+
+    if(int(LocalHourAngleDegrees1_1) == int(LocalHourAngleDegrees2_1)):
+        LocalHourAngleDegrees = LocalHourAngleDegrees1_1
+    elif(int(LocalHourAngleDegrees1_1) == int(LocalHourAngleDegrees2_2)):
+        LocalHourAngleDegrees = LocalHourAngleDegrees1_1
+    else:
+        LocalHourAngleDegrees = LocalHourAngleDegrees1_2
+
+    return(Declination, NormalizeZeroBounded(LocalHourAngleDegrees, 360) / 15)
+
+# Best of Repeat runs, in seconds per call
+def TimePerCall(Function, Calls, Repeat=5):
+
+    return(min(timeit.repeat(Function, number=1, repeat=Repeat)) / Calls)
+
+
+if __name__ == "__main__":
+
+    NumberOfDirections = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    Generator = np.random.default_rng(42)
+    Latitude = 47.4979
+    Declinations = Generator.uniform(-89, 89, NumberOfDirections)
+    LocalHourAngles = Generator.uniform(0, 24, NumberOfDirections)
+    Altitudes = Generator.uniform(-89, 89, NumberOfDirections)
+    Azimuths = Generator.uniform(0, 360, NumberOfDirections)
+
+    DeclinationList = Declinations.tolist()
+    LocalHourAngleList = LocalHourAngles.tolist()
+    AltitudeList = Altitudes.tolist()
+    AzimuthList = Azimuths.tolist()
+
+    Results = [
+        ("EquIToHor, candidates (scalar)", TimePerCall(lambda: [EquIToHorCandidates(Latitude, d, t) for d, t in zip(DeclinationList, LocalHourAngleList)], NumberOfDirections)),
+        ("EquIToHor, atan2 (scalar)", TimePerCall(lambda: [EquIToHor(Latitude, None, d, None, None, t) for d, t in zip(DeclinationList, LocalHourAngleList)], NumberOfDirections)),
+        ("EquIToHorBatch, atan2 (NumPy)", TimePerCall(lambda: EquIToHorBatch(Latitude, None, Declinations, LocalHourAngle=LocalHourAngles), NumberOfDirections)),
+        ("HorToEquI, candidates (scalar)", TimePerCall(lambda: [HorToEquICandidates(Latitude, m, A) for m, A in zip(AltitudeList, AzimuthList)], NumberOfDirections)),
+        ("HorToEquI, atan2 (scalar)", TimePerCall(lambda: [HorToEquI(Latitude, m, A) for m, A in zip(AltitudeList, AzimuthList)], NumberOfDirections)),
+        ("HorToEquIBatch, atan2 (NumPy)", TimePerCall(lambda: HorToEquIBatch(Latitude, Altitudes, Azimuths), NumberOfDirections)),
+    ]
+
+    print("Directions: {0}".format(NumberOfDirections))
+    for Index, (Name, Seconds) in enumerate(Results):
+        Baseline = Results[0 if Index < 3 else 3][1]
+        print("{0:<34} {1:9.3f} µs/call   speedup: {2:7.1f}x".format(Name, Seconds * 1e06, Baseline / Seconds))
@@ -0,0 +1,5 @@
+# Csillész II Problem Solver
+# Importing the package only loads the computational core,
+# the interactive menu lives in __main__ (run it by `python -m csillesz`)
+
+from .core import *
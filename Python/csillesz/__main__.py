@@ -0,0 +1,2379 @@
+import sys
+
+from .core import *
+
+###############################################################################################
+####                ...     ..      ..                                                     ####
+##                x*8888x.:*8888: -"888:                 @88>                                ##
+##               X   48888X `8888H  8888                 %8P                                 ##
+##              X8x.  8888X  8888X  !888>                       x@88k u@88c.                 ##
+##              X8888 X8888  88888   "*8%-    us888u.   .@88u  ^"8888""8888"                 ##
+##              '*888!X8888> X8888  xH8>   .@88 "8888" ''888E`   8888  888R                  ##
+##                `?8 `8888  X888X X888>   9888  9888    888E    8888  888R                  ##
+##                -^  '888"  X888  8888>   9888  9888    888E    8888  888R                  ##
+##                 dx '88~x. !88~  8888>   9888  9888    888E    8888  888R                  ##
+##               .8888Xf.888x:!    X888X.: 9888  9888    888&   "*88*" 8888"                 ##
+##              :""888":~"888"     `888*"  "888*""888"   R888"    ""   'Y"                   ##
+##                  "~'    "~        ""                   ""                                 ##
+####                                                                                       ####
+###############################################################################################
+###  ####                                                                             ####  ###
+  ####  ###                                                                         ###  ####
+        ##                                                                           ##
+  #   ###                                                                             ###   #
+   ####                                                                                 ####
+
+# Print version info
+STARTMSG = "\n#### Csillész II Problem Solver Program {0} ####\n####         Developed by Balázs Pál.         ####\n\n"
+
+def main():
+
+    print(STARTMSG.format(ActualVersion))
+
+    while(True):
+
+        print(">> MAIN MENU <<")
+        print("(1) Coordinate System Conversion")
+        print("(2) Geographical Distances")
+        print("(3) Local Mean Sidereal Time")
+        print("(4) Datetimes of Twilights")
+        print("(5) Solve Astronomical Triangles")
+        print("(6) Plot Sun's Path on Sundial")
+        print("(7) Plot Sun's Analemma")
+        print("(H) Solve End-Semester Homework")
+        print("(Q) Quit Program\n")
+
+        # Choose mode by user input
+        mode = input("> Choose a mode and press enter...: ")
+        print('\n\n')
+
+        #    _____                    _    _____              _____                 
+        #   / ____|                  | |  / ____|            / ____|                
+        #  | |     ___   ___  _ __ __| | | (___  _   _ ___  | |     ___  _ ____   __
+        #  | |    / _ \ / _ \| '__/ _` |  \___ \| | | / __| | |    / _ \| '_ \ \ / /
+        #  | |___| (_) | (_) | | | (_| |  ____) | |_| \__ \ | |___| (_) | | | \ V / 
+        #   \_____\___/ \___/|_|  \__,_| |_____/ \__, |___/  \_____\___/|_| |_|\_/  
+        #                                         __/ |                             
+        #                                        |___/                              
+        # COORDINATE SYSTEM CONVERSION
+        if(mode == '1'):
+            while(True):
+                print(">> Coordinate System Conversion")
+                print(">> Please choose which coordinate system conversion you'd like to make!")
+                print("(1) Horizontal to Equatorial I")
+                print("(2) Horizontal to Equatorial II")
+                print("(3) Equatorial I to Horizontal")
+                print("(4) Equatorial I to Equatorial II")
+                print("(5) Equatorial II to Equatorial I")
+                print("(6) Equatorial II to Horizontal")
+                print("(Q) Quit to Main Menu\n")
+                CoordMode = input("> Choose a number and press enter...:")
+
+                print('\n')
+
+                #  __  
+                # /  | 
+                # `| | 
+                #  | | 
+                # _| |__
+                # \___(_)
+                # 1. Horizontal to Equatorial I Coordinate System
+                if(CoordMode == '1'):
+                    print(">> Conversion from Horizontal to Equatorial I Coordinate System")
+                    print(">> Give Parameters!")
+
+                    print(">> Would you like to give Geographical Coordinates by yourself,\n>> or would like to choose a predefined Location's Coordinates?")
+                    print(">> Write \'1\' for User defined Coordinates, and write \'2\' for Predefined Locations' Coordinates!")
+
+                    HorToEquILocationChoose = input(">> (1) User Defined, (2) Predefined: ")
+
+                    while(True):
+                        if(HorToEquILocationChoose == '1'):
+                            print(">> HINT: You can write Latitude as a Decimal Fraction. For this you need to\n>> Write Hours as a float-type value, then you can\n>> Press Enter for both Minutes and Seconds.")
+                            LatitudeHours = float(input("> Latitude (φ) Hours: ") or "0")
+                            LatitudeMinutes = float(input("> Latitude (φ) Minutes: ") or "0")
+                            LatitudeSeconds = float(input("> Latitude (φ) Seconds: ") or "0")
+                            Latitude = LatitudeHours + LatitudeMinutes/60 + LatitudeSeconds/3600
+                            break
+
+                        elif(HorToEquILocationChoose == '2'):
+                            while(True):
+                                Location = input("> Location's name (type \'H\' for Help): ")
+
+                                if(Location == "Help" or Location == "help" or Location == "H" or Location == "h"):
+                                    print("\n>> Predefined Locations you can choose from:")
+                                    for keys in LocationDict.items():
+                                        print(keys)
+                                    print('\n')
+
+                                else:
+                                    try:
+                                        Latitude = LocationDict[Location][0]
+
+                                    except KeyError:
+                                        print(">>>> ERROR: The Location, named \"" + Location + "\" is not in the Database!")
+                                        print(">>>> Type \"Help\" to list Available Cities in Database!")
+
+                                    else:
+                                        break
+
+                            break
+
+                        else:
+                            print(">>>> ERROR: Invalid option! Try Again!")
+
+                    Altitude = float(input("> Altitude (m): "))
+                    Azimuth = float(input("> Azimuth (A): "))
+
+                    print("Is Local Mean Sidereal Time given?")
+                    while(True):
+                        HorToEquIChoose = input("Write \'Y\' or \'N\' (Yes or No)")
+                        if(HorToEquIChoose == 'Y' or HorToEquIChoose == 'y' or HorToEquIChoose == 'Yes' or HorToEquIChoose == 'yes' or HorToEquIChoose == 'YEs' or HorToEquIChoose == 'yEs' or HorToEquIChoose == 'yeS' or HorToEquIChoose == 'YeS' or HorToEquIChoose == 'yES'):
+                            print(">> HINT: You can write LMST as a Decimal Fraction. For this you need to\n>> Write Hours as a float-type value, then you can\n>> Press Enter for both Minutes and Seconds.")
+                            LocalSiderealTimeHours = float(input("> Local Mean Sidereal Time (S) Hours: ") or "0")
+                            LocalSiderealTimeMinutes = float(input("> Local Mean Sidereal Time (S) Minutes: ") or "0")
+                            LocalSiderealTimeSeconds = float(input("> Local Mean Sidereal Time (S) Seconds: ") or "0")
+                            LocalSiderealTime = LocalSiderealTimeHours + LocalSiderealTimeMinutes/60 + LocalSiderealTimeSeconds/3600
+                            break
+
+                        elif(HorToEquIChoose == 'N' or HorToEquIChoose == 'n' or HorToEquIChoose == 'No' or HorToEquIChoose == 'no' or HorToEquIChoose == 'nO'):
+                            LocalSiderealTime = None
+                            break
+
+                        else:
+                            print(">>>> ERROR: Invalid option! Try Again!")
+
+                    # Used Formulas:
+                    # sin(δ) = sin(m) * sin(φ) + cos(m) * cos(φ) * cos(A)
+                    # sin(H) = - sin(A) * cos(m) / cos(δ)
+                    # α = S – t
+                    Declination, LocalHourAngle, RightAscension = HorToEquI(Latitude, Altitude, Azimuth, LocalSiderealTime)
+
+                    DeclinationHours = int(Declination)
+                    DeclinationMinutes = int((Declination - DeclinationHours) * 60)
+                    DeclinationSeconds = int((((Declination - DeclinationHours) * 60) - DeclinationMinutes) * 60)
+
+                    LocalHourAngleHours = int(LocalHourAngle)
+                    LocalHourAngleMinutes = int((LocalHourAngle - LocalHourAngleHours) * 60)
+                    LocalHourAngleSeconds = int((((LocalHourAngle - LocalHourAngleHours) * 60) - LocalHourAngleMinutes) * 60)
+
+                    # Print Results
+                    print("\n> Calculated parameters in Equatorial I Coord. Sys.:")
+
+                    declinmsg = "- Declination (δ): {0}° {1}\' {2}\""
+                    hourangmsg = "- Local Hour Angle (t): {0}h {1}m {2}s"
+                    print(declinmsg.format(DeclinationHours, DeclinationMinutes, DeclinationSeconds))
+                    print(hourangmsg.format(LocalHourAngleHours, LocalHourAngleMinutes, LocalHourAngleSeconds))
+
+                    if(LocalSiderealTime != None):
+
+                        RightAscensionHours = int(RightAscension)
+                        RightAscensionMinutes = int((RightAscension - RightAscensionHours) * 60)
+                        RightAscensionSeconds = int((((RightAscension - RightAscensionHours) * 60) - RightAscensionMinutes) * 60)
+
+                        RAmsg = "- Right Ascension (α): {0}h {1}m {2}s"
+                        print(RAmsg.format(RightAscensionHours, RightAscensionMinutes, RightAscensionSeconds))
+
+                    print('\n')
+
+                #  _____   
+                # / __  \  
+                # `' / /'  
+                #   / /    
+                # ./ /____ 
+                # \_____(_)
+                # 2. Horizontal to Equatorial II Coordinate System
+                elif(CoordMode == '2'):
+                    print(">> Conversion from Horizontal to Equatorial II Coordinate System")
+                    print(">> Give Parameters!")
+
+                    print(">> Would you like to give Geographical Coordinates by yourself,\n>> or would like to choose a predefined Location's Coordinates?")
+                    print(">> Write \'1\' for User defined Coordinates, and write \'2\' for Predefined Locations' Coordinates!")
+
+                    HorToEquIILocationChoose = input(">> (1) User Defined, (2) Predefined: ")
+
+                    while(True):
+                        if(HorToEquIILocationChoose == '1'):
+                            print(">> HINT: You can write Latitude as a Decimal Fraction. For this you need to\n>> Write Hours as a float-type value, then you can\n>> Press Enter for both Minutes and Seconds.")
+                            LatitudeHours = float(input("> Latitude (φ) Hours: ") or "0")
+                            LatitudeMinutes = float(input("> Latitude (φ) Minutes: ") or "0")
+                            LatitudeSeconds = float(input("> Latitude (φ) Seconds: ") or "0")
+                            Latitude = LatitudeHours + LatitudeMinutes/60 + LatitudeSeconds/3600
+                            break
+
+                        elif(HorToEquIILocationChoose == '2'):
+                            while(True):
+                                Location = input("> Location's name (type \'H\' for Help): ")
+
+                                if(Location == "Help" or Location == "help" or Location == "H" or Location == "h"):
+                                    print("\n>> Predefined Locations you can choose from:")
+                                    for keys in LocationDict.items():
+                                        print(keys)
+                                    print('\n')
+
+                                else:
+                                    try:
+                                        Latitude = LocationDict[Location][0]
+
+                                    except KeyError:
+                                        print(">>>> ERROR: The Location, named \"" + Location + "\" is not in the Database!")
+                                        print(">>>> Type \"Help\" to list Available Cities in Database!")
+
+                                    else:
+                                        break
+
+                            break
+
+                        else:
+                            print(">>>> ERROR: Invalid option! Try Again!")
+
+                    Altitude = float(input("> Altitude (m): "))
+                    Azimuth = float(input("> Azimuth (A): "))
+
+                    print(">> HINT: You can write LMST as a Decimal Fraction. For this you need to\n>> Write Hours as a float-type value, then you can\n>> Press Enter for both Minutes and Seconds.")
+                    LocalSiderealTimeHours = float(input("> Local Mean Sidereal Time (S) Hours: ") or "0")
+                    LocalSiderealTimeMinutes = float(input("> Local Mean Sidereal Time (S) Minutes: ") or "0")
+                    LocalSiderealTimeSeconds = float(input("> Local Mean Sidereal Time (S) Seconds: ") or "0")
+                    LocalSiderealTime = LocalSiderealTimeHours + LocalSiderealTimeMinutes/60 + LocalSiderealTimeSeconds/3600
+
+                    Declination, RightAscension, LocalSiderealTime = HorToEquII(Latitude, Altitude, Azimuth, LocalSiderealTime)
+
+                    DeclinationHours = int(Declination)
+                    DeclinationMinutes = int((Declination - DeclinationHours) * 60)
+                    DeclinationSeconds = int((((Declination - DeclinationHours) * 60) - DeclinationMinutes) * 60)
+
+                    RightAscensionHours = int(RightAscension)
+                    RightAscensionMinutes = int((RightAscension - RightAscensionHours) * 60)
+                    RightAscensionSeconds = int((((RightAscension - RightAscensionHours) * 60) - RightAscensionMinutes) * 60)
+
+                    LocalSiderealTimeHours = int(LocalSiderealTime)
+                    LocalSiderealTimeMinutes = int((LocalSiderealTime - LocalSiderealTimeHours) * 60)
+                    LocalSiderealTimeSeconds = int((((LocalSiderealTime - LocalSiderealTimeHours) * 60) - LocalSiderealTimeMinutes) * 60)
+
+
+                    # Print Results
+                    print("\n> Calculated Parameters in Equatorial II Coord. Sys.:")
+
+                    declinmsg = "- Declination (δ): {0}° {1}\' {2}\""
+                    RAmsg = "- Right Ascension (α): {0}h {1}m {2}s"
+                    sidermsg = "- Local Mean Sidereal Time (S): {0}:{1}:{2}\n"
+                    print(declinmsg.format(DeclinationHours, DeclinationMinutes, DeclinationSeconds))
+                    print(RAmsg.format(RightAscensionHours, RightAscensionMinutes, RightAscensionSeconds))
+                    print(sidermsg.format(LocalSiderealTimeHours, LocalSiderealTimeMinutes, LocalSiderealTimeSeconds))
+                    print('\n')
+
+                #  _____  
+                # |____ | 
+                #     / / 
+                #     \ \ 
+                # .___/ / 
+                # \____(_)
+                # 3. Equatorial I to Horizontal Coordinate System
+                elif(CoordMode == '3'):
+                    print(">> Conversion from Equatorial I to Horizontal Coordinate System")
+                    print(">> Give Parameters!\n")
+
+                    while(True):
+                        print(">>> LOCATION")
+                        print(">> Would you like to give Geographical Coordinates by yourself,\n>> Or would like to choose a predefined Location's Coordinates?")
+                        print(">> Write \'1\' for User defined Coordinates, and\n>> Write \'2\' for Predefined Locations' Coordinates!")
+
+                        EquIToHorLocationChoose = input(">> (1) User Defined, (2) Predefined: ")
+
+                        if(EquIToHorLocationChoose == '1'):
+                            print(">> HINT: You can write Latitude as a Decimal Fraction. For this you need to\n>> Write Hours as a float-type value, then you can\n>> Press Enter for both Minutes and Seconds.")
+                            LatitudeHours = float(input("> Latitude (φ) Hours: ") or "0")
+                            LatitudeMinutes = float(input("> Latitude (φ) Minutes: ") or "0")
+                            LatitudeSeconds = float(input("> Latitude (φ) Seconds: ") or "0")
+                            Latitude = LatitudeHours + LatitudeMinutes/60 + LatitudeSeconds/3600
+                            break
+
+                        elif(EquIToHorLocationChoose == '2'):
+                            while(True):
+                                Location = input("> Location's name (type \'H\' for Help): ")
+
+                                if(Location == "Help" or Location == "help" or Location == "H" or Location == "h"):
+                                    print("\n>> Predefined Locations you can choose from:")
+                                    for keys in LocationDict.items():
+                                        print(keys)
+                                    print('\n')
+
+                                else:
+                                    try:
+                                        Latitude = LocationDict[Location][0]
+
+                                    except KeyError:
+                                        print(">>>> ERROR: The Location, named \"" + Location + "\" is not in the Database!")
+                                        print(">>>> Type \"Help\" to list Available Cities in Database!")
+
+                                    else:
+                                        break
+
+                            break
+
+                        else:
+                            print(">>>> ERROR: Invalid option! Try Again!")
+
+                    while(True):
+                        print("\n>>> STELLAR OBJECT")
+                        print(">> Would you like to give the stellar object's Coordinates by yourself,\n>> Or would like to choose a Predefined Object's Coordinates?")
+                        print(">> Write \'1\' for User defined Coordinates, and\n>> Write \'2\' for a Predefined Stellar Object's Coordinates!")
+
+                        EquIToHorStellarChoose = input(">> (1) User Defined, (2) Predefined: ")
+
+                        if(EquIToHorStellarChoose == '1'):
+                            print("\n>> Which Parameter Is given?")
+                            print(">> Declination is essential for calculation Horizontal Coordinates!\n>> Right Ascension only, isn't enough for calculating these parameters!")
+                            RAorDecEquIToHorChoose = input(">> Only Declination (write \'D\'), Or both of\n>> Right Ascension and Declination (write \'B\')?: ")
+
+                            if(RAorDecEquIToHorChoose == 'D' or RAorDecEquIToHorChoose == 'd'):
+                                RightAscension = None
+
+                                print("\n>> HINT: You can write RA as a Decimal Fraction. For this you need to\n>> Write Hours as a float-type value, then you can\n>> Press Enter for both Minutes and Seconds.")
+                                DeclinationHours = float(input("\n> Declination (δ) Hours: ") or "0")
+                                DeclinationMinutes = float(input("> Declination (δ) Minutes: ") or "0")
+                                DeclinationSeconds = float(input("> Declination (δ) Seconds: ") or "0")
+                                Declination = DeclinationHours + DeclinationMinutes/60 + DeclinationSeconds/3600
+                                break
+
+                            elif(RAorDecEquIToHorChoose == 'B' or RAorDecEquIToHorChoose == 'b'):
+                                print("\n>> HINT: You can write RA and Declination as a Decimal Fraction.\n>> For this you need to write Hours as a float-type value, then\n>> You can Press Enter for both Minutes and Seconds.")
+                                RightAscensionHours = float(input("\n> Right Ascension (α) Hours: ") or "0")
+                                RightAscensionMinutes = float(input("> Right Ascension (α) Minutes: ") or "0")
+                                RightAscensionSeconds = float(input("> Right Ascension (α) Seconds: ") or "0")
+                                RightAscension = RightAscensionHours + RightAscensionMinutes/60 + RightAscensionSeconds/3600
+
+                                DeclinationHours = float(input("\n> Declination (δ) Hours: ") or "0")
+                                DeclinationMinutes = float(input("> Declination (δ) Minutes: ") or "0")
+                                DeclinationSeconds = float(input("> Declination (δ) Seconds: ") or "0")
+                                Declination = DeclinationHours + DeclinationMinutes/60 + DeclinationSeconds/3600
+                                break
+
+                            else:
+                                print(">>>> ERROR: Invalid option! Try Again! Write \'D\' or \'B\'!")
+
+                        elif(EquIToHorStellarChoose == '2'):
+                            while(True):
+                                StellarObject = input("> Stellar object's name (type \'H\' for Help): ")
+
+                                if(StellarObject == "Help" or StellarObject == "help" or StellarObject == "H" or StellarObject == "h"):
+                                    print("\n>> Predefined Objects you can choose from:")
+                                    for keys in StellarDict.items():
+                                        print(keys)
+                                    print('\n')
+
+                                else:
+                                    try:
+                                        TestVariable = StellarDict[StellarObject][0]
+                                        del TestVariable
+
+                                    except KeyError:
+                                        print(">>>> ERROR: The Stellar Object, named \"" + StellarObject + "\" is not in the Database!")
+                                        print(">>>> Type \"Help\" to list Available Stellar Objects in Database!")
+
+                                    else:
+                                        print(">> Which Parameter Is given?")
+                                        print(">> Declination is essential for calculation Horizontal Coordinates!\n>> Right Ascension only, isn't enough for calculating these parameters!")
+                                        RAorDecEquIToHorChoose = input(">> Only Declination (write \'D\'), Or both of\n>> Right Ascension and Declination (write \'B\')?: ")
+
+                                        if(RAorDecEquIToHorChoose == 'D' or RAorDecEquIToHorChoose == 'd'):
+                                            RightAscension = None
+                                            Declination = StellarDict[StellarObject][1]
+                                            break
+
+                                        elif(RAorDecEquIToHorChoose == 'B' or RAorDecEquIToHorChoose == 'b'):
+                                            RightAscension = StellarDict[StellarObject][0]
+                                            Declination = StellarDict[StellarObject][1]
+                                            break
+
+                                        else:
+                                            print(">>>> ERROR: Invalid option! Try Again! Write \'D\' or \'B\'!")
+                            break
+
+                        else:
+                            print(">>>> ERROR: Invalid option! Try Again!")
+
+                    if(RightAscension != None and Declination != None):
+                        while(True):
+                            print("\n>> Is Local Mean Sidereal Time (S) given?")
+                            EquIToHorChoose1 = input(">> Write \'Y\' or \'N\' (Yes or No): ")
+
+                            if(EquIToHorChoose1 == 'Y' or EquIToHorChoose1 == 'y' or EquIToHorChoose1 == 'Yes' or EquIToHorChoose1 == 'yes' or EquIToHorChoose1 == 'YEs' or EquIToHorChoose1 == 'yEs' or EquIToHorChoose1 == 'yeS' or EquIToHorChoose1 == 'YeS' or EquIToHorChoose1 == 'yES'):
+                                print("\n>> HINT: You can write LMST as a Decimal Fraction. For this you need to\n>> Write Hours as a float-type value, then you can\n>> Press Enter for both Minutes and Seconds.")
+                                LocalSiderealTimeHours = float(input("\n> Local Mean Sidereal Time (S) Hours: ") or "0")
+                                LocalSiderealTimeMinutes = float(input("> Local Mean Sidereal Time (S) Minutes: ") or "0")
+                                LocalSiderealTimeSeconds = float(input("> Local Mean Sidereal Time (S) Seconds: ") or "0")
+                                LocalSiderealTime = LocalSiderealTimeHours + LocalSiderealTimeMinutes/60 + LocalSiderealTimeSeconds/3600
+
+                                Altitude = None
+                                break
+
+                            elif(EquIToHorChoose1 == 'N' or EquIToHorChoose1 == 'n' or EquIToHorChoose1 == 'No' or EquIToHorChoose1 == 'no' or EquIToHorChoose1 == 'nO'):
+                                LocalSiderealTime = None
+
+                                print("\n>> Is Local Hour Angle given?")
+                                EquIToHorChoose2 = input(">> Write \'Y\' or \'N\' (Yes or No): ")
+
+                                if(EquIToHorChoose2 == 'Y' or EquIToHorChoose2 == 'y' or EquIToHorChoose2 == 'Yes' or EquIToHorChoose2 == 'yes' or EquIToHorChoose2 == 'YEs' or EquIToHorChoose2 == 'yEs' or EquIToHorChoose2 == 'yeS' or EquIToHorChoose2 == 'YeS' or EquIToHorChoose2 == 'yES'):
+                                    print("\n>> HINT: You can write LHA as a Decimal Fraction. For this you need to\n>> Write Hours as a float-type value, then you can\n>> Press Enter for both Minutes and Seconds.")
+                                    LocalHourAngleHours = float(input("\n> Local Hour Angle (t) Hours: ") or "0")
+                                    LocalHourAngleMinutes = float(input("> Local Hour Angle (t) Minutes: ") or "0")
+                                    LocalHourAngleSeconds = float(input("> Local Hour Angle (t) Seconds: ") or "0")
+                                    LocalHourAngle = LocalHourAngleHours + LocalHourAngleMinutes/60 + LocalHourAngleSeconds/3600
+
+                                    Altitude = None
+                                    break
+
+                                elif(EquIToHorChoose2 == 'N' or EquIToHorChoose2 == 'n' or EquIToHorChoose2 == 'No' or EquIToHorChoose2 == 'no' or EquIToHorChoose2 == 'nO'):
+                                    LocalHourAngle = None
+                                    print("\n>> From the given data, you can calculate Azimuth (A),\n>> If Altitude (m) is given.")
+
+                                    Azimuth == None
+                                    AltitudeHours = float(input("> Altitude (m) Hours: ") or "0")
+                                    AltitudeMinutes = float(input("> Altitude (m) Minutes: ") or "0")
+                                    AltitudeSeconds = float(input("> Altitude (m) Seconds: ") or "0")
+                                    ALtitude = AltitudeHours + AltitudeMinutes/60 + AltitudeSeconds/3600
+                                    break
+
+                    elif(Declination != None and RightAscension == None):
+                        while(True):
+                            print("\n>> Is Local Hour Angle (t) given?")
+                            EquIToHorChooseD = input(">> Write \'Y\' or \'N\' (Yes or No): ")
+
+                            if(EquIToHorChooseD == 'Y' or EquIToHorChooseD == 'y' or EquIToHorChooseD == 'Yes' or EquIToHorChooseD == 'yes' or EquIToHorChooseD == 'YEs' or EquIToHorChooseD == 'yEs' or EquIToHorChooseD == 'yeS' or EquIToHorChooseD == 'YeS' or EquIToHorChooseD == 'yES'):
+                                print(">> HINT: You can write LHA as a Decimal Fraction. For this you need to\n>> Write Hours as a float-type value, then you can\n>> Press Enter for both Minutes and Seconds.")
+                                LocalHourAngleHours = float(input("> Local Hour Angle (t) Hours: ") or "0")
+                                LocalHourAngleMinutes = float(input("> Local Hour Angle (t) Minutes: ") or "0")
+                                LocalHourAngleSeconds = float(input("> Local Hour Angle (t) Seconds: ") or "0")
+                                LocalHourAngle = LocalHourAngleHours + LocalHourAngleMinutes/60 + LocalHourAngleSeconds/3600
+                                break
+
+                            elif(EquIToHorChooseD == 'N' or EquIToHorChooseD == 'n' or EquIToHorChooseD == 'No' or EquIToHorChooseD == 'no' or EquIToHorChooseD == 'nO'):
+                                LocalHourAngle = None
+                                print("\n>> From the given data, you can calculate Azimuth (A),\n>> If Altitude (m) is given.")
+                                print(">> HINT: You can write Altitude as a Decimal Fraction. For this you need to\n>> Write Hours as a float-type value, then you can\n>> Press Enter for both Minutes and Seconds.")
+                                Azimuth == None
+
+                                AltitudeHours = float(input("> Altitude (m) Hours: ") or "0")
+                                AltitudeMinutes = float(input("> Altitude (m) Minutes: ") or "0")
+                                AltitudeSeconds = float(input("> Altitude (m) Seconds: ") or "0")
+                                ALtitude = AltitudeHours + AltitudeMinutes/60 + AltitudeSeconds/3600
+                                break
+
+                            else:
+                                print(">>>> ERROR: Invalid option! Try Again!")
+
+                    # Starting parameters could be:
+                    # 1. Latitude, RightAscension, Declination, LocalSiderealTime   # φ,α,δ,S:  S,α -> t; t -> H; H,δ,φ -> m; H,δ,m -> A    # Output: A,m
+                    # 2. Latitude, RightAscension, Declination, LocalHourAngle      # φ,α,δ,t:  t -> H; H,δ,φ -> m; H,δ,m -> A              # Output: A,m
+                    # 3. Latitude, RightAscension, Declination, Azimuth             # φ,α,δ,A:  Not Enough Parameters!                      # Output: None
+                    # 4. Latitude, RightAscension, Declination, Altitude            # φ,α,δ,m:  m,δ,φ -> H; H,δ,m -> A                      # Output: A from m
+                    # 5. Latitude, RightAscension, LocalSiderealTime                # φ,α,S:    Not Enough Parameters!                      # Output: None
+                    # 6. Latitude, RightAscension, LocalHourAngle                   # φ,α,t:    Not Enough Parameters!                      # Output: None
+                    # 7. Latitude, RightAscension, Azimuth                          # φ,α,A:    Not Enough Parameters!                      # Output: None
+                    # 8. Latitude, RightAscension, Altitude                         # φ,α,m:    Not Enough Parameters!                      # Output: None
+                    # 9. Latitude, Declination, LocalSiderealTime                   # φ,δ,S:    Not Enough Parameters!                      # Output: None
+                    # 10. Latitude, Declination, LocalHourAngle                     # φ,δ,t:    t -> H; H,δ,φ -> m; H,δ,m -> A              # Output: A,m
+                    # 11. Latitude, Declination, Azimuth                            # φ,δ,A:    Not Enough Parameters!                      # Output: None
+                    # 12. Latitude, Declination, Altitude                           # φ,δ,m:    m,δ,φ -> H; H,δ,m -> A                      # Output: A from m
+                    # !!!! Now only those could be selected, which has any kind of output !!!!
+
+
+                    # Used formulas:
+                    # t = S - α
+                    # sin(m) = sin(δ) * sin(φ) + cos(δ) * cos(φ) * cos(H)
+                    if(LocalSiderealTime != None or LocalHourAngle != None):
+
+                        Altitude, Azimuth = EquIToHor(Latitude, RightAscension, Declination, Altitude, LocalSiderealTime, LocalHourAngle)
+
+                        # Print Results
+                        print("\n> Calculated Parameters in Horizontal Coord. Sys.:")
+
+                        azimmsg = "- Azimuth (A):  {0}°"
+                        altitmsg = "- Altitude (m): {0}°"
+                        print(azimmsg.format(Azimuth))
+                        print(altitmsg.format(Altitude))
+                        print('\n')
+
+                    # Used formulas:
+                    # cos(H) = (sin(m) - sin(δ) * sin(φ)) / cos(δ) * cos(φ)
+                    # sin(A) = - sin(H) * cos(δ) / cos(m)
+                    elif(Altitude != None):
+                        Altitude, Azimuth1, Azimuth2, H_dil = EquIToHor(Latitude, RightAscension, Declination, Altitude, LocalSiderealTime, LocalHourAngle)
+
+                        # Print Results
+                        print(">> Available Data are only suited for Calculating Rising/Setting Altitudes!")
+                        print("\n> Calculated Parameter of Rising/Setting Object in Horizontal Coord. Sys.:")
+
+                        azimmsg = "- Rising and Setting Azimuths (A) are:\n- {0}° and {1}°"
+                        print(azimmsg.format(Azimuth1, Azimuth2))
+                        print('\n')
+
+                #    ___   
+                #   /   |  
+                #  / /| |  
+                # / /_| |  
+                # \___  |_ 
+                #     |_(_)
+                # 4. Equatorial I to Equatorial II Coordinate System
+                elif(CoordMode == '4'):
+                    print(">> Conversion from Equatorial I to Equatorial II Coordinate System")
+                    print(">> Give Parameters!")
+
+                    print(">> Would you like to give the stellar object's Coordinates by yourself,\n>> Or would like to choose a Predefined Object's Coordinates?")
+                    print(">> Write \'1\' for User defined Coordinates, and\n>> Write \'2\' for a Predefined Stellar Object's Coordinates!")
+
+                    EquIToEquIIStellarChoose = input(">> (1) User Defined, (2) Predefined: ")
+
+                    while(True):
+                        if(EquIToEquIIStellarChoose == '1'):
+                            print(">> HINT: You can write RA as a Decimal Fraction. For this you need to\n>> Write Hours as a float-type value, and type 0\n>> For both Minutes and Seconds.")
+                            RightAscensionHours = float(input("> Right Ascension (α) Hours: ") or "0")
+                            RightAscensionMinutes = float(input("> Right Ascension (α) Minutes: ") or "0")
+                            RightAscensionSeconds = float(input("> Right Ascension (α) Seconds: ") or "0")
+                            RightAscension = RightAscensionHours + RightAscensionMinutes/60 + RightAscensionSeconds/3600
+
+                            print(">> Is Declination given?")
+                            while(True):
+                                EquIToEquIIChoose = input(">> Write \'Y\' or \'N\' (Yes or No): ")
+
+                                if(EquIToEquIIChoose == 'Y' or EquIToEquIIChoose == 'y' or EquIToEquIIChoose == 'Yes' or EquIToEquIIChoose == 'yes' or EquIToEquIIChoose == 'YEs' or EquIToEquIIChoose == 'yEs' or EquIToEquIIChoose == 'yeS' or EquIToEquIIChoose == 'YeS' or EquIToEquIIChoose == 'yES'):
+                                    Declination = float(input("> Declination (δ): "))
+                                    break
+
+                                elif(EquIToEquIIChoose == 'N' or EquIToEquIIChoose == 'n' or EquIToEquIIChoose == 'No' or EquIToEquIIChoose == 'no' or EquIToEquIIChoose == 'nO'):
+                                    Declination = None
+
+                                else:
+                                    print(">>>> ERROR: Invalid option! Try Again!")
+
+                        elif(EquIToEquIIStellarChoose == '2'):
+                            while(True):
+                                StellarObject = input("> Stellar object's name (type \'H\' for Help): ")
+
+                                if(StellarObject == "Help" or StellarObject == "help" or StellarObject == "H" or StellarObject == "h"):
+                                    print("\n>> Predefined Objects you can choose from:")
+                                    for keys in StellarDict.items():
+                                        print(keys)
+                                    print('\n')
+
+                                else:
+                                    try:
+                                        TestVariable = StellarDict[StellarObject][0]
+                                        del TestVariable
+
+                                    except KeyError:
+                                        print(">>>> ERROR: The Stellar Object, named \"" + StellarObject + "\" is not in the Database!")
+                                        print(">>>> Type \"Help\" to list Available Stellar Objects in Database!")
+
+                                    else:
+                                        RightAscension = StellarDict[StellarObject][0]
+
+                                        print(">> Is Declination given?")
+                                        while(True):
+                                            EquIToEquIIChoose = input(">> Write \'Y\' or \'N\' (Yes or No): ")
+
+                                            if(EquIToEquIIChoose == 'Y' or EquIToEquIIChoose == 'y' or EquIToEquIIChoose == 'Yes' or EquIToEquIIChoose == 'yes' or EquIToEquIIChoose == 'YEs' or EquIToEquIIChoose == 'yEs' or EquIToEquIIChoose == 'yeS' or EquIToEquIIChoose == 'YeS' or EquIToEquIIChoose == 'yES'):
+                                                Declination = StellarDict[StellarObject][1]
+                                                break
+
+                                            elif(EquIToEquIIChoose == 'N' or EquIToEquIIChoose == 'n' or EquIToEquIIChoose == 'No' or EquIToEquIIChoose == 'no' or EquIToEquIIChoose == 'nO'):
+                                                Declination = None
+
+                                            else:
+                                                print(">>>> ERROR: Invalid option! Try Again!")
+
+                            break
+
+                        else:
+                            print(">>>> ERROR: Invalid option! Try Again!")
+
+                    print(">> You should input LHA (t) manually!")
+                    print(">> HINT: You can write LHA as a Decimal Fraction. For this you need to\n>> Write Hours as a float-type value, then you can\n>> Press Enter for both Minutes and Seconds.")
+                    LocalHourAngleHours = float(input("> Local Hour Angle (t) Hours: ") or "0")
+                    LocalHourAngleMinutes = float(input("> Local Hour Angle (t) Minutes: ") or "0")
+                    LocalHourAngleSeconds = float(input("> Local Hour Angle (t) Seconds: ") or "0")
+                    LocalHourAngle = LocalHourAngleHours + LocalHourAngleMinutes/60 + LocalHourAngleSeconds/3600
+
+                    LocalSiderealTime = EquIToEquII(RightAscension, LocalHourAngle)
+
+                    LocalSiderealTimeHours = int(LocalSiderealTime)
+                    LocalSiderealTimeMinutes = int((LocalSiderealTime - LocalSiderealTimeHours) * 60)
+                    LocalSiderealTimeSeconds = int((((LocalSiderealTime - LocalSiderealTimeHours) * 60) - LocalSiderealTimeMinutes) * 60)
+
+                    # Print Results
+                    print("\n> Calculated Parameters in Equatorial II Coord. Sys.:")
+
+                    sidermsg = "- Local Mean Sidereal Time (S): {0}:{1}:{2}"
+                    print(sidermsg.format(LocalSiderealTime))
+
+                    if(Declination != None):
+
+                        DeclinationHours = int(Declination)
+                        DeclinationMinutes = int((Declination - DeclinationHours) * 60)
+                        DeclinationSeconds = int((((Declination - DeclinationHours) * 60) - DeclinationMinutes) * 60)
+
+                        declinmsg = "- Declination (δ): {0}° {1}\' {2}\""
+                        print(declinmsg.format(Declination))
+
+                    else:
+                        print("- Declination is Unknown!")
+
+                    print('\n')
+
+                #  _____  
+                # |  ___| 
+                # |___ \  
+                #     \ \ 
+                # /\__/ / 
+                # \____(_)
+                # 5. Equatorial II to Equatorial I Coordinate System
+                elif(CoordMode == '5'):
+                    print(">> Conversion from Equatorial II to Equatorial I Coordinate System")
+                    print(">> Give Parameters!")
+
+                    print(">> You should input LMST (S) manually!")
+                    print(">> HINT: You can write LMST as a Decimal Fraction. For this you need to\n>> Write Hours as a float-type value, then you can\n>> Press Enter for both Minutes and Seconds.")
+                    LocalSiderealTimeHours = float(input("> Local Mean Sidereal Time (S) Hours: ") or "0")
+                    LocalSiderealTimeMinutes = float(input("> Local Mean Sidereal Time (S) Minutes: ") or "0")
+                    LocalSiderealTimeSeconds = float(input("> Local Mean Sidereal Time (S) Seconds: ") or "0")
+                    LocalSiderealTime = LocalSiderealTimeHours + LocalSiderealTimeMinutes/60 + LocalSiderealTimeSeconds/3600
+
+                    print(">> Is Declination given?")
+                    while(True):
+                        EquIIToEquIChoose = input(">> Write \'Y\' or \'N\' (Yes or No): ")
+
+                        if(EquIIToEquIChoose == 'Y' or EquIIToEquIChoose == 'y' or EquIIToEquIChoose == 'Yes' or EquIIToEquIChoose == 'yes' or EquIIToEquIChoose == 'YEs' or EquIIToEquIChoose == 'yEs' or EquIIToEquIChoose == 'yeS' or EquIIToEquIChoose == 'YeS' or EquIIToEquIChoose == 'yES'):
+                            Declination = float(input("> Declination (δ): "))
+                            break
+
+                        elif(EquIIToEquIChoose == 'N' or EquIIToEquIChoose == 'n' or EquIIToEquIChoose == 'No' or EquIIToEquIChoose == 'no' or EquIIToEquIChoose == 'nO'):
+                            Declination = None
+
+                        else:
+                            print(">>>> ERROR: Invalid option! Try Again!")
+
+                    while(True):
+                        print(">> Which essential Parameter Is given?")
+                        EquIIToEquIDecChoose = input(">> Right Ascension (write \'A\'), or Local Hour Angle in Hours (write \'T\')?: ")
+                        if(EquIIToEquIDecChoose == 'A' or EquIIToEquIDecChoose == 'a'):
+                            LocalHourAngle = None
+                            RightAscension = float(input("> Right Ascension (α): "))
+                            break
+
+                        elif(EquIIToEquIDecChoose == 'T' or EquIIToEquIDecChoose == 't'):
+                            print(">> HINT: You can write LHA as a Decimal Fraction. For this you need to\n>> Write Hours as a float-type value, then you can\n>> Press Enter for both Minutes and Seconds.")
+                            LocalHourAngleHours = float(input("> Local Hour Angle (t) Hours: ") or "0")
+                            LocalHourAngleMinutes = float(input("> Local Hour Angle (t) Minutes: ") or "0")
+                            LocalHourAngleSeconds = float(input("> Local Hour Angle (t) Seconds: ") or "0")
+                            LocalHourAngle = LocalHourAngleHours + LocalHourAngleMinutes/60 + LocalHourAngleSeconds/3600
+                            RightAscension = None
+                            break
+
+                        else:
+                            print(">>>> ERROR: Invalid option! Try Again! Write \'A\' or \'T\'!")
+
+                    LocalHourAngle, RightAscension = EquIIToEquI(LocalSiderealTime, RightAscension, LocalHourAngle)
+
+                    RightAscensionHours = int(RightAscension)
+                    RightAscensionMinutes = int((RightAscension - RightAscensionHours) * 60)
+                    RightAscensionSeconds = int((((RightAscension - RightAscensionHours) * 60) - RightAscensionMinutes) * 60)
+
+                    # Print Results
+                    print("\n> Calculated parameters in Equatorial I Coord. Sys.:")
+
+                    RAmsg = "- Right Ascension (α): {0}h {1}m {2}s"
+                    print(RAmsg.format(RightAscension))
+
+                    if(Declination != None):
+
+                        DeclinationHours = int(Declination)
+                        DeclinationMinutes = int((Declination - DeclinationHours) * 60)
+                        DeclinationSeconds = int((((Declination - DeclinationHours) * 60) - DeclinationMinutes) * 60)
+
+                        declinmsg = "- Declination (δ): {0}° {1}\' {2}\""
+                        print(declinmsg.format(Declination))
+
+                    else:
+                        print("Declination is Unknown!")
+
+                    print('\n')
+
+                    hourangmsg = "- Local Hour Angle (t): {0}h {1}m {2}s"
+                    print(hourangmsg.format(LocalHourAngle))
+
+                    print('\n')
+
+                #   ____   
+                #  / ___|  
+                # / /___   
+                # | ___ \  
+                # | \_/ |_ 
+                # \_____(_)
+                # 6. Equatorial II to Horizontal Coordinate System
+                elif(CoordMode == '6'):
+                    print(">> Conversion from Equatorial II to Horizontal Coordinate System")
+                    print(">> Give Parameters!")
+
+                    while(True):
+                        print(">>> LOCATION")
+                        print(">> Would you like to give Geographical Coordinates by yourself,\n>> Or would like to choose a predefined Location's Coordinates?")
+                        print(">> Write \'1\' for User defined Coordinates, and\n>> Write \'2\' for Predefined Locations' Coordinates!")
+
+                        EquIIToHorLocationChoose = input(">> (1) User Defined, (2) Predefined: ")
+
+                        if(EquIIToHorLocationChoose == '1'):
+                            print(">> HINT: You can write Latitude as a Decimal Fraction. For this you need to\n>> Write Hours as a float-type value, then you can\n>> Press Enter for both Minutes and Seconds.")
+                            LatitudeHours = float(input("> Latitude (φ) Hours: ") or "0")
+                            LatitudeMinutes = float(input("> Latitude (φ) Minutes: ") or "0")
+                            LatitudeSeconds = float(input("> Latitude (φ) Seconds: ") or "0")
+                            Latitude = LatitudeHours + LatitudeMinutes/60 + LatitudeSeconds/3600
+                            break
+
+                        elif(EquIIToHorLocationChoose == '2'):
+                            while(True):
+                                Location = input("> Location's name (type \'H\' for Help): ")
+
+                                if(Location == "Help" or Location == "help" or Location == "H" or Location == "h"):
+                                    print("\n>> Predefined Locations you can choose from:")
+                                    for keys in LocationDict.items():
+                                        print(keys)
+                                    print('\n')
+
+                                else:
+                                    try:
+                                        Latitude = LocationDict[Location][0]
+
+                                    except KeyError:
+                                        print(">>>> ERROR: The Location, named \"" + Location + "\" is not in the Database!")
+                                        print(">>>> Type \"Help\" to list Available Cities in Database!")
+
+                                    else:
+                                        break
+
+                            break
+
+                        else:
+                            print(">>>> ERROR: Invalid option! Try Again!")
+
+
+                    while(True):
+                        print("\n>>> STELLAR OBJECT")
+                        print(">> Would you like to give the stellar object's Coordinates by yourself,\n>> Or would like to choose a Predefined Object's Coordinates?")
+                        print(">> Write \'1\' for User defined Coordinates, and\n>> Write \'2\' for a Predefined Stellar Object's Coordinates!")
+
+                        EquIIToHorStellarChoose = input(">> (1) User Defined, (2) Predefined: ")
+
+                        if(EquIIToHorStellarChoose == '1'):
+
+                            print(">> Which essential Parameter Is given?")
+                            EquIIToEquIDecChoose = input(">> Right Ascension (write \'A\'), or Local Hour Angle in Hours (write \'T\')?: ")
+                            if(EquIIToEquIDecChoose == 'A' or EquIIToEquIDecChoose == 'a'):
+                                LocalHourAngle = None
+                                print(">> HINT: You can write RA as a Decimal Fraction. For this you need to\n>> Write Hours as a float-type value, then you can\n>> Press Enter for both Minutes and Seconds.")
+                                RightAscensionHours = float(input("> Right Ascension (α) Hours: ") or "0")
+                                RightAscensionMinutes = float(input("> Right Ascension (α) Minutes: ") or "0")
+                                RightAscensionSeconds = float(input("> Right Ascension (α) Seconds: ") or "0")
+                                RightAscension = RightAscensionHours + RightAscensionMinutes/60 + RightAscensionSeconds/3600
+                                break
+
+                            elif(EquIIToEquIDecChoose == 'T' or EquIIToEquIDecChoose == 't'):
+                                print(">> HINT: You can write LHA as a Decimal Fraction. For this you need to\n>> Write Hours as a float-type value, then you can\n>> Press Enter for both Minutes and Seconds.")
+                                LocalHourAngleHours = float(input("> Local Hour Angle (t) Hours: ") or "0")
+                                LocalHourAngleMinutes = float(input("> Local Hour Angle (t) Minutes: ") or "0")
+                                LocalHourAngleSeconds = float(input("> Local Hour Angle (t) Seconds: ") or "0")
+                                LocalHourAngle = LocalHourAngleHours + LocalHourAngleMinutes/60 + LocalHourAngleSeconds/3600
+                                RightAscension = None
+                                break
+
+                            else:
+                                print(">>>> ERROR: Invalid option! Try Again! Write \'A\' or \'T\'!")
+
+                        elif(EquIIToHorStellarChoose == '2'):
+                            while(True):
+                                StellarObject = input("> Stellar object's name (type \'H\' for Help): ")
+
+                                if(StellarObject == "Help" or StellarObject == "help" or StellarObject == "H" or StellarObject == "h"):
+                                    print("\n>> Predefined Objects you can choose from:")
+                                    for keys in StellarDict.items():
+                                        print(keys)
+                                    print('\n')
+
+                                else:
+                                    try:
+                                        TestVariable = StellarDict[StellarObject][0]
+                                        del TestVariable
+
+                                    except KeyError:
+                                        print(">>>> ERROR: The Stellar Object, named \"" + StellarObject + "\" is not in the Database!")
+                                        print(">>>> Type \"Help\" to list Available Stellar Objects in Database!")
+
+                                    else:
+                                        print(">> Which essential Parameter Is given?")
+                                        EquIIToEquIDecChoose = input(">> Right Ascension (write \'A\'), or Local Hour Angle in Hours (write \'T\')?: ")
+                                        if(EquIIToEquIDecChoose == 'A' or EquIIToEquIDecChoose == 'a'):
+                                            LocalHourAngle = None
+                                            RightAscension = StellarDict[StellarObject][0]
+                                            break
+
+                                        elif(EquIIToEquIDecChoose == 'T' or EquIIToEquIDecChoose == 't'):
+                                            print(">> You should input LHA (t) manually!")
+                                            print(">> HINT: You can write LHA as a Decimal Fraction. For this you need to\n>> Write Hours as a float-type value, then you can\n>> Press Enter for both Minutes and Seconds.")
+                                            LocalHourAngleHours = float(input("> Local Hour Angle (t) Hours: ") or "0")
+                                            LocalHourAngleMinutes = float(input("> Local Hour Angle (t) Minutes: ") or "0")
+                                            LocalHourAngleSeconds = float(input("> Local Hour Angle (t) Seconds: ") or "0")
+                                            LocalHourAngle = LocalHourAngleHours + LocalHourAngleMinutes/60 + LocalHourAngleSeconds/3600
+                                            RightAscension = None
+                                            break
+
+                                        else:
+                                            print(">>>> ERROR: Invalid option! Try Again! Write \'A\' or \'T\'!")
+
+                            break
+
+                        else:
+                            print(">>>> ERROR: Invalid option! Try Again!")
+
+                    print(">> You should input LMST (S) manually!")
+                    print(">> HINT: You can write LMST as a Decimal Fraction. For this you need to\n>> Write Hours as a float-type value, then you can\n>> Press Enter for both Minutes and Seconds.")
+                    LocalSiderealTimeHours = float(input("> Local Mean Sidereal Time (S) Hours: ") or "0")
+                    LocalSiderealTimeMinutes = float(input("> Local Mean Sidereal Time (S) Minutes: ") or "0")
+                    LocalSiderealTimeSeconds = float(input("> Local Mean Sidereal Time (S) Seconds: ") or "0")
+                    LocalSiderealTime = LocalSiderealTimeHours + LocalSiderealTimeMinutes/60 + LocalSiderealTimeSeconds/3600
+
+                    Altitude, Azimuth = EquIIToHor(Latitude, RightAscension, Declination, Altitude, Azimuth, LocalSiderealTime, LocalHourAngle)
+
+                    # Print Results
+                    print("> Calculated Parameters in Horizontal Coord. Sys.:")
+
+                    azimmsg = "- Azimuth (A):  {0}°"
+                    altitmsg = "- Altitude (m): {0}°"
+                    print(azimmsg.format(Azimuth))
+                    print(altitmsg.format(Altitude))
+                    print('\n')
+
+                elif(CoordMode == 'Q' or CoordMode == 'q'):
+                    break
+
+                else:
+                    print(">>>> ERROR: Invalid option! Try Again!\n")
+
+        #    _____                    _____  _     _      _____      _      
+        #   / ____|                  |  __ \(_)   | |    / ____|    | |     
+        #  | |  __  ___  ___   __ _  | |  | |_ ___| |_  | |     __ _| | ___ 
+        #  | | |_ |/ _ \/ _ \ / _` | | |  | | / __| __| | |    / _` | |/ __|
+        #  | |__| |  __/ (_) | (_| | | |__| | \__ \ |_  | |___| (_| | | (__ 
+        #   \_____|\___|\___/ \__, | |_____/|_|___/\__|  \_____\__,_|_|\___|
+        #                      __/ |                                        
+        #                     |___/                                         
+        # GEOGRAPHICAL DISTANCE CALCULATION
+        elif(mode == '2'):
+            while(True):
+                print(">> Geographical Distance Calculator\n")
+                print(">> Please choose a mode you'd like to use!")
+                print("(1) Positional Coordinates from User Input")
+                print("(2) Positional Coordinates of Predefined Locations")
+                print("(Q) Quit to Main Menu\n")
+
+                DistMode = input("> Choose a mode and press enter...: ")
+                print('\n')
+
+                if(DistMode == '1'):
+                    print(">> Calculate Distance from given Coordinates\n")
+                    print(">> Give Parameters!")
+                    Latitude1 = float(input("> Latitude #1 (φ1): "))
+                    Longitude1 = float(input("> Longitude #1 (λ1): "))
+                    Latitude2 = float(input("> Latitude #2 (φ2): "))
+                    Longitude2 = float(input("> Longitude #2 (λ2): "))
+
+                    Distance = GeogDistCalc(Latitude1, Latitude2, Longitude1, Longitude2)
+                    # Convert Distance to Km
+                    Distance = float(Distance / 1000)
+
+                    distmsg = "\n>>> The Geographical Distance Between\n>>> {0}°,{1}°\n>>> and\n>>> {2}°,{3}°\n>>> is\n>>> {4:.3f} km\n"
+                    print(distmsg.format(Latitude1,Longitude1,Latitude2,Longitude2, Distance))
+
+                elif(DistMode == '2'):
+                    print(">> Calculate Distance of Choosen Predefined Locations\n")
+                    print(">> Write the Names of Two Choosen Cities to the Input!")
+                    while(True):
+                        Location1 = input("> Location #1 (type \'H\' for Help): ")
+
+                        if(Location1 == "Help" or Location1 == "help" or Location1 == "H" or Location1 == "h"):
+                            print("\n>> Predefined Locations you can choose from:")
+                            for keys in LocationDict.items():
+                                print(keys)
+                            print('\n')
+
+                        else:
+                            try:
+                                Latitude1 = LocationDict[Location1][0]
+                                Longitude1 = LocationDict[Location1][1]
+
+                            except KeyError:
+                                print(">>>> ERROR: The Location, named \"" + Location1 + "\" is not in the Database!")
+                                print(">>>> Type \"Help\" to list Available Cities in Database!")
+
+                            else:
+                                break
+
+                    while(True):
+                        Location2 = input("> Location #2 (type \'H\' for Help): ")
+
+                        if(Location2 == "Help" or Location2 == "help" or Location2 == "H" or Location2 == "h"):
+                            print("\n>> Predefined Locations you can choose from:")
+                            for keys in LocationDict.items():
+                                print(keys)
+                            print('\n')
+
+                        else:
+                            try:
+                                Latitude2 = LocationDict[Location2][0]
+                                Longitude2 = LocationDict[Location2][1]
+
+                            except KeyError:
+                                print(">>>> ERROR: The Location, named \"" + Location2 + "\" is not in the Database!")
+                                print(">>>> Type \"Help\" to list Available Cities in Database!")
+
+                            else:
+                                break
+
+                    Distance = GeogDistLocationCalc(Latitude1, Latitude2, Longitude1, Longitude2)
+                    # Convert Distance to Km
+                    Distance = float(Distance / 1000)
+
+                    distmsg = "\n>>> The Geographical Distance Between\n>>> {0} and {1} is\n>>> {2:.3f} km\n"
+                    print(distmsg.format(Location1, Location2, Distance))
+
+                elif(DistMode == 'Q' or DistMode == 'q'):
+                    break
+
+                else:
+                    print(">>>> ERROR: Invalid option! Try Again!")
+
+        #   _      __  __  _____ _______    _____      _      
+        #  | |    |  \/  |/ ____|__   __|  / ____|    | |     
+        #  | |    | \  / | (___    | |    | |     __ _| | ___ 
+        #  | |    | |\/| |\___ \   | |    | |    / _` | |/ __|
+        #  | |____| |  | |____) |  | |    | |___| (_| | | (__ 
+        #  |______|_|  |_|_____/   |_|     \_____\__,_|_|\___|
+        # LOCAL MEAN SIDEREAL TIME CALCULATION
+        elif(mode == '3'):
+            while(True):
+                print(">> Local Mean Sidereal Time Calculator\n")
+                print(">> Please choose a mode you'd like to use!")
+                print("(1) Parameters from User Input")
+                print("(2) Parameters of Predefined Locations")
+                print("(Q) Quit to Main Menu\n")
+
+                DistMode = input("> Choose a mode and press enter...: ")
+                print('\n')
+
+                if(DistMode == '1'):
+                    print(">> Calculate LMST from given Parameters\n")
+                    print(">> Give Parameters!")
+
+                    # Input Positional Parameters
+                    print(">> HINT: You can write Latitude as a Decimal Fraction. For this you need to\n>> Write Hours as a float-type value, then you can\n>> Press Enter for both Minutes and Seconds.")
+                    LatitudeHours = float(input("> Latitude (φ) Hours: ") or "0")
+                    LatitudeMinutes = float(input("> Latitude (φ) Minutes: ") or "0")
+                    LatitudeSeconds = float(input("> Latitude (φ) Seconds: ") or "0")
+                    Latitude = LatitudeHours + LatitudeMinutes/60 + LatitudeSeconds/3600
+
+                    print(">> HINT: You can write Longitude as a Decimal Fraction. For this you need to\n>> Write Hours as a float-type value, then you can\n>> Press Enter for both Minutes and Seconds.")
+                    LongitudeHours = float(input("> Longitude (λ) Hours: ") or "0")
+                    LongitudeMinutes = float(input("> Longitude (λ) Minutes: ") or "0")
+                    LongitudeSeconds = float(input("> Longitude (λ) Seconds: ") or "0")
+                    Longitude = LongitudeHours + LongitudeMinutes/60 + LongitudeSeconds/3600
+
+                    # Input Time Parameters
+                    while(True):
+                        DateYear = int(input("> Year: "))
+                        if(DateYear != 0):
+                            break
+                        else:
+                            print(">>>> ERROR: Year 0 is not defined! Please write another date!\n")
+
+                    while(True):
+                        DateMonth = int(input("> Month: "))
+                        if(DateMonth > 0 and DateMonth < 13):
+                            break
+                        else:
+                            print(">>>> ERROR: Months should be inside [1,12] interval, and should be Integer!\n")
+
+                    while(True):
+                        DateDay = int(input("> Day: "))
+                        if(DateYear%4 == 0 and (DateYear%100 != 0 or DateYear%400 == 0)):
+                            if(MonthLengthListLeapYear[DateMonth - 1] >= DateDay and DateDay > 0):
+                                break
+                            else:
+                                daysmsg = ">>>> ERROR: Days should be inside [1,{0}] interval, and should be Integer!\n"
+                                print(daysmsg.format(MonthLengthListLeapYear[DateMonth - 1]))
+                        else:
+                            if(MonthLengthList[DateMonth - 1] >= DateDay and DateDay > 0):
+                                break
+                            else:
+                                daysmsg = ">>>> ERROR: Days should be inside [1,{0}] interval, and should be Integer!\n"
+                                print(daysmsg.format(MonthLengthList[DateMonth - 1]))
+
+                    while(True):
+                        LocalHours = float(input("> Local Hours: ") or "0")
+                        if(LocalHours >= 0 and LocalHours < 24):
+                            break
+                        else:
+                            print(">>>> ERROR: Hours should be inside [0,24[ interval!\n")
+
+                    while(True):
+                        LocalMinutes = int(input("> Local Minutes: ") or "0")
+                        if(LocalMinutes >= 0 and LocalMinutes <= 59):
+                            break
+                        else:
+                            print(">>>> ERROR: Minutes should be inside [0,59] interval, and should be Integer!\n")
+
+                    while(True):
+                        LocalSeconds = float(input("> Local Seconds: ") or "0")
+                        if(LocalSeconds >= 0 and LocalSeconds < 60):
+                            break
+                        else:
+                            print(">>>> ERROR: Seconds should be inside [0,60[ interval!\n")
+
+                    LocalSiderealHours, LocalSiderealMinutes, LocalSiderealSeconds, UnitedHours, UnitedMinutes, UnitedSeconds, GreenwichSiderealHours, GreenwichSiderealMinutes, GreenwichSiderealSeconds = LocalSiderealTimeCalc(Longitude, LocalHours, LocalMinutes, LocalSeconds, DateYear, DateMonth, DateDay)
+
+                    sidmsg = "\n>>> The Local Mean Sidereal Time\n>>> at {0}:{1}:{2} UT, at location\n>>> {3}°,{4}° with\n>>> {5}:{6}:{7} GMST at 00:00:00 UT\n>>> is {8}:{9}:{10}\n\n"
+                    print(sidmsg.format(UnitedHours, UnitedMinutes, UnitedSeconds, Latitude, Longitude, GreenwichSiderealHours, GreenwichSiderealMinutes, GreenwichSiderealSeconds, LocalSiderealHours, LocalSiderealMinutes, LocalSiderealSeconds))
+
+                elif(DistMode == '2'):
+                    print(">> Calculate LMST from the Coordinates of a Predefined Location\n")
+                    print(">> Write the Name of a Choosen Location to the Input!")
+
+                    # Input Choosen Location's Name
+                    while(True):
+                        Location = input("> Location's name (type \'H\' for Help): ")
+
+                        if(Location == "Help" or Location == "help" or Location == "H" or Location == "h"):
+                            print("\n>> Predefined Locations you can choose from:")
+                            for keys in LocationDict.items():
+                                print(keys)
+                            print('\n')
+
+                        else:
+                            try:
+                                Longitude = LocationDict[Location][1]
+
+                            except KeyError:
+                                print(">>>> ERROR: The Location, named \"" + Location + "\" is not in the Database!")
+                                print(">>>> Type \"Help\" to list Available Cities in Database!")
+
+                            else:
+                                break
+
+                    # Input Time Parameters
+                    while(True):
+                        DateYear = int(input("> Year: "))
+                        if(DateYear != 0):
+                            break
+                        else:
+                            print(">>>> ERROR: Year 0 is not defined! Please write another date!\n")
+
+                    while(True):
+                        DateMonth = int(input("> Month: "))
+                        if(DateMonth > 0 and DateMonth < 13):
+                            break
+                        else:
+                            print(">>>> ERROR: Months should be inside [1,12] interval, and should be Integer!\n")
+
+                    # Leap Year	Handling
+                    while(True):
+                        DateDay = int(input("> Day: "))
+                        if(DateYear%4 == 0 and (DateYear%100 != 0 or DateYear%400 == 0)):
+                            if(MonthLengthListLeapYear[DateMonth - 1] >= DateDay and DateDay > 0):
+                                break
+                            else:
+                                daysmsg = ">>>> ERROR: Days should be inside [1,{0}] interval, and should be Integer!\n"
+                                print(daysmsg.format(MonthLengthListLeapYear[DateMonth - 1]))
+                        else:
+                            if(MonthLengthList[DateMonth - 1] >= DateDay and DateDay > 0):
+                                break
+                            else:
+                                daysmsg = ">>>> ERROR: Days should be inside [1,{0}] interval, and should be Integer!\n"
+                                print(daysmsg.format(MonthLengthList[DateMonth - 1]))
+
+                    while(True):
+                        LocalHours = float(input("> Local Hours: ") or "0")
+                        if(LocalHours >= 0 and LocalHours < 24):
+                            break
+                        else:
+                            print(">>>> ERROR: Hours should be inside [0,24[ interval!\n")
+
+                    while(True):
+                        LocalMinutes = int(input("> Local Minutes: ") or "0")
+                        if(LocalMinutes >= 0 and LocalMinutes <= 59):
+                            break
+                        else:
+                            print(">>>> ERROR: Minutes should be inside [0,59] interval, and should be Integer!\n")
+
+                    while(True):
+                        LocalSeconds = float(input("> Local Seconds: ") or "0")
+                        if(LocalSeconds >= 0 and LocalSeconds < 60):
+                            break
+                        else:
+                            print(">>>> ERROR: Seconds should be inside [0,60[ interval!\n")
+
+                    LocalSiderealHours, LocalSiderealMinutes, LocalSiderealSeconds, UnitedHours, UnitedMinutes, UnitedSeconds, GreenwichSiderealHours, GreenwichSiderealMinutes, GreenwichSiderealSeconds = LocalSiderealTimeCalc(Longitude, LocalHours, LocalMinutes, LocalSeconds, DateYear, DateMonth, DateDay)
+
+                    sidmsg = "\n>>> The Local Mean Sidereal Time at {0}:{1}:{2} UT\n>>> in {3} with\n>>> {4}:{5}:{6} GMST at 00:00:00 UT\n>>> is {7}:{8}:{9}\n\n"
+                    print(sidmsg.format(UnitedHours, UnitedMinutes, UnitedSeconds, Location, GreenwichSiderealHours, GreenwichSiderealMinutes, GreenwichSiderealSeconds, LocalSiderealHours, LocalSiderealMinutes, LocalSiderealSeconds))
+
+                elif(DistMode == 'Q' or DistMode == 'q'):
+                    break
+
+                else:
+                    print(">>>> ERROR: Invalid option! Try Again!")
+
+
+        #   _______       _ _ _       _     _      _____      _      
+        #  |__   __|     (_) (_)     | |   | |    / ____|    | |     
+        #     | |_      ___| |_  __ _| |__ | |_  | |     __ _| | ___ 
+        #     | \ \ /\ / / | | |/ _` | '_ \| __| | |    / _` | |/ __|
+        #     | |\ V  V /| | | | (_| | | | | |_  | |___| (_| | | (__ 
+        #     |_| \_/\_/ |_|_|_|\__, |_| |_|\__|  \_____\__,_|_|\___|
+        #                        __/ |                               
+        #                       |___/                                
+        # DATETIME CALCULATION FOR TWILIGHTS
+        elif(mode == '4'):
+            while(True):
+                print(">> Calculate Datetimes of Twilights at Specific Location")
+                print(">> Please choose a mode you'd like to use!")
+                print("(1) Parameters from User Input")
+                print("(2) Parameters of Predefined Locations")
+                print("(Q) Quit to Main Menu\n")
+
+                TwiMode = input("> Choose a mode and press enter...: ")
+                print('\n')
+
+                # Constant for Calculations
+                Planet = "Earth"
+
+                if(TwiMode == '1'):
+                    print(">> Calculate Twilights from given Parameters\n")
+                    print(">> Give Parameters!")
+
+                    # Input Positional Parameters
+                    print(">> HINT: You can write Latitude as a Decimal Fraction. For this you need to\n>> Write Hours as a float-type value, then you can\n>> Press Enter for both Minutes and Seconds.")
+                    LatitudeHours = float(input("> Latitude (φ) Hours: ") or "0")
+                    LatitudeMinutes = float(input("> Latitude (φ) Minutes: ") or "0")
+                    LatitudeSeconds = float(input("> Latitude (φ) Seconds: ") or "0")
+                    Latitude = LatitudeHours + LatitudeMinutes/60 + LatitudeSeconds/3600
+
+                    print(">> HINT: You can write Longitude as a Decimal Fraction. For this you need to\n>> Write Hours as a float-type value, then you can\n>> Press Enter for both Minutes and Seconds.")
+                    LongitudeHours = float(input("> Longitude (λ) Hours: ") or "0")
+                    LongitudeMinutes = float(input("> Longitude (λ) Minutes: ") or "0")
+                    LongitudeSeconds = float(input("> Longitude (λ) Seconds: ") or "0")
+                    Longitude = LongitudeHours + LongitudeMinutes/60 + LongitudeSeconds/3600
+
+                elif(TwiMode == '2'):
+                    while(True):
+                        print(">> Calculate Datetimes of Twilights from the Coordinates of a Predefined Location")
+                        print(">> Write the Name of a Choosen Location to the Input!")
+
+                        # Input Choosen Location's Name
+                        Location = input("> Location's name (type \'H\' for Help): ")
+
+                        if(Location == "Help" or Location == "help" or Location == "H" or Location == "h"):
+                            print("\n>> Predefined Locations you can choose from:")
+                            for keys in LocationDict.items():
+                                print(keys)
+                            print('\n')
+
+                        else:
+                            try:
+                                Latitude = LocationDict[Location][0]
+                                Longitude = LocationDict[Location][1]
+
+                            except KeyError:
+                                print(">>>> ERROR: The Location, named \"" + Location + "\" is not in the Database!")
+                                print(">>>> Type \"Help\" to list Available Cities in Database!")
+
+                            else:
+                                break
+
+                elif(TwiMode == 'Q' or TwiMode == 'q'):
+                    break
+
+                else:
+                    print(">>>> ERROR: Invalid option! Try Again!")
+
+                if(TwiMode == '1' or TwiMode == '2'):
+                    # Input Time Parameters
+                    while(True):
+                        LocalDateYear = int(input("> Year: "))
+                        if(LocalDateYear != 0):
+                            break
+                        else:
+                            print(">>>> ERROR: Year 0 is not defined! Please write another date!\n")
+
+                    while(True):
+                        LocalDateMonth = int(input("> Month: "))
+                        if(LocalDateMonth > 0 and LocalDateMonth < 13):
+                            break
+                        else:
+                            print(">>>> ERROR: Months should be inside [1,12] interval, and should be Integer!\n")
+
+                    # Leap Year	Handling
+                    while(True):
+                        LocalDateDay = int(input("> Day: "))
+                        if(LocalDateYear%4 == 0 and (LocalDateYear%100 != 0 or LocalDateYear%400 == 0)):
+                            if(MonthLengthListLeapYear[LocalDateMonth - 1] >= LocalDateDay and LocalDateDay > 0):
+                                break
+                            else:
+                                daysmsg = ">>>> ERROR: Days should be inside [1,{0}] interval, and should be Integer!\n"
+                                print(daysmsg.format(MonthLengthListLeapYear[LocalDateMonth - 1]))
+                        else:
+                            if(MonthLengthList[LocalDateMonth - 1] >= LocalDateDay and LocalDateDay > 0):
+                                break
+                            else:
+                                daysmsg = ">>>> ERROR: Days should be inside [1,{0}] interval, and should be Integer!\n"
+                                print(daysmsg.format(MonthLengthList[LocalDateMonth - 1]))
+
+
+                    (LocalHoursNoon, LocalMinutesNoon, LocalSecondsNoon, LocalDateYearNoon, LocalDateMonthNoon, LocalDateDayNoon,
+                    LocalHoursMidnight, LocalMinutesMidnight, LocalSecondsMidnight, LocalDateYearMidnight, LocalDateMonthMidnight, LocalDateDayMidnight,
+                    LocalHoursRiseDaylight, LocalMinutesRiseDaylight, LocalSecondsRiseDaylight, LocalDateYearRiseDaylight, LocalDateMonthRiseDaylight, LocalDateDayRiseDaylight,
+                    LocalHoursSetDaylight, LocalMinutesSetDaylight, LocalSecondsSetDaylight, LocalDateYearSetDaylight, LocalDateMonthSetDaylight, LocalDateDaySetDaylight,
+                    LocalHoursRiseCivil, LocalMinutesRiseCivil, LocalSecondsRiseCivil, LocalDateYearRiseCivil, LocalDateMonthRiseCivil, LocalDateDayRiseCivil,
+                    LocalHoursSetCivil, LocalMinutesSetCivil, LocalSecondsSetCivil, LocalDateYearSetCivil, LocalDateMonthSetCivil, LocalDateDaySetCivil,
+                    LocalHoursRiseNaval, LocalMinutesRiseNaval, LocalSecondsRiseNaval, LocalDateYearRiseNaval, LocalDateMonthRiseNaval, LocalDateDayRiseNaval,
+                    LocalHoursSetNaval, LocalMinutesSetNaval, LocalSecondsSetNaval, LocalDateYearSetNaval, LocalDateMonthSetNaval, LocalDateDaySetNaval,
+                    LocalHoursRiseAstro, LocalMinutesRiseAstro, LocalSecondsRiseAstro, LocalDateYearSetAstro, LocalDateMonthSetAstro, LocalDateDaySetAstro,
+                    LocalHoursSetAstro, LocalMinutesSetAstro, LocalSecondsSetAstro, LocalDateYearRiseAstro, LocalDateMonthRiseAstro, LocalDateDayRiseAstro) = TwilightCalc(Planet, Latitude, Longitude, LocalDateYear, LocalDateMonth, LocalDateDay)
+
+                    if(TwiMode == '1'):
+                        suncoordmsg = ">>> Calculated Datetimes of Twilights at Coordinates \n>>> {0}, {1}:"
+                        print(suncoordmsg.format(Latitude, Longitude))
+
+                    elif(TwiMode == '2'):
+                        print("\n>>> Calculated Datetimes of Twilights at " + Location + ":")
+
+                    msgdaylightrise = "\n>> Rising Daylight's time: {0}:{1}:{2} on {3}.{4}.{5}"
+                    msgdaylightset = ">> Setting Daylight's time: {0}:{1}:{2} on {3}.{4}.{5}\n"
+
+                    msgcivilrise = "\n>> Rising Civil Twilight's time is between\n>> {0}:{1}:{2} and {3}:{4}:{5} on {6}.{7}.{8}"
+                    msgcivilset = ">> Setting Civil Twilight's time is between\n>> {0}:{1}:{2} and {3}:{4}:{5} on {6}.{7}.{8}\n"
+
+                    msgnavalrise = "\n>> Rising Nautical Twilight's time is between\n>> {0}:{1}:{2} and {3}:{4}:{5} on {6}.{7}.{8}"
+                    msgnavalset = ">> Setting Nautical Twilight's time is between\n>> {0}:{1}:{2} and {3}:{4}:{5} on {6}.{7}.{8}\n"
+
+                    msgastrorise = "\n>> Rising Astronomical Twilight's time is between\n>> {0}:{1}:{2} and {3}:{4}:{5} on {6}.{7}.{8}"
+                    msgastroset = ">> Setting Astronomical Twilight's time is between\n>> {0}:{1}:{2} and {3}:{4}:{5} on {6}.{7}.{8}\n"
+
+                    msgnoon = "\n>> Noon occurs at {0}:{1}:{2} on {3}.{4}.{5}"
+                    msgmidnight = ">> Midnight occurs at {0}:{1}:{2} on {3}.{4}.{5}\n"
+
+                    # +4 and -6 are Corrections for more accurate times
+
+                    print(msgdaylightrise.format(LocalHoursRiseDaylight, LocalMinutesRiseDaylight, LocalSecondsRiseDaylight, LocalDateYearRiseDaylight, LocalDateMonthRiseDaylight, LocalDateDayRiseDaylight))
+                    print(msgdaylightset.format(LocalHoursSetDaylight, LocalMinutesSetDaylight, LocalSecondsSetDaylight, LocalDateYearSetDaylight, LocalDateMonthSetDaylight, LocalDateDaySetDaylight))
+
+                    print(msgcivilrise.format(LocalHoursRiseCivil, LocalMinutesRiseCivil + 4, LocalSecondsRiseCivil, LocalHoursRiseDaylight, LocalMinutesRiseDaylight, LocalSecondsRiseDaylight, LocalDateYearRiseCivil, LocalDateMonthRiseCivil, LocalDateDayRiseCivil))
+                    print(msgcivilset.format(LocalHoursSetDaylight, LocalMinutesSetDaylight, LocalSecondsSetDaylight, LocalHoursSetCivil, LocalMinutesSetCivil - 6, LocalSecondsSetCivil, LocalDateYearSetCivil, LocalDateMonthSetCivil, LocalDateDaySetCivil))
+
+                    print(msgnavalrise.format(LocalHoursRiseNaval, LocalMinutesRiseNaval + 4, LocalSecondsRiseNaval, LocalHoursRiseCivil, LocalMinutesRiseCivil + 4, LocalSecondsRiseCivil, LocalDateYearRiseNaval, LocalDateMonthRiseNaval, LocalDateDayRiseNaval))
+                    print(msgnavalset.format(LocalHoursSetCivil, LocalMinutesSetCivil - 6, LocalSecondsSetCivil, LocalHoursSetNaval, LocalMinutesSetNaval - 6, LocalSecondsSetNaval, LocalDateYearSetNaval, LocalDateMonthSetNaval, LocalDateDaySetNaval))
+
+                    print(msgastrorise.format(LocalHoursRiseAstro, LocalMinutesRiseAstro + 4, LocalSecondsRiseAstro, LocalHoursRiseNaval, LocalMinutesRiseNaval + 4, LocalSecondsRiseNaval, LocalDateYearSetAstro, LocalDateMonthSetAstro, LocalDateDaySetAstro))
+                    print(msgastroset.format(LocalHoursSetNaval, LocalMinutesSetNaval - 6, LocalSecondsSetNaval, LocalHoursSetAstro, LocalMinutesSetAstro - 6, LocalSecondsSetAstro, LocalDateYearRiseAstro, LocalDateMonthRiseAstro, LocalDateDayRiseAstro))
+
+                    print(msgnoon.format(LocalHoursNoon, LocalMinutesNoon, LocalSecondsNoon, LocalDateYearNoon, LocalDateMonthNoon, LocalDateDayNoon))
+                    print(msgmidnight.format(LocalHoursMidnight, LocalMinutesMidnight, LocalSecondsMidnight, LocalDateYearMidnight, LocalDateMonthMidnight, LocalDateDayMidnight))
+
+
+
+        #    ___      _               _____    _                   _           
+        #   / _ \    | |             |_   _|  (_)                 | |          
+        #  / /_\ \___| |_ _ __ ___     | |_ __ _  __ _ _ __   __ _| | ___  ___ 
+        #  |  _  / __| __| '__/ _ \    | | '__| |/ _` | '_ \ / _` | |/ _ \/ __|
+        #  | | | \__ \ |_| | | (_) |   | | |  | | (_| | | | | (_| | |  __/\__ \
+        #  \_| |_/___/\__|_|  \___/    \_/_|  |_|\__,_|_| |_|\__, |_|\___||___/
+        #                                                     __/ |            
+        #                                                    |___/             
+        # Calculate Astronomical Triangles Parameters
+        elif(mode == '5'):
+            while(True):
+                print(">> Calculate Astronomical Triangles Parameters from given Ones")
+                print(">> Please choose a mode you'd like to use!")
+                print("(1) Parameters from User Input")
+                print("(Q) Quit to Main Menu")
+
+                TrigMode = input("> Choose a mode and press enter...: ")
+
+                print('\n')
+
+                if(TrigMode == '1'):
+                    print("\n>> Please Give Parameters' Values!")
+                    print(">>> HINT: You should give Parameters in angular units. You can press enter for\n>> A blank input too. Doing like this will mark the actual parameter\n>> As a missing one.")
+                    aValue = float(input("> Value for side \'A\': ") or "0")
+                    bValue = float(input("> Value for side \'B\': ") or "0")
+                    cValue = float(input("> Value for side \'C\': ") or "0")
+                    alphaValue = float(input("> Value for angle \'α\': ") or "0")
+                    betaValue = float(input("> Value for angle \'β\': ") or "0")
+                    gammaValue = float(input("> Value for angle \'γ\': ") or "0")
+
+                elif(TrigMode == '2'):
+                    pass
+
+                elif(TrigMode == 'Q' or TrigMode == 'q'):
+                    break
+
+                else:
+                    print(">>>> ERROR: Invalid option! Try Again!")
+
+
+                if(TrigMode == '1'):
+
+                    aValue, bValue, cValue, alphaValue, betaValue, gammaValue = AstroTriangles(aValue, bValue, cValue, alphaValue, betaValue, gammaValue)
+
+                    if(aValue == 0 or bValue == 0 or cValue == 0 or alphaValue == 0 or betaValue == 0 or gammaValue == 0):
+                        print("Given Data are\'nt enough to calculate the Triangle's Parameters!")
+
+
+                    print(">> Calculated Parameters of the Triangle:")
+                    print("Side \'A\': ", aValue)
+                    print("Side \'B\': ", bValue)
+                    print("Side \'C\': ", cValue)
+                    print("Angle \'α\': ", alphaValue)
+                    print("Angle \'β\': ", betaValue)
+                    print("Angle \'γ\': ", gammaValue)
+                    print("\n")
+
+
+        #   _____                 _ _       _ 
+        #  /  ___|               | (_)     | |
+        #  \ `--. _   _ _ __   __| |_  __ _| |
+        #   `--. \ | | | '_ \ / _` | |/ _` | |
+        #  /\__/ / |_| | | | | (_| | | (_| | |
+        #  \____/ \__,_|_| |_|\__,_|_|\__,_|_|
+        # Plot Sundial for Choosen Locations
+        elif(mode == '6'):
+            while(True):
+                print(">> Plot Sun's Path on a Sundial at Choosen Location")
+                print(">> Please choose a mode you'd like to use!")
+                print("(1) Parameters from User Input")
+                print("(2) Parameters of Predefined Locations")
+                print("(Q) Quit to Main Menu")
+
+                SundialMode = input("> Choose a mode and press enter...: ")
+
+                print('\n')
+
+                # Constants for calculation
+                Planet = "Earth"
+
+                '''while(True):
+                    print("On which Planet would you plot the Sundial?")
+                    PlanetChoose = input("> Planet's name (type \'H\' for Help): ")
+
+                    if(PlanetChoose == "Help" or PlanetChoose == "help" or PlanetChoose == "H" or PlanetChoose == "h"):
+                        print("\n>> Planets you can choose from:")
+                        for keys in PlanetDict.items():
+                            print(keys)
+                        print('\n')
+
+                    else:
+                        try:
+                            Planet = PlanetDict[PlanetChoose]
+
+                        except KeyError:
+                            print(">>>> ERROR: The Planet, named \"" + PlanetChoose + "\" is not in the Database!")
+                            print(">>>> Type \"Help\" to list Available Planets in the Database!")
+
+                        else:
+                            break'''
+
+                if(SundialMode == '1'):
+                    print(">> Plot a Sundial on a User-defined Location\n")
+                    print(">> Give Parameters!")
+
+                    # Input Positional Parameters
+                    print(">> HINT: You can write Latitude as a Decimal Fraction. For this you need to\n>> Write Hours as a float-type value, then you can\n>> Press Enter for both Minutes and Seconds.")
+                    LatitudeHours = float(input("> Latitude (φ) Hours: ") or "0")
+                    LatitudeMinutes = float(input("> Latitude (φ) Minutes: ") or "0")
+                    LatitudeSeconds = float(input("> Latitude (φ) Seconds: ") or "0")
+                    Latitude = LatitudeHours + LatitudeMinutes/60 + LatitudeSeconds/3600
+
+                    print(">> HINT: You can write Longitude as a Decimal Fraction. For this you need to\n>> Write Hours as a float-type value, then you can\n>> Press Enter for both Minutes and Seconds.")
+                    LongitudeHours = float(input("> Longitude (λ) Hours: ") or "0")
+                    LongitudeMinutes = float(input("> Longitude (λ) Minutes: ") or "0")
+                    LongitudeSeconds = float(input("> Longitude (λ) Seconds: ") or "0")
+                    Longitude = LongitudeHours + LongitudeMinutes/60 + LongitudeSeconds/3600
+
+
+                elif(SundialMode == '2'):
+                    print(">> Plot a Sundial on a Predefined Location's Coordinates")
+                    print(">> Write the Name of a Choosen Location to the Input!")
+
+                    # Input Choosen Location's Name
+                    while(True):
+                        Location = input("> Location's name (type \'H\' for Help): ")
+
+                        if(Location == "Help" or Location == "help" or Location == "H" or Location == "h"):
+                            print("\n>> Predefined Locations you can choose from:")
+                            for keys in LocationDict.items():
+                                print(keys)
+                            print('\n')
+
+                        else:
+                            try:
+                                Latitude = LocationDict[Location][0]
+                                Longitude = LocationDict[Location][1]
+
+                            except KeyError:
+                                print(">>>> ERROR: The Location, named \"" + Location + "\" is not in the Database!")
+                                print(">>>> Type \"Help\" to list Available Cities in Database!")
+
+                            else:
+                                break
+
+                elif(SundialMode == 'Q' or SundialMode == 'q'):
+                    break
+
+                else:
+                    print(">>>> ERROR: Invalid option! Try Again!")
+
+
+                if(SundialMode == '1' or SundialMode == '2'):
+                    print(">> For which Year would You like to Draw the Sundial?")
+                    while(True):
+                        SunDialYear = int(input("> Choosen Year: "))
+                        if(SunDialYear != 0):
+                            break
+                        else:
+                            print(">>>> ERROR: Year 0 is not defined! Please write another date!\n")
+
+
+                    while(True):
+                        print(">> Would you like to plot the Sun's path for a Choosen Date in This Year too?")
+                        SunDialChoose = input(">> Write Y for Yes or N for No: ")
+                        if(SunDialChoose == 'Y' or SunDialChoose == 'y' or SunDialChoose == 'Yes' or SunDialChoose == 'yes' or SunDialChoose == 'YEs' or SunDialChoose == 'yEs' or SunDialChoose == 'yeS' or SunDialChoose == 'YeS' or SunDialChoose == 'yES'):
+                            # Input Time Parameters
+                            while(True):
+                                LocalDateMonthChoosen = int(input("> Month: "))
+                                if(LocalDateMonthChoosen > 0 and LocalDateMonthChoosen < 13):
+                                    break
+                                else:
+                                    print(">>>> ERROR: Months should be inside [1,12] interval, and should be Integer!\n")
+
+                            # Leap Year	Handling
+                            while(True):
+                                LocalDateDayChoosen = int(input("> Day: "))
+                                if(SunDialYear%4 == 0 and (SunDialYear%100 != 0 or SunDialYear%400 == 0)):
+                                    if(MonthLengthListLeapYear[LocalDateMonthChoosen - 1] >= LocalDateDayChoosen and LocalDateDayChoosen > 0):
+                                        break
+                                    else:
+                                        daysmsg = ">>>> ERROR: Days should be inside [1,{0}] interval, and should be Integer!\n"
+                                        print(daysmsg.format(MonthLengthListLeapYear[LocalDateMonthChoosen - 1]))
+                                else:
+                                    if(MonthLengthList[LocalDateMonthChoosen - 1] >= LocalDateDayChoosen and LocalDateDayChoosen > 0):
+                                        break
+                                    else:
+                                        daysmsg = ">>>> ERROR: Days should be inside [1,{0}] interval, and should be Integer!\n"
+                                        print(daysmsg.format(MonthLengthList[LocalDateMonthChoosen - 1]))
+
+                            break
+
+                        elif(SunDialChoose == 'N' or SunDialChoose == 'n' or SunDialChoose == 'No' or SunDialChoose == 'no' or SunDialChoose == 'nO'):
+                            break
+
+                        else:
+                            print(">>>> ERROR: Invalid option! Try Again!")
+
+                    MeasureNumber = 1000
+                    FineTuned = 1000
+
+                    if(SunDialChoose == 'Y' or SunDialChoose == 'y' or SunDialChoose == 'Yes' or SunDialChoose == 'yes' or SunDialChoose == 'YEs' or SunDialChoose == 'yEs' or SunDialChoose == 'yeS' or SunDialChoose == 'YeS' or SunDialChoose == 'yES'):
+
+                        print("Choosen Date:")
+                        ### CHOOSEN DATE ###
+                        LocalHourAngleRiseChoosen, LocalHourAngleSetChoosen, DeclinationSunChoosen = SundialPrecalculations(Planet, Latitude, Longitude, SunDialYear, LocalDateMonthChoosen, LocalDateDayChoosen)
+
+                        # Create lists for plot parameters
+                        LocalHourAngleChoosen = []
+                        AltitudesChoosen = []
+                        AzimuthsChoosen = []
+                        ShadowsChoosen = []
+
+                        if(LocalHourAngleRiseChoosen > LocalHourAngleSetChoosen):
+
+                            ChoosenStep1 = int((int(23.999999999 * FineTuned) - int(LocalHourAngleRiseChoosen * FineTuned)) / (MeasureNumber / 2))
+                            ChoosenStep2 = int(int(LocalHourAngleSetChoosen * FineTuned) / (MeasureNumber / 2))
+
+                            # Calculate plot parameters
+                            for LocalHourAngleActual in range(int(LocalHourAngleRiseChoosen * FineTuned), int(23.999999999 * FineTuned), ChoosenStep1):
+
+                                # Norm back to normal
+                                LocalHourAngleActual /= FineTuned
+
+                                # Calculate parameters by ~10 seconds interval
+                                AltitudeActual, AzimuthActual, ShadowsLengthActual = SundialParametersCalc(Latitude, LocalHourAngleActual, DeclinationSunChoosen)
+                                #AltitudeActual, ShadowsLengthActual = SundialParametersCalc(Latitude, LocalHourAngleActual, DeclinationSunChoosen)
+                                #print(LocalHourAngleActual, AltitudeActual)
+
+                                # Append parameters to lists
+                                LocalHourAngleActual += 12
+                                LocalHourAngleActual = NormalizeZeroBounded(LocalHourAngleActual, 24)
+                                LocalHourAngleChoosen.append(LocalHourAngleActual)
+                                AltitudesChoosen.append(AltitudeActual)
+                                AzimuthsChoosen.append(AzimuthActual)
+                                ShadowsChoosen.append(ShadowsLengthActual)
+
+                            # Calculate plot parameters
+                            for LocalHourAngleActual in range(0, int(LocalHourAngleSetChoosen * FineTuned), ChoosenStep2):
+
+                                # Norm back to normal
+                                LocalHourAngleActual /= FineTuned
+
+                                # Calculate parameters by ~10 seconds interval
+                                AltitudeActual, AzimuthActual, ShadowsLengthActual = SundialParametersCalc(Latitude, LocalHourAngleActual, DeclinationSunChoosen)
+                                #AltitudeActual, ShadowsLengthActual = SundialParametersCalc(Latitude, LocalHourAngleActual, DeclinationSunChoosen)
+                                #print(LocalHourAngleActual, AltitudeActual)
+
+                                # Append parameters to lists
+                                LocalHourAngleActual += 12
+                                LocalHourAngleActual = NormalizeZeroBounded(LocalHourAngleActual, 24)
+                                LocalHourAngleChoosen.append(LocalHourAngleActual)
+                                AltitudesChoosen.append(AltitudeActual)
+                                AzimuthsChoosen.append(AzimuthActual)
+                                ShadowsChoosen.append(ShadowsLengthActual)
+
+
+                        else:
+
+                            ChoosenStep = int((int(LocalHourAngleSetChoosen * FineTuned) - int(LocalHourAngleRiseChoosen * FineTuned)) / MeasureNumber)
+
+                            # Calculate plot parameters
+                            for LocalHourAngleActual in range(int(LocalHourAngleRiseChoosen * FineTuned), int(LocalHourAngleSetChoosen * FineTuned), ChoosenStep):
+
+                                # Norm back to normal
+                                LocalHourAngleActual /= FineTuned
+
+                                # Calculate parameters by ~10 seconds interval
+                                AltitudeActual, AzimuthActual, ShadowsLengthActual = SundialParametersCalc(Latitude, LocalHourAngleActual, DeclinationSunChoosen)
+                                #AltitudeActual, ShadowsLengthActual = SundialParametersCalc(Latitude, LocalHourAngleActual, DeclinationSunChoosen)
+                                #print(LocalHourAngleActual, AltitudeActual)
+
+                                # Append parameters to lists
+                                LocalHourAngleActual += 12
+                                LocalHourAngleActual = NormalizeZeroBounded(LocalHourAngleActual, 24)
+                                LocalHourAngleChoosen.append(LocalHourAngleActual)
+                                AltitudesChoosen.append(AltitudeActual)
+                                AzimuthsChoosen.append(AzimuthActual)
+                                ShadowsChoosen.append(ShadowsLengthActual)
+
+
+
+                    print("Summer Solstice:")
+                    ### SUMMER SOLSTICE ###
+                    LocalDateMonthSummer = 6
+                    if(SunDialYear%4 == 0):
+                        LocalDateDaySummer = 20
+
+                    else:
+                        LocalDateDaySummer = 21
+
+                    LocalHourAngleRiseSummer, LocalHourAngleSetSummer, DeclinationSunSummer = SundialPrecalculations(Planet, Latitude, Longitude, SunDialYear, LocalDateMonthSummer, LocalDateDaySummer)
+
+                    # Create lists for plot parameters
+                    LocalHourAngleSummer = []
+                    AltitudesSummer = []
+                    AzimuthsSummer = []
+                    ShadowsSummer = []
+
+                    DeclinationSunSummer = 23.5
+
+                    if(LocalHourAngleRiseSummer > LocalHourAngleSetSummer):
+
+                        SummerStep1 = int((int(23.999999999 * FineTuned) - int(LocalHourAngleRiseSummer * FineTuned)) / (MeasureNumber / 2))
+                        SummerStep2 = int(int(LocalHourAngleSetSummer * FineTuned) / (MeasureNumber / 2))
+
+                        # Calculate plot parameters
+                        for LocalHourAngleActual in range(int(LocalHourAngleRiseSummer * FineTuned), int(23.999999999 * FineTuned), SummerStep1):
+
+                            # Norm back to normal
+                            LocalHourAngleActual /= FineTuned
+
+                            # Calculate parameters by ~10 seconds interval
+                            AltitudeActual, AzimuthActual, ShadowsLengthActual = SundialParametersCalc(Latitude, LocalHourAngleActual, DeclinationSunSummer)
+                            #AltitudeActual, ShadowsLengthActual = SundialParametersCalc(Latitude, LocalHourAngleActual, DeclinationSunSummer)
+                            #print(LocalHourAngleActual, AltitudeActual)
+
+                            # Append parameters to lists
+                            LocalHourAngleActual += 12
+                            LocalHourAngleActual = NormalizeZeroBounded(LocalHourAngleActual, 24)
+                            LocalHourAngleSummer.append(LocalHourAngleActual)
+                            AltitudesSummer.append(AltitudeActual)
+                            AzimuthsSummer.append(AzimuthActual)
+                            ShadowsSummer.append(ShadowsLengthActual)
+
+                        # Calculate plot parameters
+                        for LocalHourAngleActual in range(0, int(LocalHourAngleSetSummer * FineTuned), SummerStep2):
+
+                            # Norm back to normal
+                            LocalHourAngleActual /= FineTuned
+
+                            # Calculate parameters by ~10 seconds interval
+                            AltitudeActual, AzimuthActual, ShadowsLengthActual = SundialParametersCalc(Latitude, LocalHourAngleActual, DeclinationSunSummer)
+                            #AltitudeActual, ShadowsLengthActual = SundialParametersCalc(Latitude, LocalHourAngleActual, DeclinationSunSummer)
+                            #print(LocalHourAngleActual, AltitudeActual)
+
+                            # Append parameters to lists
+                            LocalHourAngleActual += 12
+                            LocalHourAngleActual = NormalizeZeroBounded(LocalHourAngleActual, 24)
+                            LocalHourAngleSummer.append(LocalHourAngleActual)
+                            AltitudesSummer.append(AltitudeActual)
+                            AzimuthsSummer.append(AzimuthActual)
+                            ShadowsSummer.append(ShadowsLengthActual)
+
+
+                    else:
+
+                        SummerStep = int((int(LocalHourAngleSetSummer * FineTuned) - int(LocalHourAngleRiseSummer * FineTuned)) / MeasureNumber)
+
+                        # Calculate plot parameters
+                        for LocalHourAngleActual in range(int(LocalHourAngleRiseSummer * FineTuned), int(LocalHourAngleSetSummer * FineTuned), SummerStep):
+
+                            # Norm back to normal
+                            LocalHourAngleActual /= FineTuned
+
+                            # Calculate parameters by ~10 seconds interval
+                            AltitudeActual, AzimuthActual, ShadowsLengthActual = SundialParametersCalc(Latitude, LocalHourAngleActual, DeclinationSunSummer)
+                            #AltitudeActual, ShadowsLengthActual = SundialParametersCalc(Latitude, LocalHourAngleActual, DeclinationSunSummer)
+                            #print(LocalHourAngleActual, AltitudeActual)
+
+                            # Append parameters to lists
+                            LocalHourAngleActual += 12
+                            LocalHourAngleActual = NormalizeZeroBounded(LocalHourAngleActual, 24)
+                            LocalHourAngleSummer.append(LocalHourAngleActual)
+                            AltitudesSummer.append(AltitudeActual)
+                            AzimuthsSummer.append(AzimuthActual)
+                            ShadowsSummer.append(ShadowsLengthActual)
+
+
+                    print("Winter Solstice:")
+                    ### WINTER SOLSTICE ###
+                    LocalDateMonthWinter = 12
+                    if((SunDialYear + 1)%4 == 0):
+                        LocalDateDayWinter = 22
+
+                    else:
+                        LocalDateDayWinter = 21
+
+                    LocalHourAngleRiseWinter, LocalHourAngleSetWinter, DeclinationSunWinter = SundialPrecalculations(Planet, Latitude, Longitude, SunDialYear, LocalDateMonthWinter, LocalDateDayWinter)
+
+                    # Create lists for plot parameters
+                    LocalHourAngleWinter = []
+                    AltitudesWinter = []
+                    AzimuthsWinter = []
+                    ShadowsWinter = []
+
+                    if(LocalHourAngleRiseWinter > LocalHourAngleSetWinter):
+
+                        WinterStep1 = int((int(23.999999999 * FineTuned) - int(LocalHourAngleRiseWinter * FineTuned)) / (MeasureNumber / 2))
+                        WinterStep2 = int(int(LocalHourAngleSetWinter * FineTuned) / (MeasureNumber / 2))
+
+                        # Calculate plot parameters
+                        for LocalHourAngleActual in range(int(LocalHourAngleRiseWinter * FineTuned), int(23.999999999 * FineTuned), WinterStep1):
+
+                            # Norm back to normal
+                            LocalHourAngleActual /= FineTuned
+
+                            # Calculate parameters by ~10 seconds interval
+                            AltitudeActual, AzimuthActual, ShadowsLengthActual = SundialParametersCalc(Latitude, LocalHourAngleActual, DeclinationSunWinter)
+                            #AltitudeActual, ShadowsLengthActual = SundialParametersCalc(Latitude, LocalHourAngleActual, DeclinationSunWinter)
+                            #print(LocalHourAngleActual, AltitudeActual)
+
+                            # Append parameters to lists
+                            LocalHourAngleActual += 12
+                            LocalHourAngleActual = NormalizeZeroBounded(LocalHourAngleActual, 24)
+                            LocalHourAngleWinter.append(LocalHourAngleActual)
+                            AltitudesWinter.append(AltitudeActual)
+                            #AzimuthsWinter.append(AzimuthActual)
+                            ShadowsWinter.append(ShadowsLengthActual)
+
+                        # Calculate plot parameters
+                        for LocalHourAngleActual in range(0, int(LocalHourAngleSetWinter * FineTuned), WinterStep2):
+
+                            # Norm back to normal
+                            LocalHourAngleActual /= FineTuned
+
+                            # Calculate parameters by ~10 seconds interval
+                            AltitudeActual, AzimuthActual, ShadowsLengthActual = SundialParametersCalc(Latitude, LocalHourAngleActual, DeclinationSunWinter)
+                            #AltitudeActual, ShadowsLengthActual = SundialParametersCalc(Latitude, LocalHourAngleActual, DeclinationSunWinter)
+                            #print(LocalHourAngleActual, AltitudeActual)
+
+                            # Append parameters to lists
+                            LocalHourAngleActual += 12
+                            LocalHourAngleActual = NormalizeZeroBounded(LocalHourAngleActual, 24)
+                            LocalHourAngleWinter.append(LocalHourAngleActual)
+                            AltitudesWinter.append(AltitudeActual)
+                            AzimuthsWinter.append(AzimuthActual)
+                            ShadowsWinter.append(ShadowsLengthActual)
+
+
+                    else:
+
+                        WinterStep = int((int(LocalHourAngleSetWinter * FineTuned) - int(LocalHourAngleRiseWinter * FineTuned)) / MeasureNumber)
+
+                        # Calculate plot parameters
+                        for LocalHourAngleActual in range(int(LocalHourAngleRiseWinter * FineTuned), int(LocalHourAngleSetWinter * FineTuned), SummerStep):
+
+                            # Norm back to normal
+                            LocalHourAngleActual /= FineTuned
+
+                            # Calculate parameters by ~10 seconds interval
+                            AltitudeActual, AzimuthActual, ShadowsLengthActual = SundialParametersCalc(Latitude, LocalHourAngleActual, DeclinationSunWinter)
+                            #AltitudeActual, AzimuthAShadowsLengthActual = SundialParametersCalc(Latitude, LocalHourAngleActual, DeclinationSunWinter)
+                            #print(LocalHourAngleActual, AltitudeActual)
+
+                            # Append parameters to lists
+                            LocalHourAngleActual += 12
+                            LocalHourAngleActual = NormalizeZeroBounded(LocalHourAngleActual, 24)
+                            LocalHourAngleWinter.append(LocalHourAngleActual)
+                            AltitudesWinter.append(AltitudeActual)
+                            AzimuthsWinter.append(AzimuthActual)
+                            ShadowsWinter.append(ShadowsLengthActual)
+
+
+                    print("March Equinox:")
+                    ### MARCH EQUINOX ###
+                    LocalDateMonthMarch = 3
+                    LocalDateDayMarch = 20
+
+                    LocalHourAngleRiseMarch, LocalHourAngleSetMarch, DeclinationSunMarch = SundialPrecalculations(Planet, Latitude, Longitude, SunDialYear, LocalDateMonthMarch, LocalDateDayMarch)
+
+                    # Create lists for plot parameters
+                    LocalHourAngleMarch = []
+                    AltitudesMarch = []
+                    AzimuthsMarch = []
+                    ShadowsMarch = []
+
+                    if(LocalHourAngleRiseMarch > LocalHourAngleSetMarch):
+
+                        MarchStep1 = int((int(23.999999999 * FineTuned) - int(LocalHourAngleRiseMarch * FineTuned)) / (MeasureNumber / 2))
+                        MarchStep2 = int(int(LocalHourAngleSetMarch * FineTuned) / (MeasureNumber / 2))
+
+                        # Calculate plot parameters
+                        for LocalHourAngleActual in range(int(LocalHourAngleRiseMarch * FineTuned), int(23.999999999 * FineTuned), MarchStep1):
+
+                            # Norm back to normal
+                            LocalHourAngleActual /= FineTuned
+
+                            # Calculate parameters by ~10 seconds interval
+                            AltitudeActual, AzimuthActual, ShadowsLengthActual = SundialParametersCalc(Latitude, LocalHourAngleActual, DeclinationSunMarch)
+                            #AltitudeActual, ShadowsLengthActual = SundialParametersCalc(Latitude, LocalHourAngleActual, DeclinationSunMarch)
+                            #print(LocalHourAngleActual, AltitudeActual)
+
+                            # Append parameters to lists
+                            LocalHourAngleActual += 12
+                            LocalHourAngleActual = NormalizeZeroBounded(LocalHourAngleActual, 24)
+                            LocalHourAngleMarch.append(LocalHourAngleActual)
+                            AltitudesMarch.append(AltitudeActual)
+                            AzimuthsMarch.append(AzimuthActual)
+                            ShadowsMarch.append(ShadowsLengthActual)
+
+                        # Calculate plot parameters
+                        for LocalHourAngleActual in range(0, int(LocalHourAngleSetMarch * FineTuned), MarchStep2):
+
+                            # Norm back to normal
+                            LocalHourAngleActual /= FineTuned
+
+                            # Calculate parameters by ~10 seconds interval
+                            AltitudeActual, AzimuthActual, ShadowsLengthActual = SundialParametersCalc(Latitude, LocalHourAngleActual, DeclinationSunMarch)
+                            #AltitudeActual, ShadowsLengthActual = SundialParametersCalc(Latitude, LocalHourAngleActual, DeclinationSunMarch)
+                            #print(LocalHourAngleActual, AltitudeActual)
+
+                            # Append parameters to lists
+                            LocalHourAngleActual += 12
+                            LocalHourAngleActual = NormalizeZeroBounded(LocalHourAngleActual, 24)
+                            LocalHourAngleMarch.append(LocalHourAngleActual)
+                            AltitudesMarch.append(AltitudeActual)
+                            AzimuthsMarch.append(AzimuthActual)
+                            ShadowsMarch.append(ShadowsLengthActual)
+
+
+                    else:
+
+                        MarchStep = int((int(LocalHourAngleSetMarch * FineTuned) - int(LocalHourAngleRiseMarch * FineTuned)) / MeasureNumber)
+
+                        # Calculate plot parameters
+                        for LocalHourAngleActual in range(int(LocalHourAngleRiseMarch * FineTuned), int(LocalHourAngleSetMarch * FineTuned), SummerStep):
+
+                            # Norm back to normal
+                            LocalHourAngleActual /= FineTuned
+
+                            # Calculate parameters by ~10 seconds interval
+                            AltitudeActual, AzimuthActual, ShadowsLengthActual = SundialParametersCalc(Latitude, LocalHourAngleActual, DeclinationSunMarch)
+                            #AltitudeActual, ShadowsLengthActual = SundialParametersCalc(Latitude, LocalHourAngleActual, DeclinationSunMarch)
+                            #print(LocalHourAngleActual, AltitudeActual)
+
+                            # Append parameters to lists
+                            LocalHourAngleActual += 12
+                            LocalHourAngleActual = NormalizeZeroBounded(LocalHourAngleActual, 24)
+                            LocalHourAngleMarch.append(LocalHourAngleActual)
+                            AltitudesMarch.append(AltitudeActual)
+                            AzimuthsMarch.append(AzimuthActual)
+                            ShadowsMarch.append(ShadowsLengthActual)
+
+
+                    print("September Equinox:")
+                    ### SEPTEMBER EQIUNOX ###
+                    LocalDateMonthSeptember = 9
+                    if(SunDialYear%4 == 0 or (SunDialYear - 1)%4 == 0):
+                        LocalDateDaySeptember = 22
+
+                    else:
+                        LocalDateDaySeptember = 23
+
+                    LocalHourAngleRiseSeptember, LocalHourAngleSetSeptember, DeclinationSunSeptember = SundialPrecalculations(Planet, Latitude, Longitude, SunDialYear, LocalDateMonthSeptember, LocalDateDaySeptember)
+
+                    # Create lists for plot parameters
+                    LocalHourAngleSeptember = []
+                    AltitudesSeptember = []
+                    AzimuthsSeptember = []
+                    ShadowsSeptember = []
+
+                    if(LocalHourAngleRiseSeptember > LocalHourAngleSetSeptember):
+
+                        SeptemberStep1 = int((int(23.999999999 * FineTuned) - int(LocalHourAngleRiseSeptember * FineTuned)) / (MeasureNumber / 2))
+                        SeptemberStep2 = int(int(LocalHourAngleSetSeptember * FineTuned) / (MeasureNumber / 2))
+
+                        # Calculate plot parameters
+                        for LocalHourAngleActual in range(int(LocalHourAngleRiseSeptember * FineTuned), int(23.999999999 * FineTuned), SeptemberStep1):
+
+                            # Norm back to normal
+                            LocalHourAngleActual /= FineTuned
+
+                            # Calculate parameters by ~10 seconds interval
+                            AltitudeActual, AzimuthActual, ShadowsLengthActual = SundialParametersCalc(Latitude, LocalHourAngleActual, DeclinationSunSeptember)
+                            #AltitudeActual, ShadowsLengthActual = SundialParametersCalc(Latitude, LocalHourAngleActual, DeclinationSunSeptember)
+                            #print(LocalHourAngleActual, AltitudeActual)
+
+                            # Append parameters to lists
+                            LocalHourAngleActual += 12
+                            LocalHourAngleActual = NormalizeZeroBounded(LocalHourAngleActual, 24)
+                            LocalHourAngleSeptember.append(LocalHourAngleActual)
+                            AltitudesSeptember.append(AltitudeActual)
+                            AzimuthsSeptember.append(AzimuthActual)
+                            ShadowsSeptember.append(ShadowsLengthActual)
+
+                        # Calculate plot parameters
+                        for LocalHourAngleActual in range(0, int(LocalHourAngleSetSeptember * FineTuned), SeptemberStep2):
+
+                            # Norm back to normal
+                            LocalHourAngleActual /= FineTuned
+
+                            # Calculate parameters by ~10 seconds interval
+                            AltitudeActual, AzimuthActual, ShadowsLengthActual = SundialParametersCalc(Latitude, LocalHourAngleActual, DeclinationSunSeptember)
+                            #AltitudeActual, ShadowsLengthActual = SundialParametersCalc(Latitude, LocalHourAngleActual, DeclinationSunSeptember)
+                            #print(LocalHourAngleActual, AltitudeActual)
+
+                            # Append parameters to lists
+                            LocalHourAngleActual += 12
+                            LocalHourAngleActual = NormalizeZeroBounded(LocalHourAngleActual, 24)
+                            LocalHourAngleSeptember.append(LocalHourAngleActual)
+                            AltitudesSeptember.append(AltitudeActual)
+                            AzimuthsSeptember.append(AzimuthActual)
+                            ShadowsSeptember.append(ShadowsLengthActual)
+
+
+                    else:
+
+                        SeptemberStep = int((int(LocalHourAngleSetSeptember * FineTuned) - int(LocalHourAngleRiseSeptember * FineTuned)) / MeasureNumber)
+
+                        # Calculate plot parameters
+                        for LocalHourAngleActual in range(int(LocalHourAngleRiseSeptember * FineTuned), int(LocalHourAngleSetSeptember * FineTuned), SeptemberStep):
+
+                            # Norm back to normal
+                            LocalHourAngleActual /= FineTuned
+
+                            # Calculate parameters by ~10 seconds interval
+                            AltitudeActual, AzimuthActual, ShadowsLengthActual = SundialParametersCalc(Latitude, LocalHourAngleActual, DeclinationSunSeptember)
+                            #AltitudeActual, ShadowsLengthActual = SundialParametersCalc(Latitude, LocalHourAngleActual, DeclinationSunSeptember)
+                            #print(LocalHourAngleActual, AltitudeActual)
+
+                            # Append parameters to lists
+                            LocalHourAngleActual += 12
+                            LocalHourAngleActual = NormalizeZeroBounded(LocalHourAngleActual, 24)
+                            LocalHourAngleSeptember.append(LocalHourAngleActual)
+                            AltitudesSeptember.append(AltitudeActual)
+                            AzimuthsSeptember.append(AzimuthActual)
+                            ShadowsSeptember.append(ShadowsLengthActual)
+
+                    # Matplotlib is only loaded when a plot is actually drawn
+                    import matplotlib.pyplot as plt
+
+                    # Sun's path on the Sky
+                    plt.title("Sun's path on the Sky")
+                    plt.plot(LocalHourAngleSummer, AltitudesSummer, '.', label="Summer Solstice")
+                    plt.plot(LocalHourAngleWinter, AltitudesWinter, '.', label="Winter Solstice")
+                    plt.plot(LocalHourAngleMarch, AltitudesMarch, '.', label="March Equinox")
+                    plt.plot(LocalHourAngleSeptember, AltitudesSeptember, '.', label="Sept. Equinox")
+                    if(SunDialChoose == 'Y' or SunDialChoose == 'y' or SunDialChoose == 'Yes' or SunDialChoose == 'yes' or SunDialChoose == 'YEs' or SunDialChoose == 'yEs' or SunDialChoose == 'yeS' or SunDialChoose == 'YeS' or SunDialChoose == 'yES'):
+                        plt.plot(LocalHourAngleChoosen, AltitudesChoosen, '.', label="Choosen date")
+
+                    plt.xlabel("Hours (h)")
+                    plt.ylabel("Altitude of the Sun (°)")
+                    plt.legend(bbox_to_anchor=(0., 1.02, 1., .102), loc=3, ncol=2, mode="expand", borderaxespad=0.)
+                    plt.grid()
+                    plt.show()
+
+                    '''plt.plot(AzimuthsSummer, AltitudesSummer, '.', label="Summer Solstice")
+                    plt.plot(AzimuthsWinter, AltitudesWinter, '.', label="Winter Solstice")
+                    plt.plot(AzimuthsMarch, AltitudesMarch, '.', label="March Equinox")
+                    plt.plot(AzimuthsSeptember, AltitudesSeptember, '.', label="Sept. Equinox")
+                    plt.legend(bbox_to_anchor=(0., 1.02, 1., .102), loc=3, ncol=2, mode="expand", borderaxespad=0.)
+                    plt.show()
+
+                    plt.plot(AzimuthsSummer, ShadowsSummer, '.', label="Summer Solstice")
+                    plt.plot(AzimuthsWinter, ShadowsWinter, '.', label="Winter Solstice")
+                    plt.plot(AzimuthsMarch, ShadowsMarch, '.', label="March Equinox")
+                    plt.plot(AzimuthsSeptember, ShadowsSeptember, '.', label="Sept. Equinox")
+                    plt.legend(bbox_to_anchor=(0., 1.02, 1., .102), loc=3, ncol=2, mode="expand", borderaxespad=0.)
+                    plt.show()'''
+
+                    # Shadow's length on the ground
+                    plt.title("Sun's path on Sundial")
+                    plt.plot(LocalHourAngleSummer, ShadowsSummer, '.', label="Summer Solstice")
+                    plt.plot(LocalHourAngleWinter, ShadowsWinter, '.', label="Winter Solstice")
+                    plt.plot(LocalHourAngleMarch, ShadowsMarch, '.', label="March Equinox")
+                    plt.plot(LocalHourAngleSeptember, ShadowsSeptember, '.', label="Sept. Equinox")
+                    if(SunDialChoose == 'Y' or SunDialChoose == 'y' or SunDialChoose == 'Yes' or SunDialChoose == 'yes' or SunDialChoose == 'YEs' or SunDialChoose == 'yEs' or SunDialChoose == 'yeS' or SunDialChoose == 'YeS' or SunDialChoose == 'yES'):
+                        plt.plot(LocalHourAngleChoosen, ShadowsChoosen, '.', label="Choosen date")
+
+                    plt.xlabel("Hours (h)")
+                    plt.ylabel("Length of the shadow (m)")
+                    plt.xlim((0,24))
+                    plt.ylim((0,10))
+                    plt.legend(bbox_to_anchor=(0., 1.02, 1., .102), loc=3, ncol=2, mode="expand", borderaxespad=0.)
+                    plt.grid()
+                    plt.show()
+
+
+
+        #    ___              _                                
+        #   / _ \            | |                               
+        #  / /_\ \_ __   __ _| | ___ _ __ ___  _ __ ___   __ _ 
+        #  |  _  | '_ \ / _` | |/ _ \ '_ ` _ \| '_ ` _ \ / _` |
+        #  | | | | | | | (_| | |  __/ | | | | | | | | | | (_| |
+        #  \_| |_/_| |_|\__,_|_|\___|_| |_| |_|_| |_| |_|\__,_|
+        # Draw Sun Analemma at Choosen Location on Earth
+        elif(mode == '7'):
+            while(True):
+                print(">> Plot the Sun Analemma at Choosen Location on Earth")
+                print(">> Please choose a mode you'd like to use!")
+                print("(1) Parameters from User Input")
+                print("(2) Parameters of Predefined Locations")
+                print("(Q) Quit to Main Menu")
+
+                AnalemmaMode = input("> Choose a mode and press enter...: ")
+
+                print('\n')
+
+                # Constants for calculation
+                Planet = "Earth"
+
+                if(AnalemmaMode == '1'):
+                    print(">> Plot Analemma on a User-defined Location\n")
+                    print(">> Give Parameters!")
+
+                    # Input Positional Parameters
+                    print(">> HINT: You can write Latitude as a Decimal Fraction. For this you need to\n>> Write Hours as a float-type value, then you can\n>> Press Enter for both Minutes and Seconds.")
+                    LatitudeHours = float(input("> Latitude (φ) Hours: ") or "0")
+                    LatitudeMinutes = float(input("> Latitude (φ) Minutes: ") or "0")
+                    LatitudeSeconds = float(input("> Latitude (φ) Seconds: ") or "0")
+                    Latitude = LatitudeHours + LatitudeMinutes/60 + LatitudeSeconds/3600
+
+                    print(">> HINT: You can write Longitude as a Decimal Fraction. For this you need to\n>> Write Hours as a float-type value, then you can\n>> Press Enter for both Minutes and Seconds.")
+                    LongitudeHours = float(input("> Longitude (λ) Hours: ") or "0")
+                    LongitudeMinutes = float(input("> Longitude (λ) Minutes: ") or "0")
+                    LongitudeSeconds = float(input("> Longitude (λ) Seconds: ") or "0")
+                    Longitude = LongitudeHours + LongitudeMinutes/60 + LongitudeSeconds/3600
+
+
+                elif(AnalemmaMode == '2'):
+                    print(">> Plot Analemma on a Predefined Location's Coordinates")
+                    print(">> Write the Name of a Choosen Location to the Input!")
+
+                    # Input Choosen Location's Name
+                    while(True):
+                        Location = input("> Location's name (type \'H\' for Help): ")
+
+                        if(Location == "Help" or Location == "help" or Location == "H" or Location == "h"):
+                            print("\n>> Predefined Locations you can choose from:")
+                            for keys in LocationDict.items():
+                                print(keys)
+                            print('\n')
+
+                        else:
+                            try:
+                                Latitude = LocationDict[Location][0]
+                                Longitude = LocationDict[Location][1]
+
+                            except KeyError:
+                                print(">>>> ERROR: The Location, named \"" + Location + "\" is not in the Database!")
+                                print(">>>> Type \"Help\" to list Available Cities in Database!")
+
+                            else:
+                                break
+
+                elif(AnalemmaMode == 'Q' or AnalemmaMode == 'q'):
+                    break
+
+                else:
+                    print(">>>> ERROR: Invalid option! Try Again!")
+
+
+                if(AnalemmaMode == '1' or AnalemmaMode == '2'):
+                    while(True):
+                        print(">> For which Year would You like to Draw the Analemma?")
+                        AnalemmaYear = float(input("> Choosen Year: "))
+                        if(AnalemmaYear != 0):
+                            break
+                        else:
+                            print(">>>> ERROR: Year 0 is not defined! Please write another date!\n")
+
+                    LocalHourAngleAnalemma = []
+                    AltitudesAnalemma = []
+
+                    for LocalDateMonth in range(1, 13):
+                        for LocalDateDay in range(1, MonthLengthList[LocalDateMonth - 1] + 1, 1):
+
+                            LocalHourAngleActual, AltitudeActual = SunAnalemma(Planet, Latitude, Longitude, AnalemmaYear, LocalDateMonth, LocalDateDay)
+
+                            LocalHourAngleAnalemma.append(LocalHourAngleActual + 12)
+                            AltitudesAnalemma.append(AltitudeActual)
+
+                    # Matplotlib is only loaded when a plot is actually drawn
+                    import matplotlib.pyplot as plt
+
+                    # Shadow's length on the ground
+                    if(AnalemmaMode == '1'):
+                        plt.title("Sun Analemma at Cordinates " + str(Latitude) + "; " + str(Longitude))
+
+                    elif(AnalemmaMode == '2'):
+                        plt.title("Sun Analemma at " + Location)
+
+                    plt.plot(LocalHourAngleAnalemma, AltitudesAnalemma, '.')
+
+                    plt.xlabel("Hours (h)")
+                    plt.ylabel("Altitude of Sun (°)")
+                    plt.xlim((12.0,12.1))
+                    plt.grid()
+                    plt.show()
+
+
+
+        #   _   _                                         _    
+        #  | | | |                                       | |   
+        #  | |_| | ___  _ __ ___   _____      _____  _ __| | __
+        #  |  _  |/ _ \| '_ ` _ \ / _ \ \ /\ / / _ \| '__| |/ /
+        #  | | | | (_) | | | | | |  __/\ V  V / (_) | |  |   < 
+        #  \_| |_/\___/|_| |_| |_|\___| \_/\_/ \___/|_|  |_|\_\
+        # HOMEWORK MODE
+        elif(mode == 'Home' or mode == 'home' or mode == 'H' or mode == 'h' or sys.argv[0] == "H" or sys.argv[0] == "h"):
+
+            print("###  Csillesz II end-semester homework results, solved by the program  ###")
+            print("_________________________________________________________________________")
+
+            print("1.1/1.\n")
+
+            Location = "Szombathely"
+            Longitude = LocationDict[Location][1]
+            LocalDateYear = 2017
+            LocalDateMonth = 12
+            LocalDateDay = 27
+            LocalHours = 14
+            LocalMinutes = 0
+            LocalSeconds = 0
+            LocalSiderealHours, LocalSiderealMinutes, LocalSiderealSeconds, UnitedHours, UnitedMinutes, UnitedSeconds, GreenwichSiderealHours, GreenwichSiderealMinutes, GreenwichSiderealSeconds = LocalSiderealTimeCalc(Longitude, LocalHours, LocalMinutes, LocalSeconds, LocalDateYear, LocalDateMonth, LocalDateDay)
+
+            print(">>> Calculate LMST at " + Location + ", at " + str(LocalHours) + ":" + str(LocalMinutes) + ":" + str(LocalSeconds) + " LT, " + str(LocalDateYear) + "." + str(LocalDateMonth) + "." + str(LocalDateDay))
+            print(">>> Used formulas:")
+            print(">>> 1. S_0 (Greenwich Mean Sidereal Time) at 00:00 UT was calculated")
+            print(">>> 2. S (Local Mean Sidereal Time) = S_0 + Longitude/15 + dS * UnitedTime\n")
+
+            sidmsg = ">>> The Local Mean Sidereal Time at {0}:{1}:{2} UT\n>>> in {3} with\n>>> {4}:{5}:{6} GMST at 00:00:00 UT\n>>> is {7}:{8}:{9}\n"
+            print(sidmsg.format(UnitedHours, UnitedMinutes, UnitedSeconds, Location, GreenwichSiderealHours, GreenwichSiderealMinutes, GreenwichSiderealSeconds, LocalSiderealHours, LocalSiderealMinutes, LocalSiderealSeconds))
+            print("_________________________________________________________________________")
+
+            print("1.1/2.\n")
+
+            Location = "Szeged"
+            Latitude = LocationDict[Location][0]
+            RightAscensionVenus = 18 + 41/60 + 54/3600
+            DeclinationVenus = -(24 + 4/60 + 9/3600)
+            Altitude, Azimuth1, Azimuth2, H_dil = EquIToHor(Latitude, RightAscensionVenus, DeclinationVenus, 0, None, None)
+
+            print(">>> Calculate Rising and Setting Local Time of Venus,\n>>> As seen from " + Location + ".")
+            print(">>> Used formulas:")
+            print(">>> 1. First let's calculate LHA:\n>>> cos(H) = (sin(m) - sin(δ) * sin(φ)) / cos(δ) * cos(φ)")
+            print(">>> 2. arccos(x) has two correct output on this interval.\n>>> One if them will be the Rising, the other is\n>>> The Setting Local Hour Angle: LHA2 = -LHA1")
+            print(">>> 3. We calculate Azimuth for both Local Hour Angle.\n>>> For each one, we use 2 equations to determine the correct output:")
+            print(">>> a) sin(A) = - sin(H) * cos(δ) / cos(m)\n>>> b) cos(A) = (sin(δ) - sin(φ) * sin(m)) / (cos(φ) * cos(m))")
+            print(">>> These 2 equation outputs 2-2 values for an Azimuth. 1-1 from both these\n>>> Outputs will be equal, and that's the correct value for one of the Azimuths.\n")        
+
+            # Print Results
+            print(">>> INFO: Available Data are only suited for Calculating Rising or\n>>> Setting Altitudes!")
+            print("\n>>> Calculated Parameter of Rising/Setting Object in Horizontal Coord. Sys.:")
+
+            azimmsg = "Rising and Setting Azimuths (A) are:\n>>> {0:.4f}° and {1:.4f}°"
+            timemsg = "Elapsed time between them: is {0:.2f}h\n"
+            print(azimmsg.format(Azimuth1, Azimuth2))
+            print(timemsg.format(H_dil/15))
+            print("_________________________________________________________________________")
+
+            print("1.1/3.\n")
+
+            Planet = "Earth"
+            Location = "Piszkesteto"
+            Latitude = LocationDict[Location][0]
+            Longitude = LocationDict[Location][1]
+            LocalDateYear = 2018
+            LocalDateMonth = 12
+            LocalDateDay1 = 21
+            LocalDateDay2 = 22
+
+            (LocalHoursNoon1, LocalMinutesNoon1, LocalSecondsNoon1, LocalDateYearNoon1, LocalDateMonthNoon1, LocalDateDayNoon1,
+                LocalHoursMidnight1, LocalMinutesMidnight1, LocalSecondsMidnight1, LocalDateYearMidnight1, LocalDateMonthMidnight1, LocalDateDayMidnight1,
+                LocalHoursRiseDaylight1, LocalMinutesRiseDaylight1, LocalSecondsRiseDaylight1, LocalDateYearRiseDaylight1, LocalDateMonthRiseDaylight1, LocalDateDayRiseDaylight1,
+                LocalHoursSetDaylight1, LocalMinutesSetDaylight1, LocalSecondsSetDaylight1, LocalDateYearSetDaylight1, LocalDateMonthSetDaylight1, LocalDateDaySetDaylight1,
+                LocalHoursRiseCivil1, LocalMinutesRiseCivil1, LocalSecondsRiseCivil1, LocalDateYearRiseCivil1, LocalDateMonthRiseCivil1, LocalDateDayRiseCivil1,
+                LocalHoursSetCivil1, LocalMinutesSetCivil1, LocalSecondsSetCivil1, LocalDateYearSetCivil1, LocalDateMonthSetCivil1, LocalDateDaySetCivil1,
+                LocalHoursRiseNaval1, LocalMinutesRiseNaval1, LocalSecondsRiseNaval1, LocalDateYearRiseNaval1, LocalDateMonthRiseNaval1, LocalDateDayRiseNaval1,
+                LocalHoursSetNaval1, LocalMinutesSetNaval1, LocalSecondsSetNaval1, LocalDateYearSetNaval1, LocalDateMonthSetNaval1, LocalDateDaySetNaval1,
+                LocalHoursRiseAstro1, LocalMinutesRiseAstro1, LocalSecondsRiseAstro1, LocalDateYearSetAstro1, LocalDateMonthSetAstro1, LocalDateDaySetAstro1,
+                LocalHoursSetAstro1, LocalMinutesSetAstro1, LocalSecondsSetAstro1, LocalDateYearRiseAstro1, LocalDateMonthRiseAstro1, LocalDateDayRiseAstro1) = TwilightCalc(Planet, Latitude, Longitude, LocalDateYear, LocalDateMonth, LocalDateDay1)
+
+            (LocalHoursNoon2, LocalMinutesNoon2, LocalSecondsNoon2, LocalDateYearNoon2, LocalDateMonthNoon2, LocalDateDayNoon2,
+                LocalHoursMidnight2, LocalMinutesMidnight2, LocalSecondsMidnight2, LocalDateYearMidnight2, LocalDateMonthMidnight2, LocalDateDayMidnight2,
+                LocalHoursRiseDaylight2, LocalMinutesRiseDaylight2, LocalSecondsRiseDaylight2, LocalDateYearRiseDaylight2, LocalDateMonthRiseDaylight2, LocalDateDayRiseDaylight2,
+                LocalHoursSetDaylight2, LocalMinutesSetDaylight2, LocalSecondsSetDaylight2, LocalDateYearSetDaylight2, LocalDateMonthSetDaylight2, LocalDateDaySetDaylight2,
+                LocalHoursRiseCivil2, LocalMinutesRiseCivil2, LocalSecondsRiseCivil2, LocalDateYearRiseCivil2, LocalDateMonthRiseCivil2, LocalDateDayRiseCivil2,
+                LocalHoursSetCivil2, LocalMinutesSetCivil2, LocalSecondsSetCivil2, LocalDateYearSetCivil2, LocalDateMonthSetCivil2, LocalDateDaySetCivil2,
+                LocalHoursRiseNaval2, LocalMinutesRiseNaval2, LocalSecondsRiseNaval2, LocalDateYearRiseNaval2, LocalDateMonthRiseNaval2, LocalDateDayRiseNaval2,
+                LocalHoursSetNaval2, LocalMinutesSetNaval2, LocalSecondsSetNaval2, LocalDateYearSetNaval2, LocalDateMonthSetNaval2, LocalDateDaySetNaval2,
+                LocalHoursRiseAstro2, LocalMinutesRiseAstro2, LocalSecondsRiseAstro2, LocalDateYearSetAstro2, LocalDateMonthSetAstro2, LocalDateDaySetAstro2,
+                LocalHoursSetAstro2, LocalMinutesSetAstro2, LocalSecondsSetAstro2, LocalDateYearRiseAstro2, LocalDateMonthRiseAstro2, LocalDateDayRiseAstro2) = TwilightCalc(Planet, Latitude, Longitude, LocalDateYear, LocalDateMonth, LocalDateDay2)
+
+            LocalDateDaySetAstroTime1 = LocalHoursSetAstro1 + LocalMinutesSetAstro1/60 + LocalSecondsSetAstro1/3600
+            LocalDateDayRiseAstroTime2 = LocalHoursRiseAstro2 + LocalMinutesRiseAstro2/60 + LocalSecondsRiseAstro2/3600
+
+            print(">>> Calculate lenght of Astronomical Twilight at " + Location + " on\n>>> " + str(LocalDateYear) + "." + str(LocalDateMonth) + "." + str(LocalDateDay2) + " evening.")
+            print(">>> Used formulas:")
+            print(">>> 1. Sun's position for given day was calculated (RA and δ)")
+            print(">>> 2. Julian Date of the Begind/End of Astrological Twilights\n>>> Was been calculated.")
+            print(">>> 3. Julian Date was converted to United Time (UT), then Local Time (LT)\n>>> Was calculated for " + Location + "\n")
+
+            # Length of the astronomical night
+            AstroNightLength = 24 - (LocalDateDaySetAstroTime1 - LocalDateDayRiseAstroTime2)
+            AstroNightHours = int(AstroNightLength)
+            AstroNightMinutes = int((AstroNightLength - AstroNightHours) * 60)
+            AstroNightSeconds = int((((AstroNightLength - AstroNightHours) * 60) - AstroNightMinutes) * 60)
+
+            astrosetmsg = ">>> End of Astronomical Twilight on {0}.{1}.{2} is at {3}:{4}:{5}"
+            astrorisemsg = ">>> Begin of Astronomical Twilight on {0}.{1}.{2} is at {3}:{4}:{5}"
+            astrotimemsg = ">>> The astronomical night's lenght at " + Location + " is {0}:{1}:{2} long\n>>> In the night, between {3}.{4}.{5}, and {6}.\n"
+            print(astrosetmsg.format(LocalDateYear, LocalDateMonth, LocalDateDay1, LocalHoursSetAstro1, LocalMinutesSetAstro1, LocalSecondsSetAstro1))
+            print(astrorisemsg.format(LocalDateYear, LocalDateMonth, LocalDateDay2, LocalHoursRiseAstro2, LocalMinutesRiseAstro2, LocalSecondsRiseAstro2))
+            print(astrotimemsg.format(AstroNightHours, AstroNightMinutes, AstroNightSeconds, LocalDateYear, LocalDateMonth, LocalDateDay1, LocalDateDay2))
+            print("_________________________________________________________________________")
+
+            print("1.2/1.\n")
+
+            aValue = 54.3666666
+            bValue = 72.2
+            cValue = 0
+            alphaValue = 0
+            betaValue = 0
+            gammaValue = 94.01666666
+
+            aValue, bValue, cValue, alphaValue, betaValue, gammaValue = AstroTriangles(aValue, bValue, cValue, alphaValue, betaValue, gammaValue)
+
+            print(">>> Used formulas:")
+            print(">>> The program uses formulas, which may be derived using vector algebra")
+            print(">>> Given parameters: side \'A\', side \'B\' and angle \'γ\'")
+            print(">>> C = arctan( sqrt(\n    (sin(A) * cos(B) - cos(A) * sin(B) * cos(γ))^2 + (sin(B) * sin(γ))^2 ) /\n    (cos(A) * cos(B) + sin(A) * sin(B) * cos(γ)) )")
+            print(">>> α = arctan(\n    (sin(A) * sin(γ)) / (sin(B) * cos(A) - cos(B) * sin(A) * cos(γ))\n    )")
+            print(">>> β = arctan(\n    (sin(B) * sin(γ)) / (sin(A) * cos(B) - cos(A) * sin(B) * cos(γ))\n    )")
+
+            print(">>> Calculated Parameters of the Triangle:")
+            print(">>> Side \'A\': ", aValue)
+            print(">>> Side \'B\': ", bValue)
+            print(">>> Side \'C\': ", cValue)
+            print(">>> Angle \'α\': ", alphaValue)
+            print(">>> Angle \'β\': ", betaValue)
+            print(">>> Angle \'γ\': ", gammaValue)
+            print("\n")
+
+            print("_________________________________________________________________________")
+
+            print("1.2/2.\n")
+
+            Location = "Baja"
+            Star = "Altair"
+            Latitude = LocationDict[Location][0]
+            Longitude = LocationDict[Location][1]
+            RightAscension = StellarDict[Star][0]
+            Declination = StellarDict[Star][1]
+            Altitude = None
+            Azimuth = None
+            LocalHourAngle = None
+            LocalHours = 20
+            LocalMinutes = 45
+            LocalSeconds = 0
+            LocalDateYear = 2013
+            LocalDateMonth = 6
+            LocalDateDay = 21
+
+            # Calculate Local Mean Sidereal Time
+            LocalSiderealHours, LocalSiderealMinutes, LocalSiderealSeconds, UnitedHours, UnitedMinutes, UnitedSeconds, GreenwichSiderealHours, GreenwichSiderealMinutes, GreenwichSiderealSeconds = LocalSiderealTimeCalc(Longitude, LocalHours, LocalMinutes, LocalSeconds, LocalDateYear, LocalDateMonth, LocalDateDay)
+
+            # Convert to decimal
+            LocalSiderealTime = LocalSiderealHours + LocalSiderealMinutes/60 + LocalSiderealSeconds/3600
+
+            # Normalize result
+            LocalSiderealTime = NormalizeZeroBounded(LocalSiderealTime, 24)
+
+            Altitude, Azimuth = EquIIToHor(Latitude, RightAscension, Declination, Altitude, Azimuth, LocalSiderealTime, LocalHourAngle)
+
+            # For printing this step too
+            LocalHourAngle = LocalSiderealTime - RightAscension
+            # Normalize Result
+            LocalHourAngle = NormalizeZeroBounded(LocalHourAngle, 24)
+
+            LocalHourAngleHours = int(LocalHourAngle)
+            LocalHourAngleMinutes = int((LocalHourAngle - LocalHourAngleHours) * 60)
+            LocalHourAngleSeconds = int((((LocalHourAngle - LocalHourAngleHours) * 60) - LocalHourAngleMinutes) * 60)
+
+            AzimuthHours = int(Azimuth)
+            AzimuthMinutes = int((Azimuth - AzimuthHours) * 60)
+            AzimuthSeconds = int((((Azimuth - AzimuthHours) * 60) - AzimuthMinutes) * 60)
+
+            AltitudeHours = int(Altitude)
+            AltitudeMinutes = int((Altitude - AltitudeHours) * 60)
+            AltitudeSeconds = int((((Altitude - AltitudeHours) * 60) - AltitudeMinutes) * 60)
+
+            print(">>> Used formulas:")
+            print(">>> 1. S_0 (Greenwich Mean Sidereal Time) at 00:00 UT was calculated")
+            print(">>> 2. S (Local Mean Sidereal Time) = S_0 + Longitude/15 + dS * UnitedTime")
+            print(">>> 3. S - α = t; H = 15*t")
+            print(">>> 4. sin(m) = sin(δ) * sin(φ) + cos(δ) * cos(φ) * cos(H);\n>>> Altitude (m) should been between [-π/2,+π/2]")
+            print(">>> 5. sin(A) = - sin(H) * cos(δ) / cos(m), Azimuth at given H hour angle\n>>> Also cos(A) = (sin(δ) - sin(φ) sin(m)) / cos(φ) cos(m)")
+            print(">>> These 2 equation outputs 2-2 values for Azimuth. 1-1 from both these\n>>> Outputs will be equal, and that's the correct value for Azimuth.\n")
+
+            # Print Results
+            timemsg = ">>> Altitude and Azimuth of " + Star + " from " + Location + " on {0}.{1}.{2}"
+            grwmsg = ">>> GMST: {0}:{1}:{2}"
+            print(timemsg.format(LocalDateYear, LocalDateMonth, LocalDateDay))
+            print(grwmsg.format(GreenwichSiderealHours, GreenwichSiderealMinutes, GreenwichSiderealSeconds))
+
+            print(">>> Calculated Parameters:")
+            locsidmsg = ">>> Local Mean Siderel Time (S): {0}:{1}:{2}"
+            lhamsg = ">>> Local Hour Angle (t): {0}h {1}m {2}s"
+            azimmsg = ">>> Azimuth (A):  {0}° {1}' {2}\""
+            altitmsg = ">>> Altitude (m): {0}° {1}' {2}\"\n"
+            print(locsidmsg.format(LocalSiderealHours, LocalSiderealMinutes, LocalSiderealSeconds))
+            print(lhamsg.format(LocalHourAngleHours, LocalHourAngleMinutes, LocalHourAngleSeconds))
+            print(azimmsg.format(AzimuthHours, AzimuthMinutes, AzimuthSeconds))
+            print(altitmsg.format(AltitudeHours, AltitudeMinutes, AltitudeSeconds))
+
+            print("_________________________________________________________________________")
+
+            print("1.2/3.\n")
+
+            Location = "Rio"
+            Latitude = LocationDict[Location][0]
+            Longitude = LocationDict[Location][1]
+
+            Altitude = 55.656388
+            Azimuth = 208.113611
+
+            LocalHours = 20
+            LocalMinutes = 34
+            LocalSeconds = 53
+            LocalDateYear = 2018
+            LocalDateMonth = 4
+            LocalDateDay = 17
+
+            LocalSiderealHours, LocalSiderealMinutes, LocalSiderealSeconds, UnitedHours, UnitedMinutes, UnitedSeconds, GreenwichSiderealHours, GreenwichSiderealMinutes, GreenwichSiderealSeconds = LocalSiderealTimeCalc(Longitude, LocalHours, LocalMinutes, LocalSeconds, LocalDateYear, LocalDateMonth, LocalDateDay)
+
+            # Convert to decimal
+            LocalSiderealTime = LocalSiderealHours + LocalSiderealMinutes/60 + LocalSiderealSeconds/3600
+
+            # Normalize result
+            LocalSiderealTime = NormalizeZeroBounded(LocalSiderealTime, 24)
+
+            Declination, RightAscension, LocalSiderealTime = HorToEquII(Latitude, Altitude, Azimuth, LocalSiderealTime)
+
+            # Normalize Parameters
+            DeclinationHours = int(Declination)
+            DeclinationMinutes = int((Declination - DeclinationHours) * 60)
+            DeclinationSeconds = int((((Declination - DeclinationHours) * 60) - DeclinationMinutes) * 60)
+
+            RightAscensionHours = int(RightAscension)
+            RightAscensionMinutes = int((RightAscension - RightAscensionHours) * 60)
+            RightAscensionSeconds = int((((RightAscension - RightAscensionHours) * 60) - RightAscensionMinutes) * 60)
+
+            LocalSiderealTimeHours = int(LocalSiderealTime)
+            LocalSiderealTimeMinutes = int((LocalSiderealTime - LocalSiderealTimeHours) * 60)
+            LocalSiderealTimeSeconds = int((((LocalSiderealTime - LocalSiderealTimeHours) * 60) - LocalSiderealTimeMinutes) * 60)
+
+            print("Calculate a star's equatorial II coordinates (S and δ) from Horizontal coords.")
+            print("Used Formulas:")
+            print(">>> 1. S_0 (Greenwich Mean Sidereal Time) at 00:00 UT was calculated")
+            print(">>> 2. S (Local Mean Sidereal Time) = S_0 + Longitude/15 + dS * UnitedTime")
+            print(">>> 3. Declination was calculated:\n>>> sin(δ) = sin(m) * sin(φ) + cos(m) * cos(φ) * cos(A)")
+            print(">>> 4. Local Hour Angle was calculated with two equations:\n>>> a) sin(H) = - sin(A) * cos(m) / cos(δ)\n>>> b) cos(H) = (sin(m) - sin(δ) * sin(φ)) / cos(δ) * cos(φ)")
+            print(">>> These 2 equations outputs 2-2 values for Local Hour Angle. 1-1 from both\n>>> These outputs will be equal, and that's the correct value for LHA.")
+            print(">>> 5. Right Ascension was also calculated: RA = S - t; t = 15 * H\n")
+
+            print(">>> Initial Coordinates:")
+            print(">>> Azimuth: ", Azimuth)
+            print(">>> Altitude: ", Altitude)
+
+            equIImsg = "\n>>> Calculated Parameters of the Star in Equatorial II Coord. Sys. from {0}:"
+            print(equIImsg.format(Location))
+
+            grwmsg = "GMST: {0}:{1}:{2}" 
+            declinmsg = "Declination (δ): {0}° {1}\' {2}\""
+            RAmsg = "Right Ascension (α): {0}h {1}m {2}s"
+            sidermsg = "Local Mean Sidereal Time (S): {0}:{1}:{2}\n"
+            print(grwmsg.format(GreenwichSiderealHours, GreenwichSiderealMinutes, GreenwichSiderealSeconds))
+            print(declinmsg.format(DeclinationHours, DeclinationMinutes, DeclinationSeconds))
+            print(RAmsg.format(RightAscensionHours, RightAscensionMinutes, RightAscensionSeconds))
+            print(sidermsg.format(LocalSiderealTimeHours, LocalSiderealTimeMinutes, LocalSiderealTimeSeconds))
+
+            print("_________________________________________________________________________")
+
+            print("1.3\n")
+
+            print(">>> For the Sundial, do the following:")
+            print(">>> 1. Choose mode \'6\'")
+            print(">>> 2. Choose eg. Predefined Locations with option \'2\'")
+            print(">>> 3. Write eg. \'Budapest\'")
+            print(">>> 4. Year = 2018")
+            print(">>> 5. Select \'N\' for \'Choosen Date\'")
+            print(">>> The graph shows the Sun's path on the sky at daylight, which will be\n>>> Projected on the ground, eg. on a Sundial.")
+            print(">>> It also shows, that shadows are longer in Winter, and\n>>> Shorter in Summer. In March and September, the shadows'\n>>> Length are in-between these two.\n\n")
+
+
+        # MAIN MENU MODE
+        # QUIT PROGRAM
+        elif(mode == 'Q' or mode == 'q'):
+            print("####    Developed by Balazs Pal, ELTE    ####")
+            exit()
+
+        else:
+            print(">>>> ERROR: Invalid option! Try Again!")
+
+
+if __name__ == "__main__":
+    main()
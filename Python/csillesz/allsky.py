@@ -0,0 +1,80 @@
+################################################################
+########                                                ########
+########     ALL-SKY CAMERA PIXEL GRID TO RA/DEC MAPS   ########
+########                                                ########
+################################################################
+
+# Pixels of a fixed all-sky camera always look at the same (m, A)
+# Horizontal coordinates, so their Declinations (δ) and Local Hour Angles
+# (t) are also fixed (see HorToEquI()). Only the Right Ascension depends
+# on the time of the exposure:
+# α = S - t
+# So the trigonometry is calculated once per camera geometry, and every
+# frame only needs one subtraction per pixel
+
+import numpy as np
+
+from .batch import HorToEquIBatch
+
+
+# Horizontal coordinates of the pixels of an equidistant fisheye image
+# (m = 90° - r/Radius * 90°, r is the distance from the center of the image)
+# AzimuthOffset is the Azimuth of the image's upward direction, and Azimuth
+# increases counter-clockwise on the image if Mirrored is True (looking up
+# at the sky), clockwise otherwise
+# Pixels outside Radius are NaN
+def FisheyeAltAzGrid(Width, Height, CenterX, CenterY, Radius, AzimuthOffset=0, Mirrored=True, DType=np.float32):
+
+    y, x = np.mgrid[0:Height, 0:Width].astype(np.float64)
+    dx = x - CenterX
+    dy = CenterY - y
+
+    Distance = np.hypot(dx, dy)
+    Altitude = 90 - Distance / Radius * 90
+
+    Azimuth = np.degrees(np.arctan2(dx, dy))
+    if(Mirrored):
+        Azimuth = - Azimuth
+    Azimuth = np.mod(Azimuth + AzimuthOffset, 360)
+
+    Outside = Distance > Radius
+    Altitude[Outside] = np.nan
+    Azimuth[Outside] = np.nan
+
+    return(Altitude.astype(DType), Azimuth.astype(DType))
+
+# Calculate the fixed Equatorial I coordinates of the pixels
+# Run it once per camera geometry (Latitude and alt/az grid)
+# Returns (Declination, LocalHourAngle) maps
+def AllSkyPrecalculations(Latitude, Altitude, Azimuth, DType=np.float32):
+
+    Declination, LocalHourAngle, RightAscension = HorToEquIBatch(Latitude, Altitude, Azimuth)
+
+    return(Declination.astype(DType), LocalHourAngle.astype(DType))
+
+# Right Ascension map of a frame, taken at LocalSiderealTime
+# α = S - t, Right Ascension: [0h,24h[
+# Out can be a preallocated array of the maps' shape, to avoid allocating
+# a new map for every frame
+def AllSkyRightAscensionMap(LocalHourAngle, LocalSiderealTime, Out=None):
+
+    # LMST: [0h,24h[
+    # Both S and t are in [0h,24h[, so S - t is in ]-24h,24h[, and adding 24h
+    # to the negative values is enough (and much faster, than numpy.mod())
+    LocalSiderealTime = LocalHourAngle.dtype.type(LocalSiderealTime % 24)
+
+    Out = np.subtract(LocalSiderealTime, LocalHourAngle, out=Out)
+    np.add(Out, 24, out=Out, where=Out < 0)
+
+    return(Out)
+
+# RA/Dec maps of a series of frames, taken at LocalSiderealTimes
+# The Declination map is the same for every frame, and the same Right
+# Ascension array is reused (overwritten) for every frame, so copy it if
+# it's needed later
+def AllSkyRADecMaps(Declination, LocalHourAngle, LocalSiderealTimes):
+
+    RightAscension = np.empty_like(LocalHourAngle)
+
+    for LocalSiderealTime in LocalSiderealTimes:
+        yield(AllSkyRightAscensionMap(LocalHourAngle, LocalSiderealTime, Out=RightAscension), Declination)
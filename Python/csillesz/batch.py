@@ -0,0 +1,236 @@
+################################################################
+########                                                ########
+########      BATCH (NUMPY) COORDINATE CONVERSIONS      ########
+########                                                ########
+################################################################
+
+# Vectorized counterparts of the scalar functions in core.py
+# Every parameter can be a scalar or an array, arrays are broadcasted
+# against each other, eg. Latitude of shape (M,1) and Right Ascension
+# of shape (N,) give results with the shape of (M,N)
+
+import numpy as np
+
+from .catalog import StarCatalog
+from .core import ObserverContext, StellarDict
+
+
+################################################################
+########                                                ########
+########               UTILITY FUNCTIONS                ########
+########                                                ########
+################################################################
+
+# Normalization with Bound [0,NonZeroBound[
+def NormalizeZeroBoundedArray(Parameter, NonZeroBound):
+
+    return(np.mod(np.asarray(Parameter, dtype=float), NonZeroBound))
+
+# Normalization Between to [-π,+π]
+def NormalizeSymmetricallyBoundedPIArray(Parameter):
+
+    Parameter = NormalizeZeroBoundedArray(Parameter, 360)
+    Parameter = np.where(Parameter > 180, Parameter - 360, Parameter)
+
+    return(Parameter)
+
+# Normalization Between to [-π/2,+π/2]
+def NormalizeSymmetricallyBoundedPI_2Array(Parameter):
+
+    Parameter = NormalizeZeroBoundedArray(Parameter, 360)
+    Parameter = np.where((Parameter > 90) & (Parameter <= 270), 180 - Parameter, Parameter)
+    Parameter = np.where(Parameter > 270, Parameter - 360, Parameter)
+
+    return(Parameter)
+
+# Latitude (φ) normalized to [-π,+π], and its sine and cosine as arrays
+# Latitude can also be an ObserverContext, then nothing is recalculated
+def SiteTrigonometryArray(Latitude):
+
+    if(isinstance(Latitude, ObserverContext)):
+        return(np.float64(Latitude.Latitude), Latitude.sinLatitude, Latitude.cosLatitude)
+
+    Latitude = NormalizeSymmetricallyBoundedPIArray(Latitude)
+    LatitudeRadians = np.radians(Latitude)
+
+    return(Latitude, np.sin(LatitudeRadians), np.cos(LatitudeRadians))
+
+# Right Ascensions and Declinations
+# RightAscension can also be a StarCatalog (or a slice of one), then
+# Declination should be None
+def CatalogCoordinates(RightAscension, Declination):
+
+    if(isinstance(RightAscension, StarCatalog)):
+        return(RightAscension.RightAscension, RightAscension.Declination)
+
+    return(RightAscension, Declination)
+
+# Names, Right Ascensions and Declinations of a stellar dictionary as arrays
+# Format of the dictionary is the same as StellarDict's, or it's a StarCatalog
+def StellarArrays(Stars=StellarDict):
+
+    if(isinstance(Stars, StarCatalog)):
+        return(Stars.Names, Stars.RightAscension, Stars.Declination)
+
+    Names = np.array(list(Stars.keys()))
+    Coordinates = np.array(list(Stars.values()), dtype=float).reshape(-1, 2)
+
+    return(Names, Coordinates[:,0], Coordinates[:,1])
+
+
+
+################################################################
+########                                                ########
+########      1. CONVERSION OF COORDINATE SYSTEMS       ########
+########                                                ########
+################################################################
+
+# 1. Horizontal to Equatorial I
+# Same as HorToEquI()
+def HorToEquIBatch(Latitude, Altitude, Azimuth, LocalSiderealTime=None):
+
+    # Initial Data Normalization
+    # Latitude: [-π,+π]
+    # Altitude: [-π/2,+π/2]
+    # Azimuth: [0,+2π[
+    Latitude, sinLat, cosLat = SiteTrigonometryArray(Latitude)
+    AltitudeRadians = np.radians(NormalizeSymmetricallyBoundedPI_2Array(Altitude))
+    AzimuthRadians = np.radians(NormalizeZeroBoundedArray(Azimuth, 360))
+
+    sinAlt = np.sin(AltitudeRadians)
+    cosAlt = np.cos(AltitudeRadians)
+    sinAz = np.sin(AzimuthRadians)
+    cosAz = np.cos(AzimuthRadians)
+
+    # Calculate Declination (δ)
+    # sin(δ) = sin(m) * sin(φ) + cos(m) * cos(φ) * cos(A)
+    Declination = np.degrees(np.arcsin(np.clip(sinAlt * sinLat + cosAlt * cosLat * cosAz, -1, 1)))
+
+    # Calculate Local Hour Angle in Degrees (H)
+    # sin(H) * cos(δ) = - sin(A) * cos(m)
+    # cos(H) * cos(δ) = sin(m) * cos(φ) - cos(m) * sin(φ) * cos(A)
+    LocalHourAngleDegrees = np.degrees(np.arctan2(- sinAz * cosAlt, sinAlt * cosLat - cosAlt * sinLat * cosAz))
+
+    # Normalize result [0,+2π[ and convert to hours from angles (H -> t)
+    LocalHourAngle = NormalizeZeroBoundedArray(LocalHourAngleDegrees, 360) / 15
+
+    if(LocalSiderealTime is not None):
+        # Calculate Right Ascension (α)
+        # α = S – t
+        RightAscension = NormalizeZeroBoundedArray(LocalSiderealTime, 24) - LocalHourAngle
+    else:
+        RightAscension = None
+
+    return(Declination, LocalHourAngle, RightAscension)
+
+# 2. Horizontal to Equatorial II
+# Same as HorToEquII()
+def HorToEquIIBatch(Latitude, Altitude, Azimuth, LocalSiderealTime):
+
+    # First Convert Horizontal to Equatorial I Coordinates
+    Declination, LocalHourAngle, RightAscension = HorToEquIBatch(Latitude, Altitude, Azimuth, LocalSiderealTime)
+
+    # Convert Equatorial I to Equatorial II
+    # LMST: [0,24h[
+    LocalSiderealTime = NormalizeZeroBoundedArray(LocalHourAngle + RightAscension, 24)
+
+    return(Declination, RightAscension, LocalSiderealTime)
+
+# 3. Equatorial I to Horizontal
+# Same as EquIToHor(), when LocalSiderealTime or LocalHourAngle is given
+# RightAscension can also be a StarCatalog, with Declination = None
+def EquIToHorBatch(Latitude, RightAscension, Declination, LocalSiderealTime=None, LocalHourAngle=None):
+
+    RightAscension, Declination = CatalogCoordinates(RightAscension, Declination)
+
+    if(LocalSiderealTime is None and LocalHourAngle is None):
+        raise ValueError("Either LocalSiderealTime or LocalHourAngle should be given!")
+
+    # Initial Data Normalization
+    # Latitude: [-π,+π]
+    # Declination: [-π/2,+π/2]
+    Latitude, sinLat, cosLat = SiteTrigonometryArray(Latitude)
+    Declination = NormalizeSymmetricallyBoundedPI_2Array(Declination)
+
+    if(LocalSiderealTime is not None):
+        # Right Ascension: [0h,24h[
+        RightAscension = NormalizeZeroBoundedArray(RightAscension, 24)
+        # Calculate Local Hour Angle in Hours (t)
+        # t = S - α
+        # LHA: [0h,24h[
+        LocalHourAngle = NormalizeZeroBoundedArray(np.asarray(LocalSiderealTime, dtype=float) - RightAscension, 24)
+
+    # Convert to angles from hours (t -> H)
+    LocalHourAngleRadians = np.radians(np.asarray(LocalHourAngle, dtype=float) * 15)
+    DeclinationRadians = np.radians(Declination)
+
+    sinDec = np.sin(DeclinationRadians)
+    cosDec = np.cos(DeclinationRadians)
+    sinLHA = np.sin(LocalHourAngleRadians)
+    cosLHA = np.cos(LocalHourAngleRadians)
+
+    # Calculate Altitude (m)
+    # sin(m) = sin(δ) * sin(φ) + cos(δ) * cos(φ) * cos(H)
+    Altsin = np.clip(sinDec * sinLat + cosDec * cosLat * cosLHA, -1, 1)
+    Altitude = np.degrees(np.arcsin(Altsin))
+
+    # Calculate Azimuth (A)
+    # sin(A) * cos(m) = - sin(H) * cos(δ)
+    # cos(A) * cos(m) = sin(δ) * cos(φ) - cos(δ) * sin(φ) * cos(H)
+    # Same as AzimuthFromHourAngle(), arctan2() gives A in the correct quadrant
+    Azimuth = np.degrees(np.arctan2(- sinLHA * cosDec, sinDec * cosLat - cosDec * sinLat * cosLHA))
+
+    # Normalize Azimuth
+    # Azimuth: [0,+2π[
+    Azimuth = NormalizeZeroBoundedArray(Azimuth, 360)
+
+    return(Altitude, Azimuth)
+
+# 3. Equatorial I to Horizontal, rising and setting
+# Same as EquIToHor(), when only Altitude is given
+# Declinations and threshold Altitudes are broadcasted against each other
+# Returns the rising and setting Azimuths, the time above the threshold
+# Altitude in degrees (H_dil) and two masks:
+# Circumpolar: the Object never goes below the threshold (H_dil = 360°)
+# NeverRises: the Object never reaches the threshold (H_dil = 0°)
+# Azimuths of these Objects are NaN
+# Declination can also be a StarCatalog
+def EquIToHorRiseSetBatch(Latitude, Declination, Altitude=0):
+
+    if(isinstance(Declination, StarCatalog)):
+        Declination = Declination.Declination
+
+    # Initial Data Normalization
+    # Latitude: [-π,+π]
+    # Declination: [-π/2,+π/2]
+    # Altitude: [-π/2,+π/2]
+    Latitude, sinLat, cosLat = SiteTrigonometryArray(Latitude)
+    DeclinationRadians = np.radians(NormalizeSymmetricallyBoundedPI_2Array(Declination))
+    AltitudeRadians = np.radians(NormalizeSymmetricallyBoundedPI_2Array(Altitude))
+
+    sinDec = np.sin(DeclinationRadians)
+    cosDec = np.cos(DeclinationRadians)
+
+    # cos(H) = (sin(m) - sin(δ) * sin(φ)) / cos(δ) * cos(φ)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        LHAcos = (np.sin(AltitudeRadians) - sinDec * sinLat) / (cosDec * cosLat)
+    Circumpolar = LHAcos < -1
+    NeverRises = LHAcos > 1
+
+    # The Object rises at -H and sets at +H
+    LocalHourAngleRadians = np.arccos(np.clip(LHAcos, -1, 1))
+    H_dil = 2 * np.degrees(LocalHourAngleRadians)
+
+    # Calculate Azimuths (A), same as AzimuthFromHourAngle()
+    # At rising sin(H) is negative, at setting positive, cos(H) is the same
+    sinLHA = np.sin(LocalHourAngleRadians)
+    cosLHA = np.cos(LocalHourAngleRadians)
+    AzimuthDenominator = sinDec * cosLat - cosDec * sinLat * cosLHA
+    RisingAzimuth = NormalizeZeroBoundedArray(np.degrees(np.arctan2(sinLHA * cosDec, AzimuthDenominator)), 360)
+    SettingAzimuth = NormalizeZeroBoundedArray(np.degrees(np.arctan2(- sinLHA * cosDec, AzimuthDenominator)), 360)
+
+    Undefined = Circumpolar | NeverRises
+    RisingAzimuth = np.where(Undefined, np.nan, RisingAzimuth)
+    SettingAzimuth = np.where(Undefined, np.nan, SettingAzimuth)
+
+    return(RisingAzimuth, SettingAzimuth, H_dil, Circumpolar, NeverRises)
@@ -0,0 +1,303 @@
+################################################################
+########                                                ########
+########         LARGE (MEMORY-MAPPED) STAR CATALOGS    ########
+########                                                ########
+################################################################
+
+# Catalogs are stored in a compact structured array, one record per Object:
+# Name, Right Ascension (α, hours), Declination (δ, degrees), Magnitude
+# (NaN if unknown), proper motions (μ_α * cos(δ) and μ_δ in mas/year, 0 if
+# unknown) and the Equatorial II unit vector of the Object
+# (cos(δ) * cos(α), cos(δ) * sin(α), sin(δ)), see rotation.py
+# Positions are at the J2000.0 epoch, see precession.py for other epochs
+#
+# Catalogs are saved as .npy files and opened memory-mapped (read-only), so
+# worker processes opening the same file share one copy of it in the page
+# cache, and opening a catalog doesn't parse anything
+# Text (CSV) catalogs are parsed once, and saved next to the source file
+#
+# StellarDict stays the default mini-catalog, and StarCatalog can be used
+# in place of it: Catalog["Sirius"] gives [RA, Dec], like StellarDict does
+
+import csv
+import functools
+import hashlib
+import itertools
+import os
+
+import numpy as np
+
+from .core import StellarDict
+
+# Maximal length of the Names in bytes
+NameLength = 32
+
+# Record format of the catalogs
+CatalogDType = np.dtype([("Name", "S{0}".format(NameLength)),
+                         ("RightAscension", np.float64),
+                         ("Declination", np.float64),
+                         ("Magnitude", np.float32),
+                         ("ProperMotionRA", np.float32),
+                         ("ProperMotionDec", np.float32),
+                         ("Vector", np.float64, (3,))])
+
+# Number of rows parsed at once from text catalogs
+ParseChunkSize = 65536
+
+
+################################################################
+########                                                ########
+########                 CATALOG ARRAYS                 ########
+########                                                ########
+################################################################
+
+# Names encoded for a Name field of Length bytes
+# Raises ValueError if a Name doesn't fit into the field, so no Name is
+# ever truncated (which would make it unfindable, or cut a multibyte
+# character)
+def EncodeNames(Names, Length=NameLength):
+
+    Encoded = np.char.encode(np.asarray(Names, dtype=str), "utf-8")
+    TooLong = np.flatnonzero(np.char.str_len(Encoded) > Length)
+    if(TooLong.size):
+        raise ValueError("{0} Names are longer than {1} bytes, eg. {2!r}!".format(TooLong.size, Length, Encoded[TooLong[0]].decode("utf-8")))
+
+    return(Encoded)
+
+# Raises ValueError if an encoded Name occurs more than once
+def _CheckUniqueNames(Encoded):
+
+    UniqueNames, Counts = np.unique(Encoded, return_counts=True)
+    if(np.any(Counts > 1)):
+        Duplicates = UniqueNames[Counts > 1]
+        raise ValueError("{0} Names occur more than once, eg. {1!r}!".format(Duplicates.size, Duplicates[0].decode("utf-8")))
+
+# Structured catalog array from Names, Right Ascensions in hours,
+# Declinations in degrees and optionally Magnitudes and proper motions
+# Raises ValueError if a Name is too long (see EncodeNames()) or if it
+# occurs more than once, since Names identify the Objects
+def CatalogRecords(Names, RightAscension, Declination, Magnitude=None, ProperMotionRA=None, ProperMotionDec=None):
+
+    RightAscension = np.asarray(RightAscension, dtype=float)
+    Declination = np.asarray(Declination, dtype=float)
+
+    Encoded = EncodeNames(Names)
+    _CheckUniqueNames(Encoded)
+
+    Records = np.zeros(RightAscension.size, dtype=CatalogDType)
+    Records["Name"] = Encoded
+    Records["RightAscension"] = RightAscension
+    Records["Declination"] = Declination
+    Records["Magnitude"] = np.nan if Magnitude is None else Magnitude
+    Records["ProperMotionRA"] = 0 if ProperMotionRA is None else ProperMotionRA
+    Records["ProperMotionDec"] = 0 if ProperMotionDec is None else ProperMotionDec
+
+    RightAscensionRadians = np.radians(RightAscension * 15)
+    DeclinationRadians = np.radians(Declination)
+    cosDec = np.cos(DeclinationRadians)
+    Records["Vector"] = np.stack((cosDec * np.cos(RightAscensionRadians), cosDec * np.sin(RightAscensionRadians), np.sin(DeclinationRadians)), axis=-1)
+
+    return(Records)
+
+# A catalog, or a slice of one
+# Slicing (Catalog[1000:2000], Catalog[Mask]) gives a StarCatalog again,
+# and plain slices of memory-mapped catalogs stay memory-mapped
+class StarCatalog:
+
+    def __init__(self, Records):
+
+        self.Records = Records
+        self._NameIndex = None
+
+    # Catalog from a dictionary with the format of StellarDict
+    @classmethod
+    def FromDict(cls, Stars=StellarDict):
+
+        Coordinates = np.array(list(Stars.values()), dtype=float).reshape(-1, 2)
+
+        return(cls(CatalogRecords(list(Stars.keys()), Coordinates[:,0], Coordinates[:,1])))
+
+    def __len__(self):
+
+        return(self.Records.shape[0])
+
+    def __repr__(self):
+
+        return("StarCatalog({0} Objects)".format(len(self)))
+
+    # Catalog["Name"] gives [RA, Dec] (like StellarDict), anything else
+    # (slices, masks, index arrays) gives a StarCatalog
+    def __getitem__(self, Key):
+
+        if(isinstance(Key, str)):
+            Record = self.Records[self.Lookup(Key)]
+            return([float(Record["RightAscension"]), float(Record["Declination"])])
+
+        return(StarCatalog(np.atleast_1d(self.Records[Key])))
+
+    def __contains__(self, Name):
+
+        return(self._Index().get(Name.encode("utf-8")) is not None)
+
+    # Hash index of the Names, built on the first lookup
+    def _Index(self):
+
+        if(self._NameIndex is None):
+            self._NameIndex = dict(zip(self.Records["Name"].tolist(), range(len(self))))
+
+        return(self._NameIndex)
+
+    # Index of an Object in the catalog
+    # Raises KeyError if the Object is not in the catalog
+    def Lookup(self, Name):
+
+        Index = self._Index().get(Name.encode("utf-8"))
+        if(Index is None):
+            raise KeyError(Name)
+
+        return(Index)
+
+    @property
+    def Names(self):
+
+        return(np.char.decode(self.Records["Name"], "utf-8", "replace"))
+
+    @property
+    def RightAscension(self):
+
+        return(self.Records["RightAscension"])
+
+    @property
+    def Declination(self):
+
+        return(self.Records["Declination"])
+
+    @property
+    def Magnitude(self):
+
+        return(self.Records["Magnitude"])
+
+    @property
+    def ProperMotionRA(self):
+
+        return(self.Records["ProperMotionRA"])
+
+    @property
+    def ProperMotionDec(self):
+
+        return(self.Records["ProperMotionDec"])
+
+    @property
+    def Vectors(self):
+
+        return(self.Records["Vector"])
+
+# The built-in StellarDict as a StarCatalog
+@functools.lru_cache(maxsize=1)
+def DefaultCatalog():
+
+    return(StarCatalog.FromDict(StellarDict))
+
+
+
+################################################################
+########                                                ########
+########           SAVING AND OPENING CATALOGS          ########
+########                                                ########
+################################################################
+
+# Save a catalog (StarCatalog or structured array) as a .npy file
+def SaveCatalog(Catalog, FileName):
+
+    Records = Catalog.Records if isinstance(Catalog, StarCatalog) else Catalog
+    np.save(FileName, np.asarray(Records, dtype=CatalogDType), allow_pickle=False)
+
+# Open a saved .npy catalog memory-mapped (read-only)
+def OpenCatalog(FileName):
+
+    Records = np.load(FileName, mmap_mode="r", allow_pickle=False)
+    if(Records.dtype != CatalogDType):
+        raise ValueError("{0} is not a catalog file!".format(FileName))
+
+    return(StarCatalog(Records))
+
+# Values of an optional column of parsed rows, empty fields are Missing
+def _OptionalColumn(Rows, Column, Missing):
+
+    if(Column is None):
+        return(None)
+
+    return(np.array([Row[Column] or Missing for Row in Rows], dtype=np.float32))
+
+# Whether a .npy file is a catalog of the actual format
+def _IsCatalogFile(FileName):
+
+    try:
+        return(np.load(FileName, mmap_mode="r", allow_pickle=False).dtype == CatalogDType)
+    except ValueError:
+        return(False)
+
+# Parse a delimited text (CSV) catalog
+# Raises ValueError if a Name is too long or occurs more than once
+# Columns are the column indices of the Name, Right Ascension (hours),
+# Declination (degrees), Magnitude, and optionally of the proper motions
+# μ_α * cos(δ) and μ_δ (mas/year). Missing columns are None
+def ReadTextCatalog(FileName, Delimiter=",", SkipRows=0, Columns=(0, 1, 2, None)):
+
+    Columns = tuple(Columns) + (None,) * (6 - len(Columns))
+    NameColumn, RightAscensionColumn, DeclinationColumn = Columns[:3]
+
+    Chunks = []
+    with open(FileName, newline="", encoding="utf-8") as File:
+        Rows = csv.reader(itertools.islice(File, SkipRows, None), delimiter=Delimiter)
+
+        while(True):
+            Chunk = list(itertools.islice(Rows, ParseChunkSize))
+            if(not Chunk):
+                break
+
+            Chunk = [Row for Row in Chunk if Row]
+            Names = [Row[NameColumn].strip() for Row in Chunk]
+            RightAscension = [Row[RightAscensionColumn] for Row in Chunk]
+            Declination = [Row[DeclinationColumn] for Row in Chunk]
+            Magnitude, ProperMotionRA, ProperMotionDec = [_OptionalColumn(Chunk, Column, Missing) for Column, Missing in zip(Columns[3:], (np.nan, 0, 0))]
+
+            Chunks.append(CatalogRecords(Names, np.array(RightAscension, dtype=float), np.array(Declination, dtype=float), Magnitude, ProperMotionRA, ProperMotionDec))
+
+    if(not Chunks):
+        return(StarCatalog(np.zeros(0, dtype=CatalogDType)))
+
+    # Names have to be unique in the whole catalog, not only in the chunks
+    Records = np.concatenate(Chunks)
+    _CheckUniqueNames(Records["Name"])
+
+    return(StarCatalog(Records))
+
+# Name of the parsed (.npy) cache of a text file
+# The parsing parameters are hashed into the name, so a file parsed with
+# other parameters (eg. other Columns) gets another cache
+def CacheFileName(FileName, *Parameters):
+
+    Digest = hashlib.sha1(repr(Parameters).encode("utf-8")).hexdigest()[:12]
+
+    return("{0}.{1}.npy".format(FileName, Digest))
+
+# Open a catalog file memory-mapped
+# .npy files are opened directly. Text files are parsed on the first call
+# and saved next to them (see CacheFileName()), which is reused until the
+# text file changes (or the format of the catalogs changes)
+def LoadCatalog(FileName, Delimiter=",", SkipRows=0, Columns=(0, 1, 2, None)):
+
+    if(FileName.endswith(".npy")):
+        return(OpenCatalog(FileName))
+
+    Columns = tuple(Columns) + (None,) * (6 - len(Columns))
+    CacheName = CacheFileName(FileName, Delimiter, SkipRows, Columns)
+    if(not os.path.exists(CacheName) or os.path.getmtime(CacheName) < os.path.getmtime(FileName) or not _IsCatalogFile(CacheName)):
+        # Write to a temporary file first, so other processes never open a
+        # partially written catalog
+        TemporaryName = "{0}.{1}.tmp.npy".format(FileName, os.getpid())
+        SaveCatalog(ReadTextCatalog(FileName, Delimiter, SkipRows, Columns), TemporaryName)
+        os.replace(TemporaryName, CacheName)
+
+    return(OpenCatalog(CacheName))
@@ -0,0 +1,1586 @@
+###############################################################################################
+####  ______             __  __  __    __                               ______  ______     ####
+##   /      \           |  \|  \|  \   \_\                              |      \|      \     ##
+##  |  $$$$$$\  _______  \$$| $$| $$  ______    _______  ________        \$$$$$$ \$$$$$$     ##
+##  | $$   \$$ /       \|  \| $$| $$ /      \  /       \|        \        | $$    | $$       ##
+##  | $$      |  $$$$$$$| $$| $$| $$|  $$$$$$\|  $$$$$$$ \$$$$$$$$        | $$    | $$       ##
+##  | $$   __  \$$    \ | $$| $$| $$| $$    $$ \$$    \   /    $$         | $$    | $$       ##
+##  | $$__/  \ _\$$$$$$\| $$| $$| $$| $$$$$$$$ _\$$$$$$\ /  $$$$_        _| $$_  _| $$_      ##
+##   \$$    $$|       $$| $$| $$| $$ \$$     \|       $$|  $$    \      |   $$ \|   $$ \     ##
+##    \$$$$$$  \$$$$$$$  \$$ \$$ \$$  \$$$$$$$ \$$$$$$$  \$$$$$$$$       \$$$$$$ \$$$$$$     ##
+##                                            __                                             ##
+##                                           / _|                                            ##
+##                                          | |_ _ __ ___  _ __ ___                          ##
+##                                          |  _| '__/ _ \| '_ ` _ \                         ##
+##              _______            __       | | | | | (_) | | | | | |                        ##
+##             /       \          /  |      |_| |_|  \___/|_| |_| |_|                        ##
+##             $$$$$$$  | ______  $$ |  ______    ______    ______                           ##
+##             $$ |__$$ |/      \ $$ | /      \  /      \  /      \                          ##
+##             $$    $$/ $$$$$$  |$$ |/$$$$$$  |/$$$$$$  |/$$$$$$  |                         ##
+##             $$$$$$$/  /    $$ |$$ |$$    $$ |$$    $$ |$$    $$ |                         ##
+##             $$ |     /$$$$$$$ |$$ |$$$$$$$$/ $$$$$$$$/ $$$$$$$$/                          ##
+##             $$ |     $$    $$ |$$ |$$       |$$       |$$       |                         ##
+##             $$/       $$$$$$$/ $$/  $$$$$$$/  $$$$$$$/  $$$$$$$/                          ##
+##                                                                                           ##
+##                                                                                           ##
+##        > Conversion Between Coordinate Systems                                            ##
+##        > Calculate Geographical Distances                                                 ##
+##        > Convert Sidereal Time/Local Mean Sidereal Time (S, LMST)                         ##
+##        > Calculate Datetimes of Sunrises and Sunsets                                      ##
+##        > Calculate Twilights' Correct Datetimes at Specific Locations                     ##
+##        > Draw Sun's Path on Earth during a Choosen Year                                   ##
+##        > Solve Csillész II End-Semester Homework with One Click                           ##
+##        > Draw Sun Analemma for a Choosen Year                                             ##
+##       Future:                                                                             ##
+##        > Better Optimalization and Greater Precision                                      ##
+####                                                                                       ####
+###############################################################################################
+####                                                                                       ####
+##        USED LEGENDS AND LABELS:                                                           ##
+##                                                                                           ##
+##        φ: Latitude                                                                        ##
+##        λ: Longitude                                                                       ##
+##        H: Local Hour Angle in Degrees                                                     ##
+##        t/LHA: Local Hour Angle in Hours                                                   ##
+##        S/LMST: Local Mean Sidereal Time                                                   ##
+##        S_0/GMST: Greenwich Mean Sidereal Time                                             ##
+##        A: Azimuth at Horizontal Coords                                                    ##
+##        m: Altitude at Horizontal Coords                                                   ##
+##        δ: Declination at Equatorial Coords                                                ##
+##        α/RA: Right Ascension at Equatorial Coords                                         ##
+##        ε: Obliquity of the equator of the planet compared to the orbit of the planet      ##
+##        Π: Perihelion of the planet, relative to the ecliptic and vernal equinox           ##
+####                                                                                       ####
+###############################################################################################
+
+# If libraries are not installed, decomment and run
+#pip install numpy --upgrade
+
+import collections
+import datetime
+import math
+#import numpy as np
+
+# Current Version of the Csillész II Problem Solver
+ActualVersion = 'v1.32'
+
+
+
+################################################################
+########                                                ########
+########         CONSTANTS FOR CALCULATIONS             ########
+########                                                ########
+################################################################
+
+# Earth's Radius
+R = 6378e03
+
+# Lenght of 1 Solar Day = 1.002737909350795 Sidereal Days
+# It's Usually Labeled as dS/dm
+# We Simply Label It as dS
+dS = 1.002737909350795
+
+# Months' length int days, without leap day
+MonthLengthList = [31,28,31,30,31,30,31,31,30,31,30,31]
+
+# Months' length int days, with leap day
+MonthLengthListLeapYear = [31,29,31,30,31,30,31,31,30,31,30,31]
+
+# Predefined Coordinates of Some Notable Cities
+# Format:
+# "LocationName": [N Latitude (φ), E Longitude(λ)]
+# Latitude: + if N, - if S
+# Longitude: + if E, - if W
+LocationDict = {
+    "Amsterdam": [52.3702, 4.8952],
+    "Athen": [37.9838, 23.7275],
+    "Baja": [46.1803, 19.0111],
+    "Beijing": [39.9042, 116.4074],
+    "Berlin": [52.5200, 13.4050],
+    "Budapest": [47.4979, 19.0402],
+    "Budakeszi": [47.5136, 18.9278],
+    "Budaors": [47.4621, 18.9530],
+    "Brussels": [50.8503, 4.3517],
+    "Debrecen": [47.5316, 21.6273],
+    "Dunaujvaros": [46.9619, 18.9355],
+    "Gyor": [47.6875, 17.6504],
+    "Jerusalem": [31.7683, 35.2137],
+    "Kecskemet": [46.8964, 19.6897],
+    "Lumbaqui": [0.0467, -77.3281],
+    "London": [51.5074, -0.1278],
+    "Mako": [46.2219, 20.4809],
+    "Miskolc": [48.1035, 20.7784],
+    "Nagykanizsa": [46.4590, 16.9897],
+    "NewYork": [40.7128, -74.0060],
+    "Paris": [48.8566, 2.3522],
+    "Piszkesteto": [47.91806, 19.8942],
+    "Pecs": [46.0727, 18.2323],
+    "Rio": [-22.9068, -43.1729],
+    "Rome": [41.9028, 12.4964],
+    "Szeged": [46.2530, 20.1414],
+    "Szeghalom": [47.0239, 21.1667],
+    "Szekesfehervar": [47.1860, 18.4221],
+    "Szombathely": [47.2307, 16.6218],
+    "Tokyo": [35.6895, 139.6917],
+    "Washington": [47.7511, -120.7401],
+    "Zalaegerszeg": [46.8417, 16.8416]
+}
+
+# Predefined Equatorial I Coordinates of Some Notable Stellar Objects
+# Format:
+# "StarName": [Right Ascension (RA), Declination (δ)]
+StellarDict = {
+    "Achernar": [1.62857, -57.23675],
+    "Aldebaran": [4.59868, 16.50930],
+    "Algol": [3.13614, 40.95565],
+    "AlphaAndromedae": [0.13979, 29.09043],
+    "AlphaCentauri": [14.66014, -60.83399],
+    "AlphaPersei": [3.40538, 49.86118],
+    "Alphard": [9.45979, -8.65860],
+    "Altair": [19.8625, 8.92278],
+    "Antares": [16.49013, -26.43200],
+    "Arcturus": [14.26103, 19.18222],
+    "BetaCeti": [0.72649, -17.986605],
+    "BetaUrsaeMajoris": [11.03069, 56.38243],
+    "BetaUrsaeMinoris": [14.84509, 74.15550],
+    "Betelgeuse": [5.91953, 7.407064],
+    "Canopus": [6.39920, -52.69566],
+    "Capella": [5.278155, 45.99799],
+    "Deneb": [20.69053, 45.28028],
+    "Fomalhaut": [22.960845, -29.62223],
+    "GammaDraconis": [17.94344, 51.4889],
+    "GammaVelorum": [8.15888, -47.33658],
+    "M31": [0.712305, 41.26917],
+    "Polaris": [2.53030, 89.26411],
+    "Pollux": [7.75526, 28.02620],
+    "ProximaCentauri": [14.49526, -62.67949],
+    "Rigel": [5.24230, -8.20164],
+    "Sirius": [6.75248, -16.716116],
+    "Vega": [18.61565, 38.78369],
+    "VYCanisMajoris": [7.38287, -25.767565]
+}
+
+# Dictionary for Planets in 
+PlanetDict = {
+    "Mercury": "Mercury",
+    "Venus": "Venus",
+    "Earth": "Earth",
+    "Mars": "Mars",
+    "Jupiter": "Jupiter",
+    "Saturn": "Saturn",
+    "Uranus": "Uranus",
+    "Neptunus": "Neptunus",
+    "Pluto": "Pluto"
+}
+
+# Constants for Planetary Orbits
+# Format:
+# "PlanetNameX": [X_0, X_1, X_2 .., X_E.] or [X_1, X_3, ..., X_E] etc.
+# "PlanetNameOrbit": [Π, ε, Correction for Refraction and Sun's visible shape]
+OrbitDict = {
+    "MercuryM": [174.7948, 4.09233445],
+    "MercuryC": [23.4400, 2.9818, 0.5255, 0.1058, 0.0241, 0.0055, 0.0026],
+    "MercuryA": [-0.0000, 0.0000, 0.0000, 0.0000],
+    "MercuryD": [0.0351, 0.0000, 0.0000, 0.0000],
+    "MercuryJ": [45.3497, 11.4556, 0.00000, 175.9386],
+    "MercuryH": [0.035, 0.00000, 0.00000],
+    "MercuryOrbit": [230.3265, 0.0351, -0.69],
+
+    "VenusM": [50.4161, 1.60213034],
+    "VenusC": [0.7758, 0.0033, 0.00000, 0.00000, 0.00000, 0.00000, 0.00000],
+    "VenusA": [-0.0304, 0.00000, 0.00000, 0.0001],
+    "VenusD": [.6367, 0.0009, 0.00000, 0.0036],
+    "VenusJ": [52.1268, -0.2516, 0.0099, -116.7505],
+    "VenusH": [2.636, 0.001, 0.00000],
+    "VenusOrbit": [73.7576,	2.6376, -0.37],
+
+    "EarthM": [357.5291, 0.98560028],
+    "EarthJ": [0.0009, 0.0053, -0.0068, 1.0000000],
+    "EarthC": [1.9148, 0.0200, 0.0003, 0.00000, 0.00000, 0.00000, 0.00000],
+    "EarthA": [-2.4657, 0.0529, -0.0014, 0.0003],
+    "EarthD": [22.7908, 0.5991, 0.0492, 0.0003],
+    "EarthH": [22.137, 0.599, 0.016],
+    "EarthOrbit": [102.9373, 23.4393, -0.83],
+
+    "MarsM": [19.3730, 0.52402068],
+    "MarsC": [10.6912, 0.6228, 0.0503, 0.0046, 0.0005, 0.00000, 0.0001],
+    "MarsA": [-2.8608, 0.0713, -0.0022, 0.0004],
+    "MarsD": [24.3880, 0.7332, 0.0706, 0.0011],
+    "MarsJ": [0.9047, 0.0305, -0.0082, 1.027491],
+    "MarsH": [23.576, 0.733, 0.024],
+    "MarsOrbit": [71.0041, 25.1918, -0.17],
+
+    "JupiterM": [20.0202, 0.08308529],
+    "JupiterC": [5.5549, 0.1683, 0.0071, 0.0003, 0.00000, 0.00000, 0.0001],
+    "JupiterA": [-0.0425, 0.00000, 0.00000, 0.0001],
+    "JupiterD": [3.1173, 0.0015, 0.00000, 0.0034],
+    "JupiterJ": [0.3345, 0.0064, 0.00000, 0.4135778],
+    "JupiterH": [3.116, 0.002, 0.00000],
+    "JupiterOrbit": [237.1015, 3.1189, -0.05],
+
+    "SaturnM": [317.0207, 0.03344414],
+    "SaturnC": [6.3585, 0.2204, 0.0106, 0.0006, 0.00000, 0.00000, 0.0001],
+    "SaturnA": [-3.2338, 0.0909, -0.0031, 0.0009],
+    "SaturnD": [25.7696, 0.8640, 0.0949, 0.0010],
+    "SaturnJ": [0.0766, 0.0078, -0.0040, 0.4440276],
+    "SaturnH": [24.800, 0.864, 0.032],
+    "SaturnOrbit": [99.4587, 26.7285, -0.03],
+
+    "UranusM": [141.0498, 0.01172834],
+    "UranusC": [5.3042, 0.1534, 0.0062, 0.0003, 0.00000, 0.00000, 0.0001],
+    "UranusA": [-42.5874, 12.8117, -2.6077, 17.6902],
+    "UranusD": [56.9083, -0.8433, 26.1648, 3.34],
+    "UranusJ": [0.1260, -0.0106, 0.0850, -0.7183165],
+    "UranusH": [28.680, -0.843, 8.722],
+    "UranusOrbit": [5.4634, 82.2298, -0.01],
+
+    "NeptunusM": [256.2250, 0.00598103],
+    "NeptunusC": [1.0302, 0.0058, 0.00000, 0.00000, 0.00000, 0.00000, 0.0001],
+    "NeptunusA": [-3.5214, 0.1078, -0.0039, 0.0163],
+    "NeptunusD": [26.7643, 0.9669, 0.1166, 0.060],
+    "NeptunusJ": [0.3841, 0.0019, -0.0066, 0.6712575],
+    "NeptunusH": [26.668, 0.967, 0.039],
+    "NeptunusOrbit": [182.2100, 27.8477, -0.01],
+
+    "PlutoM": [14.882, 0.00396],
+    "PlutoC": [28.3150, 4.3408, 0.9214, 0.2235, 0.0627, 0.0174, 0.0096],
+    "PlutoA": [-19.3248, 3.0286, -0.4092, 0.5052],
+    "PlutoD": [49.8309, 4.9707, 5.5910, 0.19],
+    "PlutoJ": [4.5635, -0.5024, 0.3429, 6.387672],
+    "PlutoH": [38.648, 4.971, 1.864],
+    "PlutoOrbit": [184.5484, 119.6075, -0.01]
+}
+
+
+
+################################################################
+########                                                ########
+########               UTILITY FUNCTIONS                ########
+########                                                ########
+################################################################
+
+# Normalization with Bound [0,NonZeroBound]
+def NormalizeZeroBounded(Parameter, NonZeroBound):
+
+    if(Parameter >= NonZeroBound):
+        Parameter = Parameter - (int(Parameter / NonZeroBound)) * NonZeroBound
+
+    elif(Parameter < 0):
+        Parameter = Parameter + (abs(int(Parameter / NonZeroBound)) + 1) * NonZeroBound
+
+    return(Parameter)
+
+# Time is normalized into [0h,24h[ intervals
+def NormalizeZeroBoundedTime(Time):
+
+    if(Time >= 24):
+        Multiply = int(Time / 24)
+        Time = Time - Multiply * 24
+
+    elif(Time < 0):
+        Multiply = int(Time / 24) - 1
+        Time = Time + abs(Multiply) * 24
+
+    else:
+        Multiply = 0
+
+    return(Time, Multiply)
+
+# Normalization Between to [-π,+π[
+def NormalizeSymmetricallyBoundedPI(Parameter):
+
+    if(Parameter < 0 or Parameter >= 360):
+        Parameter = NormalizeZeroBounded(Parameter, 360)
+
+    if(Parameter > 180):
+        Parameter = Parameter - 360
+
+    return(Parameter)
+
+# Normalization Between to [-π/2,+π/2]
+def NormalizeSymmetricallyBoundedPI_2(Parameter):
+    
+    if(Parameter < 0 or Parameter >= 360):
+        Parameter = NormalizeZeroBounded(Parameter, 360)
+
+    if(Parameter > 90 and Parameter <= 270):
+        Parameter = - (Parameter - 180)
+
+    elif(Parameter > 270 and Parameter <= 360):
+        Parameter = Parameter - 360
+
+    return(Parameter)
+
+def NormalizeTimeParameters(Time, Year, Month, Day):
+
+    # Function call: Time, Hours, Minutes, Seconds, Year, Month, Day = NormalizeTimeParameters(Time, Year, Month, Day)
+
+    # First normalize Time if abs(Time) >= 24
+    Time, Multiply = NormalizeZeroBoundedTime(Time)    
+
+    # CORRECTIONS IF MINUTES >= 60 or SECONDS >= 60
+    Hours = int(Time)
+    Minutes = int((Time - Hours) * 60)
+    if(Minutes >= 60):
+        NormalizeZeroBounded(Minutes, 60)
+        Hours += 1
+    if(Hours >= 24):
+        NormalizeZeroBounded(Hours, 24)
+        Day += 1
+    if(Year%4 == 0 and (Year%100 != 0 or Year%400 == 0)):
+        if(Day > MonthLengthListLeapYear[Month - 1]):
+            Month =+ 1
+    else:
+        if(Day > MonthLengthList[Month - 1]):
+            Month += 1
+    if(Month > 12):
+        Month = 1
+        Year =+ 1
+
+    Seconds = int((((Time - Hours) * 60) - Minutes) * 60)
+    if(Seconds >= 60):
+        Seconds = NormalizeZeroBounded(Seconds, 60)
+        Minutes += 1
+    if(Minutes >= 60):
+        NormalizeZeroBounded(Minutes, 60)
+        Hours += 1
+    if(Hours >= 24):
+        NormalizeZeroBounded(Hours, 24)
+        Day += 1
+    if(Year%4 == 0 and (Year%100 != 0 or Year%400 == 0)):
+        if(Day > MonthLengthListLeapYear[Month - 1]):
+            Month =+ 1
+    else:
+        if(Day > MonthLengthList[Month - 1]):
+            Month += 1
+    if(Month > 12):
+        Month = 1
+        Year =+ 1
+
+    # CORRECTIONS IF abs(Time) >= 24
+    if(Multiply != 0):
+        Day = Day + Multiply
+        CountingIndex = Multiply
+
+    else:
+        CountingIndex = 0
+
+    while(True):
+        if(Year%4 == 0 and (Year%100 != 0 or Year%400 == 0)):
+            if(Day > MonthLengthListLeapYear[Month - 1]):
+                Day = Day - MonthLengthListLeapYear[Month - 1]
+                Month = Month + 1
+                if(Month == 13):
+                    Month = 1
+                    Year = Year + 1
+
+                if(Day > MonthLengthListLeapYear[Month - 1]):
+                    CountingIndex = CountingIndex - MonthLengthListLeapYear[Month - 1]
+                else:
+                    CountingIndex = 0
+                    break
+            else:
+                break
+
+        if(Year%4 != 0):
+            if(Day > MonthLengthList[Month - 1]):
+                Day = Day - MonthLengthList[Month - 1]
+                Month = Month + 1
+                if(Month == 13):
+                    Month = 1
+                    Year = Year + 1
+
+                if(Day > MonthLengthList[Month - 1]):
+                    CountingIndex = CountingIndex - MonthLengthList[Month - 1]
+                else:
+                    CountingIndex = 0
+                    break
+            else:
+                break
+
+
+    return(Time, Hours, Minutes, Seconds, Year, Month, Day)
+
+# Normalization and Conversion of Local Time to United Time
+def LTtoUT(Longitude, LocalHours, LocalMinutes, LocalSeconds, DateYear, DateMonth, DateDay):
+    
+    # Calculate United Time
+    LocalTime = LocalHours + LocalMinutes/60 + LocalSeconds/3600
+    # Normalize LT
+    LocalTime = NormalizeZeroBounded(LocalTime, 24)
+
+    # Summer/Winter Saving time
+    # Summer: March 26/31 - October 8/14 LT+1
+    # Winter: October 8/14 - March 26/31 LT+0
+    # ISN'T NEEDED
+    if((DateMonth > 3 and DateMonth < 10) or ((DateMonth == 3 and DateDay >=25) or (DateMonth == 10 and (DateDay >= 8 and DateDay <=14)))):
+        UnitedTime = LocalTime - (SiteTimeZone(Longitude) + 1)
+
+    else:
+        UnitedTime = LocalTime - SiteTimeZone(Longitude)
+
+    #UnitedTime = LocalTime - round(Longitude/15, 0)
+
+    # Apply corrections if United Time is not in the correct format
+    UnitedTime, UnitedHours, UnitedMinutes, UnitedSeconds, UnitedDateYear, UnitedDateMonth, UnitedDateDay = NormalizeTimeParameters(UnitedTime, DateYear, DateMonth, DateDay)
+
+    return(UnitedTime, UnitedHours, UnitedMinutes, UnitedSeconds, UnitedDateYear, UnitedDateMonth, UnitedDateDay)
+
+def UTtoLT(Longitude, UnitedHours, UnitedMinutes, UnitedSeconds, UnitedDateYear, UnitedDateMonth, UnitedDateDay):
+
+    # Calculate United Time
+    UnitedTime = UnitedHours + UnitedMinutes/60 + UnitedSeconds/3600
+    # Normalize LT
+    UnitedTime = NormalizeZeroBounded(UnitedTime, 24)
+
+    # Summer/Winter Saving time
+    # Summer: March 26/31 - October 8/14 LT+1
+    # Winter: October 8/14 - March 26/31 LT+0
+    # ISN'T NEEDED
+    if((UnitedDateMonth > 3 and UnitedDateMonth < 10) or ((UnitedDateMonth == 3 and UnitedDateDay >=25) or (UnitedDateMonth == 10 and (UnitedDateDay >= 8 and UnitedDateDay <=14)))):
+        LocalTime = UnitedTime + (SiteTimeZone(Longitude) + 1)
+
+    else:
+        LocalTime = UnitedTime + SiteTimeZone(Longitude)
+
+    #LocalTime = UnitedTime + round(Longitude/15, 0)
+
+    # Apply corrections if Local Time is not in the correct format
+    LocalTime, LocalHours, LocalMinutes, LocalSeconds, LocalDateYear, LocalDateMonth, LocalDateDay = NormalizeTimeParameters(LocalTime, UnitedDateYear, UnitedDateMonth, UnitedDateDay)
+
+    # Correction for Julian Date
+    #LocalHours += 12
+    #LocalHours = NormalizeZeroBounded(LocalHours, 24)
+
+    # Apply Correction for Local Time
+    LocalTime = LocalHours + LocalMinutes/60 + LocalSeconds/3600
+
+    return(LocalTime, LocalHours, LocalMinutes, LocalSeconds, LocalDateYear, LocalDateMonth, LocalDateDay)
+
+# Calculate Greenwich Mean Sidereal Time (GMST = S_0) at UT 00:00 on Given Date
+def CalculateGMST(Longitude, UnitedHoursForGMST, UnitedMinutesForGMST, UnitedSecondsForGMST, UnitedDateYear, UnitedDateMonth, UnitedDateDay):
+
+    # JulianDays = UT days since J2000.0, including parts of a day
+    # Could be + or - or 0
+    #Dwhole = int(int(1461 * int(UnitedDateYear + 4800 + (UnitedDateMonth - 14) / 12)) / 4) + int((367 * (UnitedDateMonth - 2 - 12 * int((UnitedDateMonth - 14) / 12))) / 12) - int((3 * int((UnitedDateYear + 4900 + (UnitedDateMonth - 14)/12) / 100)) / 4) + UnitedDateDay - 32075
+    #Dwhole = 367 * UnitedDateYear - int(int(7 * (UnitedDateYear + 5001 + (UnitedDateMonth - 9) / 7)) / 4) + int((275 * UnitedDateMonth) / 9) + UnitedDateDay + 1729777
+    Dwhole = 367 * UnitedDateYear - int(7 * (UnitedDateYear + int((UnitedDateMonth + 9) / 12)) / 4) + int(275 * UnitedDateMonth / 9) + UnitedDateDay - 730531.5
+    # Dfrac: Fraction of the day
+    # If UT = 00:00:00, then Dfrac = 0
+    Dfrac = (UnitedHoursForGMST + UnitedMinutesForGMST/60 + UnitedSecondsForGMST/3600)/24
+    JulianDays = Dwhole + Dfrac
+
+    # Number of Julian centuries since J2000.0
+    JulianCenturies = JulianDays / 36525
+
+    # Calculate GMST in Degrees
+    GMSTDegrees = 280.46061837 + 360.98564736629 * JulianDays + 0.000388 * JulianCenturies**2
+
+    # Normalize between to [0,+2π[
+    GMSTDegrees = NormalizeZeroBounded(GMSTDegrees, 360)
+
+    # Convert GMST to Hours
+    GMST = GMSTDegrees / 15
+
+    return(GMST)
+
+# Memoized GMST (S_0) at 00:00 UT of dates, keyed by (Year, Month, Day)
+# At most MaxSize dates are kept (unbounded if None), and when it's full,
+# the date to evict is chosen by the Policy:
+# "LRU": least recently used date
+# "FIFO": earliest stored date
+# Hits and Misses count the lookups
+class GMSTCache:
+
+    Policies = ("LRU", "FIFO")
+
+    def __init__(self, MaxSize=4096, Policy="LRU"):
+
+        if(Policy not in self.Policies):
+            raise ValueError("Unknown eviction policy: {0}! Choose from {1}".format(Policy, self.Policies))
+
+        self.MaxSize = MaxSize
+        self.Policy = Policy
+        self.Table = collections.OrderedDict()
+        self.Hits = 0
+        self.Misses = 0
+        self.Evictions = 0
+
+    def __len__(self):
+
+        return(len(self.Table))
+
+    def __contains__(self, Date):
+
+        return(tuple(Date) in self.Table)
+
+    def __repr__(self):
+
+        return("GMSTCache(Size={0}/{1}, Policy={2!r}, Hits={3}, Misses={4}, Evictions={5})".format(
+               len(self), self.MaxSize, self.Policy, self.Hits, self.Misses, self.Evictions))
+
+    # S_0 in hours at 00:00 UT of the date
+    def __call__(self, Year, Month, Day):
+
+        Key = (Year, Month, Day)
+        GMST = self.Table.get(Key)
+        if(GMST is not None):
+            self.Hits += 1
+            if(self.Policy == "LRU"):
+                self.Table.move_to_end(Key)
+            return(GMST)
+
+        self.Misses += 1
+        GMST = CalculateGMST(0, 0, 0, 0, Year, Month, Day)
+        self._Store(Key, GMST)
+
+        return(GMST)
+
+    def _Store(self, Key, GMST):
+
+        self.Table[Key] = GMST
+        if(self.MaxSize is not None and len(self.Table) > self.MaxSize):
+            self.Table.popitem(last=False)
+            self.Evictions += 1
+
+    # Calculate S_0 for every date from StartDate to EndDate (both included),
+    # given as (Year, Month, Day)
+    # Doesn't change the Hits and Misses
+    def Prefill(self, StartDate, EndDate):
+
+        Start = datetime.date(*StartDate).toordinal()
+        End = datetime.date(*EndDate).toordinal()
+
+        for Ordinal in range(Start, End + 1):
+            Date = datetime.date.fromordinal(Ordinal)
+            Key = (Date.year, Date.month, Date.day)
+            if(Key not in self.Table):
+                self._Store(Key, CalculateGMST(0, 0, 0, 0, *Key))
+
+    # Drop every stored date and reset the counters
+    def Clear(self):
+
+        self.Table.clear()
+        self.Hits = 0
+        self.Misses = 0
+        self.Evictions = 0
+
+# Cache of LocalSiderealTimeCalc()
+GMSTAtMidnight = GMSTCache()
+
+
+
+################################################################
+########                                                ########
+########               OBSERVER CONTEXT                 ########
+########                                                ########
+################################################################
+
+# Precalculated parameters of an observing site
+# Conversion and solar functions accept it in place of the Latitude (and
+# the Longitude), so sin(φ), cos(φ) and tan(φ) of a fixed site are only
+# calculated once
+# Format:
+# ObserverContext(Latitude, Longitude) or ObserverContext.FromLocation("Budapest")
+class ObserverContext:
+
+    def __init__(self, Latitude, Longitude=0, TimeZone=None, Name=None):
+
+        # Initial Data Normalization
+        # Latitude: [-π,+π]
+        self.Latitude = NormalizeSymmetricallyBoundedPI(Latitude)
+        self.Longitude = Longitude
+        self.Name = Name
+
+        self.sinLatitude = math.sin(math.radians(self.Latitude))
+        self.cosLatitude = math.cos(math.radians(self.Latitude))
+        self.tanLatitude = math.tan(math.radians(self.Latitude))
+
+        # Time zone in hours (without summer time), same as in LTtoUT()
+        if(TimeZone is None):
+            TimeZone = round(Longitude/15, 0)
+        self.TimeZone = TimeZone
+
+    # Observer at one of the Locations in LocationDict
+    # Raises KeyError if the Location is not in the Database
+    @classmethod
+    def FromLocation(cls, Location, TimeZone=None):
+
+        Latitude, Longitude = LocationDict[Location]
+
+        return(cls(Latitude, Longitude, TimeZone, Location))
+
+    def __repr__(self):
+
+        return("ObserverContext({0}, {1}, TimeZone={2}, Name={3!r})".format(self.Latitude, self.Longitude, self.TimeZone, self.Name))
+
+# Latitude (φ) normalized to [-π,+π], and its sine and cosine
+# Latitude can also be an ObserverContext, then nothing is recalculated
+def SiteTrigonometry(Latitude):
+
+    if(isinstance(Latitude, ObserverContext)):
+        return(Latitude.Latitude, Latitude.sinLatitude, Latitude.cosLatitude)
+
+    Latitude = NormalizeSymmetricallyBoundedPI(Latitude)
+
+    return(Latitude, math.sin(math.radians(Latitude)), math.cos(math.radians(Latitude)))
+
+# Time zone of a site in hours (without summer time)
+# Longitude can also be an ObserverContext
+def SiteTimeZone(Longitude):
+
+    if(isinstance(Longitude, ObserverContext)):
+        return(Longitude.TimeZone)
+
+    return(round(Longitude/15, 0))
+
+
+
+################################################################
+########                                                ########
+########      1. CONVERSION OF COORDINATE SYSTEMS       ########
+########                                                ########
+################################################################
+
+# 1. Horizontal to Equatorial I
+def HorToEquI(Latitude, Altitude, Azimuth, LocalSiderealTime=None):
+
+    # Initial Data Normalization
+    # Latitude: [-π,+π]
+    # Altitude: [-π/2,+π/2]
+    # Azimuth: [0,+2π[
+    # Local Mean Sidereal Time: [0,24h[
+    Latitude, sinLat, cosLat = SiteTrigonometry(Latitude)
+    Altitude = NormalizeSymmetricallyBoundedPI_2(Altitude)
+    Azimuth = NormalizeZeroBounded(Azimuth, 360)
+    if (LocalSiderealTime != None):
+        LocalSiderealTime = NormalizeZeroBounded(LocalSiderealTime, 24)
+
+    sinAlt = math.sin(math.radians(Altitude))
+    cosAlt = math.cos(math.radians(Altitude))
+    sinAz = math.sin(math.radians(Azimuth))
+    cosAz = math.cos(math.radians(Azimuth))
+
+    # Calculate Declination (δ)
+    # sin(δ) = sin(m) * sin(φ) + cos(m) * cos(φ) * cos(A)
+    Declination = math.degrees(math.asin(max(-1, min(1,
+                  sinAlt * sinLat + cosAlt * cosLat * cosAz
+                  ))))
+    # Normalize result for Declination [-π/2,+π/2]
+    Declination = NormalizeSymmetricallyBoundedPI_2(Declination)
+
+    # Calculate Local Hour Angle in Degrees (H)
+    # sin(H) * cos(δ) = - sin(A) * cos(m)
+    # cos(H) * cos(δ) = sin(m) * cos(φ) - cos(m) * sin(φ) * cos(A)
+    # atan2() of them gives H in the correct quadrant, without comparing
+    # the two solutions of asin() and acos()
+    LocalHourAngleDegrees = math.degrees(math.atan2(
+                            - sinAz * cosAlt,
+                            sinAlt * cosLat - cosAlt * sinLat * cosAz
+                            ))
+
+    # Normalize result [0,+2π[
+    LocalHourAngleDegrees = NormalizeZeroBounded(LocalHourAngleDegrees, 360)
+    # Convert to hours from angles (H -> t)
+    LocalHourAngle = LocalHourAngleDegrees / 15
+
+    if(LocalSiderealTime != None):
+        # Calculate Right Ascension (α)
+        # α = S – t
+        RightAscension = LocalSiderealTime - LocalHourAngle
+    else:
+        RightAscension = None
+
+
+    return(Declination, LocalHourAngle, RightAscension)
+
+# 2. Horizontal to Equatorial II
+def HorToEquII(Latitude, Altitude, Azimuth, LocalSiderealTime):
+
+    # First Convert Horizontal to Equatorial I Coordinates
+    Declination, LocalHourAngle, RightAscension = HorToEquI(Latitude, Altitude, Azimuth, LocalSiderealTime)
+
+    # Convert Equatorial I to Equatorial II
+    LocalSiderealTime = LocalHourAngle + RightAscension
+    # Normalize LMST
+    # LMST: [0,24h[
+    LocalSiderealTime = NormalizeZeroBounded(LocalSiderealTime, 24)
+
+    return(Declination, RightAscension, LocalSiderealTime)
+
+
+# Azimuth (A) of an object at given Local Hour Angle in Degrees (H)
+# sin(A) * cos(m) = - sin(H) * cos(δ)
+# cos(A) * cos(m) = sin(δ) * cos(φ) - cos(δ) * sin(φ) * cos(H)
+# atan2() of them gives A in the correct quadrant, without comparing
+# the two solutions of asin() and acos()
+def AzimuthFromHourAngle(Latitude, Declination, LocalHourAngleDegrees):
+
+    Latitude, sinLat, cosLat = SiteTrigonometry(Latitude)
+
+    Azimuth = math.degrees(math.atan2(
+            - math.sin(math.radians(LocalHourAngleDegrees)) * math.cos(math.radians(Declination)),
+            math.sin(math.radians(Declination)) * cosLat -
+            math.cos(math.radians(Declination)) * sinLat * math.cos(math.radians(LocalHourAngleDegrees))
+            ))
+
+    # Normalize Azimuth
+    # Azimuth: [0,+2π[
+    Azimuth = NormalizeZeroBounded(Azimuth, 360)
+
+    return(Azimuth)
+
+# 3. Equatorial I to Horizontal
+def EquIToHor(Latitude, RightAscension, Declination, Altitude=None, LocalSiderealTime=None, LocalHourAngle=None):
+
+    # Initial Data Normalization
+    # Latitude: [-π,+π]
+    # Right Ascension: [0h,24h[
+    # Declination: [-π/2,+π/2]
+    Site = Latitude
+    Latitude, sinLat, cosLat = SiteTrigonometry(Site)
+    if(RightAscension != None):
+        RightAscension = NormalizeZeroBounded(RightAscension, 24)
+    if(Declination != None):
+        Declination = NormalizeSymmetricallyBoundedPI_2(Declination)
+
+
+    if(LocalSiderealTime != None):
+        # Calculate Local Hour Angle in Hours (t)
+        # t = S - α
+        LocalHourAngle = LocalSiderealTime - RightAscension
+        # Normalize LHA
+        # LHA: [0h,24h[
+        LocalHourAngle = NormalizeZeroBounded(LocalHourAngle, 24)
+
+    if(LocalHourAngle != None):
+        # Convert to angles from hours (t -> H)
+        LocalHourAngleDegrees = LocalHourAngle * 15
+
+        sinDec = math.sin(math.radians(Declination))
+        cosDec = math.cos(math.radians(Declination))
+        sinLHA = math.sin(math.radians(LocalHourAngleDegrees))
+        cosLHA = math.cos(math.radians(LocalHourAngleDegrees))
+
+        # Calculate Altitude (m)
+        # sin(m) = sin(δ) * sin(φ) + cos(δ) * cos(φ) * cos(H)
+        Altitude = math.degrees(math.asin(max(-1, min(1,
+                sinDec * sinLat + cosDec * cosLat * cosLHA
+                ))))
+
+        # Calculate Azimuth (A)
+        # Same as AzimuthFromHourAngle()
+        Azimuth = math.degrees(math.atan2(- sinLHA * cosDec, sinDec * cosLat - cosDec * sinLat * cosLHA))
+
+        # Normalize Azimuth
+        # Azimuth: [0,+2π[
+        Azimuth = NormalizeZeroBounded(Azimuth, 360)
+
+        return(Altitude, Azimuth)
+
+    elif(Altitude != None):
+        # Starting Equations: 
+        # sin(m) = sin(δ) * sin(φ) + cos(δ) * cos(φ) * cos(H)
+        # We can calculate eg. setting/rising with the available data (m = 0°), or other things...
+        # First let's calculate LHA:
+        # cos(H) = (sin(m) - sin(δ) * sin(φ)) / cos(δ) * cos(φ)
+        LHAcos = (math.sin(math.radians(Altitude)) - math.sin(math.radians(Declination)) * sinLat) / (math.cos(math.radians(Declination)) * cosLat)
+        if(LHAcos <= 1 and LHAcos >= -1):
+            LocalHourAngleDegrees1 = math.degrees(math.acos(LHAcos))
+        elif(LHAcos > 1):
+            LocalHourAngleDegrees1 = math.degrees(math.acos(1))
+        elif(LHAcos < -1):
+            LocalHourAngleDegrees1 = math.degrees(math.acos(-1))
+        
+
+        # acos(x) has two correct output on this interval
+        LocalHourAngleDegrees2 = - LocalHourAngleDegrees1
+
+        # Normalize LHAs:
+        LocalHourAngleDegrees1 = NormalizeZeroBounded(LocalHourAngleDegrees1, 360)
+        LocalHourAngleDegrees2 = NormalizeZeroBounded(LocalHourAngleDegrees2, 360)
+
+        # Calculate Azimuth (A) for both Local Hour Angles!
+        # Rising Azimuth belongs to the SECOND (negative) Local Hour Angle
+        Azimuth1 = AzimuthFromHourAngle(Site, Declination, LocalHourAngleDegrees2)
+        # Setting Azimuth belongs to the FIRST (positive) Local Hour Angle
+        Azimuth2 = AzimuthFromHourAngle(Site, Declination, LocalHourAngleDegrees1)
+
+
+        # Calculate time between them
+        # The Object rises at -H and sets at +H
+        # H_dil is the time, as long as the Object stays above the Horizon
+        H_dil = 2 * LocalHourAngleDegrees1
+
+        return(Altitude, Azimuth1, Azimuth2, H_dil)
+
+# 4. Equatorial I to Equatorial II
+def EquIToEquII(RightAscension, LocalHourAngle):
+    
+    LocalSiderealTime = LocalHourAngle + RightAscension
+    # Normalize LMST
+    # LMST: [0,24h[
+    LocalSiderealTime = NormalizeZeroBounded(LocalSiderealTime, 24)
+
+    return(LocalSiderealTime)
+
+# 5. Equatorial II to Equatorial I
+def EquIIToEquI(LocalSiderealTime, RightAscension, LocalHourAngle):
+
+    # Calculate Right Ascension or Local Mean Sidereal Time
+    if(RightAscension != None and LocalHourAngle == None):
+        LocalHourAngle = LocalSiderealTime - RightAscension
+        # Normalize LHA
+        # LHA: [0,24h[
+        LocalHourAngle = NormalizeZeroBounded(LocalHourAngle, 24)
+
+    elif(RightAscension == None and LocalHourAngle != None):
+        RightAscension = LocalSiderealTime - LocalHourAngle
+        # Normalize Right Ascension
+        # Right Ascension: [0,24h[
+        RightAscension = NormalizeZeroBounded(RightAscension, 24)
+
+    else:
+        pass
+
+    return(LocalHourAngle, RightAscension)
+
+# 6. Equatorial II to Horizontal
+def EquIIToHor(Latitude, RightAscension, Declination, Altitude, Azimuth, LocalSiderealTime, LocalHourAngle):
+
+    # Initial Data Normalization
+    # Latitude: [-π,+π]
+    # Local Mean Sidereal Time: [0h,24h[
+    # Local Hour Angle: [0h,24h[
+    # Right Ascension: [0h,24h[
+    # Declination: [-π/2,+π/2]
+    # (Latitude is normalized by EquIToHor())
+    LocalSiderealTime = NormalizeZeroBounded(LocalSiderealTime, 24)
+    
+    if(RightAscension == None and LocalHourAngle != None):
+        LocalHourAngle = NormalizeZeroBounded(LocalHourAngle, 24)
+
+    elif(RightAscension != None and LocalHourAngle == None):
+        RightAscension = NormalizeZeroBounded(RightAscension, 24)
+    
+    Declination = NormalizeSymmetricallyBoundedPI_2(Declination)
+
+    # Convert Equatorial II to Equatorial I
+    LocalHourAngle, RightAscension = EquIIToEquI(LocalSiderealTime, RightAscension, LocalHourAngle)
+
+    # Normalization of Output Data
+    LocalHourAngle = NormalizeZeroBounded(LocalHourAngle, 24)
+    RightAscension = NormalizeZeroBounded(RightAscension, 24)
+
+    # Convert Equatorial I to Horizontal
+    Altitude, Azimuth = EquIToHor(Latitude, RightAscension, Declination, Altitude, LocalSiderealTime, LocalHourAngle)
+
+    # Normalization of Output Data
+    # Altitude: [-π/2,+π/2]
+    # Azimuth: [0,+2π[
+    Altitude = NormalizeSymmetricallyBoundedPI_2(Altitude)
+    Azimuth = NormalizeZeroBounded(Azimuth, 360)
+
+    return(Altitude, Azimuth)
+
+
+
+################################################################
+########                                                ########
+########            2. GEOGRAPHICAL DISTANCE            ########
+########                                                ########
+################################################################
+
+# Calculate distances between coordinates
+def GeogDistCalc(Latitude1, Latitude2, Longitude1, Longitude2):
+    
+    # Initial Data Normalization
+    # Latitude: [-π,+π]
+    # Longitude: [0,+2π[
+    Latitude1 = NormalizeSymmetricallyBoundedPI(Latitude1)
+    Latitude2 = NormalizeSymmetricallyBoundedPI(Latitude2)
+    Longitude1 = NormalizeZeroBounded(Longitude1, 360)
+    Longitude2 = NormalizeZeroBounded(Longitude2, 360)
+
+    # Haversine formula:
+    # Step 1.: hav_1 = (sin((φ2 - φ1) / 2))^2 + cos(φ1) ⋅ cos(φ2) ⋅ (sin((λ2 - λ1) / 2))^2
+    # Step 2.: hav_2 = 2 * atan2(sqrt(hav_1),sqrt(1 - hav_1))
+    # Step 3.: d = R * hav_2
+
+    # Step 1
+    hav_1 = ((math.sin(math.radians(Latitude2 - Latitude1) / 2))**2 +
+        (math.cos(math.radians(Latitude1)) * math.cos(math.radians(Latitude2)) * (math.sin(math.radians(Longitude2 - Longitude1) / 2))**2))
+
+    # Step 2
+    hav_2 = 2 * math.atan2(math.sqrt(hav_1), math.sqrt(1-hav_1))
+
+    # Step 3
+    Distance = R * hav_2
+
+    return(Distance)
+
+
+# Calculate distances between choosen cities
+# Same as GeogDistCalc(), with coordinates from LocationDict
+def GeogDistLocationCalc(Latitude1, Latitude2, Longitude1, Longitude2):
+
+    return(GeogDistCalc(Latitude1, Latitude2, Longitude1, Longitude2))
+
+
+
+################################################################
+########                                                ########
+######## 3. CALCULATE LOCAL MEAN SIDEREAL TIME (LMST)   ########
+########                                                ########
+################################################################
+
+# Calculate LMST from Predefined Coordinates
+def LocalSiderealTimeCalc(Longitude, LocalHours, LocalMinutes, LocalSeconds, DateYear, DateMonth, DateDay):
+
+    # Time zone is derived from the signed Longitude (λ),
+    # so convert to UT before normalizing it
+    UnitedTime, UnitedHours, UnitedMinutes, UnitedSeconds, UnitedDateYear, UnitedDateMonth, UnitedDateDay = LTtoUT(Longitude, LocalHours, LocalMinutes, LocalSeconds, DateYear, DateMonth, DateDay)
+
+    # Initial Data Normalization
+    # Longitude: [0,+2π[
+    if(isinstance(Longitude, ObserverContext)):
+        Longitude = Longitude.Longitude
+    Longitude = NormalizeZeroBounded(Longitude, 360)
+
+    # Calculate Greenwich Mean Sidereal Time (GMST)
+    # Now UT = 00:00:00
+    # S_0 is memoized by date, see GMSTCache
+    S_0 = GMSTAtMidnight(UnitedDateYear, UnitedDateMonth, UnitedDateDay)
+
+    # Greenwich Zero Time for Supervision
+    GreenwichSiderealTime, GreenwichSiderealHours, GreenwichSiderealMinutes, GreenwichSiderealSeconds, SiderealDateYear, SiderealDateMonth, SiderealDateDay = NormalizeTimeParameters(S_0, DateYear, DateMonth, DateDay)
+
+    # Calculate LMST
+    LMST = S_0 + Longitude/15 + dS * UnitedTime
+
+    # Norm LMST
+    LMSTNorm = NormalizeZeroBounded(LMST, 24)
+
+    LocalSiderealTime, LocalSiderealHours, LocalSiderealMinutes, LocalSiderealSeconds, LocalDateYear, LocalDateMonth, LocalDateDay = NormalizeTimeParameters(LMSTNorm, DateYear, DateMonth, DateDay)
+
+    return(LocalSiderealHours, LocalSiderealMinutes, LocalSiderealSeconds,
+           UnitedHours, UnitedMinutes, UnitedSeconds, 
+           GreenwichSiderealHours, GreenwichSiderealMinutes, GreenwichSiderealSeconds)
+
+
+
+################################################################
+########                                                ########
+########      4. CALCULATE DATETIMES OF TWILIGHTS       ########
+########                                                ########
+################################################################
+
+# Calculate actual Julian Date
+def CalculateJulianDate(LocalDateYear, LocalDateMonth, LocalDateDay, UnitedHours, UnitedMinutes, UnitedSeconds):
+
+    # JulianDays = UT days since J2000.0, including parts of a day
+    # Could be + or - or 0
+    #Dwhole = int(int(1461 * int(LocalDateYear + 4800 + (LocalDateMonth - 14) / 12)) / 4) + int((367 * (LocalDateMonth - 2 - 12 * int((LocalDateMonth - 14) / 12))) / 12) - int((3 * int((LocalDateYear + 4900 + (LocalDateMonth - 14)/12) / 100)) / 4) + LocalDateDay - 32075
+    #Dwhole = 367 * LocalDateYear - int(int(7 * (LocalDateYear + 5001 + (LocalDateMonth - 9) / 7)) / 4) + int((275 * LocalDateMonth) / 9) + LocalDateDay + 1729777
+    Dwhole = 367 * LocalDateYear - int(7 * (LocalDateYear + int((LocalDateMonth + 9) / 12)) / 4) + int(275 * LocalDateMonth / 9) + LocalDateDay - 730531.5
+    #Dwhole = round(Dwhole, 0)
+    # Dfrac: Fraction of the day
+    Dfrac = (UnitedHours + UnitedMinutes/60 + UnitedSeconds/3600)/24
+    # Julian days
+    JulianDays = Dwhole + Dfrac
+
+    return(JulianDays)
+
+# Calculate Sun's Position
+def SunsCoordinatesCalc(Planet, Longitude, JulianDays):
+
+    # 1. Mean Solar Noon
+    # JAnomaly is an approximation of Mean Solar Time at WLongitude expressed as a Julian day with the day fraction
+    # WLongitude is the longitude west (west is positive, east is negative) of the observer on the Earth
+    if(isinstance(Longitude, ObserverContext)):
+        Longitude = Longitude.Longitude
+    WLongitude = - Longitude
+    JAnomaly = (JulianDays - OrbitDict[Planet + "J"][0]) / OrbitDict[Planet + "J"][3] - WLongitude/360
+
+    # 2. Solar Mean Anomaly
+    # MeanAnomaly (M) is the Solar Mean Anomaly used in a few of next equations
+    # MeanAnomaly = (M_0 + M_1 * (JulianDays-J2000)) and Norm to 360
+    MeanAnomaly = (OrbitDict[Planet + "M"][0] + OrbitDict[Planet + "M"][1] * JulianDays)
+    # Normalize Result
+    MeanAnomaly = NormalizeZeroBounded(MeanAnomaly, 360)
+
+    # 3. Equation of the Center
+    # EquationOfCenter (C) is the Equation of the center value needed to calculate Lambda (see next equation)
+    # EquationOfCenter = C_1 * sin(M) + C_2 * sin(2M) + C_3 * sin(3M) + C_4 * sin(4M) + C_5 * sin(5M) + C_6 * sin(6M)
+    EquationOfCenter = (OrbitDict[Planet + "C"][0] * math.sin(math.radians(MeanAnomaly)) + OrbitDict[Planet + "C"][1] * math.sin(math.radians(2 * MeanAnomaly)) + 
+                       OrbitDict[Planet + "C"][2] * math.sin(math.radians(3 * MeanAnomaly)) + OrbitDict[Planet + "C"][3] * math.sin(math.radians(4 * MeanAnomaly)) + 
+                       OrbitDict[Planet + "C"][4] * math.sin(math.radians(5 * MeanAnomaly)) + OrbitDict[Planet + "C"][5] * math.sin(math.radians(6 * MeanAnomaly)))
+
+    # 4. Ecliptic Longitude
+    # MeanEclLongitudeSun (L_sun) in the Mean Ecliptic Longitude
+    # EclLongitudeSun (λ) is the Ecliptic Longitude
+    # OrbitDict[Planet + "Orbit"][0] is a value for the argument of perihelion
+    MeanEclLongitudeSun = MeanAnomaly + OrbitDict[Planet + "Orbit"][0] + 180
+    EclLongitudeSun = EquationOfCenter + MeanEclLongitudeSun
+    MeanEclLongitudeSun = NormalizeZeroBounded(MeanEclLongitudeSun, 360)
+    EclLongitudeSun = NormalizeZeroBounded(EclLongitudeSun, 360)
+
+    # 5. Right Ascension of Sun (α)
+    # PlanetA_2, PlanetA_4 and PlanetA_6 (measured in degrees) are coefficients in the series expansion of the Sun's Right Ascension
+    # They varie for different planets in the Solar System
+    # RightAscensionSun = EclLongitudeSun + S ≈ EclLongitudeSun + PlanetA_2 * sin(2 * EclLongitudeSun) + PlanetA_4 * sin(4 * EclLongitudeSun) + PlanetA_6 * sin(6 * EclLongitudeSun)
+    RightAscensionSun = (EclLongitudeSun + OrbitDict[Planet + "A"][0] * math.sin(math.radians(2 * EclLongitudeSun)) + OrbitDict[Planet + "A"][1] * 
+                        math.sin(math.radians(4 * EclLongitudeSun)) + OrbitDict[Planet + "A"][2] * math.sin(math.radians(6 * EclLongitudeSun)))
+
+    RightAscensionSun /= 15
+
+    # 6./a Declination of the Sun (δ) (Wikipedia)
+    # DeclinationSun (δSun) is the Declination of the Sun
+    # 23.44° is Earth's maximum Axial Tilt toward's the Sun
+    #DeclinationSun = math.degrees(math.asin(
+    #       math.sin(math.radians(EclLongitudeSun)) * math.sin(math.radians(23.44)) ))
+    # Normalize Declination
+    #DeclinationSun = NormalizeSymmetricallyBoundedPI_2(DeclinationSun)
+
+    # 6./b Declination of the Sun (δ) (Astronomy Answers)
+    # PlanetD_1, PlanetD_3 and PlanetD_5 (measured in degrees) are coefficients in the series expansion of the Sun's Declination.
+    # They varie for different planets in the Solar System.
+    # DeclinationSun = PlanetD_1 * sin(EclLongitudeSun) + PlanetD_3 * (sin(EclLongitudeSun))^3 + PlanetD_5 * (sin(EclLongitudeSun))^5
+    DeclinationSun = (OrbitDict[Planet + "D"][0] * math.sin(math.radians(EclLongitudeSun)) + OrbitDict[Planet + "D"][1] * 
+                     (math.sin(math.radians(EclLongitudeSun)))**3 + OrbitDict[Planet + "D"][2] * (math.sin(math.radians(EclLongitudeSun)))**5)
+
+
+    # 7. Solar Transit
+    # Jtransit is the Julian date for the Local True Solar Transit (or Solar Noon)
+    # JulianDate = JulianDays + 2451545
+    # 2451545.5 is midnight or the beginning of the equivalent Julian year reference
+    # Jtransit = J_x + 0.0053 * sin(MeanANomaly) - 0.0068 * sin(2 * L_sun)
+    # "0.0053 * sin(MeanAnomaly) - 0.0069 * sin(2 * EclLongitudeSun)"  is a simplified version of the equation of time
+    J_x = (JulianDays + 2451545) + OrbitDict[Planet + "J"][3] * (JulianDays - JAnomaly)
+    Jtransit = J_x + OrbitDict[Planet + "J"][1] * math.sin(math.radians(MeanAnomaly)) + OrbitDict[Planet + "J"][2] * math.sin(math.radians(2 * MeanEclLongitudeSun))
+
+
+    return(RightAscensionSun, DeclinationSun, EclLongitudeSun, Jtransit)
+
+def SunsLocalHourAngle(Planet, Latitude, Longitude, DeclinationSun, EclLongitudeSun, AltitudeOfSun):
+
+    # Trigonometric functions of the Latitude (φ)
+    # (precalculated, if Latitude is an ObserverContext)
+    if(isinstance(Latitude, ObserverContext)):
+        sinLat, cosLat, tanLat = Latitude.sinLatitude, Latitude.cosLatitude, Latitude.tanLatitude
+    else:
+        sinLat, cosLat, tanLat = math.sin(math.radians(Latitude)), math.cos(math.radians(Latitude)), math.tan(math.radians(Latitude))
+
+    # 8./a Local Hour Angle of Sun (H)
+    # H+ ≈ 90° + H_1 * sin(EclLongitudeSun) * tan(φ) + H_3 * sin(EclLongitudeSun)^3 * tan(φ) * (3 + tan(φ)^2) + H_5 * sin(EclLongitudeSun)^5 * tan(φ) * (15 + 10*tan(φ)^2 + 3 * tan(φ)^4))
+    LocalHourAngleSun_Pos = (90 + OrbitDict[Planet + "H"][0] * math.sin(math.radians(EclLongitudeSun)) * tanLat + OrbitDict[Planet + "H"][1] * 
+                            math.sin(math.radians((EclLongitudeSun))**3 * tanLat * (3 + tanLat**2) + OrbitDict[Planet + "H"][2] * 
+                            math.sin(math.radians(EclLongitudeSun))**5 * tanLat * (15 + 10 * tanLat**2 + 3 * tanLat**4)))
+
+    # 8./b1 Local Hour Angle of Sun (H)
+    # cos(H) = (sin(m_0) - sin(φ) * sin(δ)) / (cos(φ) * cos(δ))
+    # LocalHourAngleSun (t_0) is the Local Hour Angle from the Observer's Zenith
+    # Latitude (φ) is the North Latitude of the Observer (north is positive, south is negative)
+    # m_0 = Planet_RefCorr is a compensation of Altitude (m) in degrees, for the Sun's distorted shape, and the atmospherical refraction
+    # The equation return two value, LHA1 and LHA2. We need that one, which is approximately equals to LHA_Pos
+    LHAcos = ((math.sin(math.radians(AltitudeOfSun + OrbitDict[Planet + "Orbit"][2])) - sinLat * math.sin(math.radians(DeclinationSun))) /
+            (cosLat * math.cos(math.radians(DeclinationSun))))
+    if(LHAcos <= 1 and LHAcos >= -1):
+        LocalHourAngleSun_Orig = math.degrees(math.acos(LHAcos))
+    elif(LHAcos > 1):
+        LocalHourAngleSun_Orig = math.degrees(math.acos(1))
+    elif(LHAcos < -1):
+        LocalHourAngleSun_Orig = math.degrees(math.acos(-1))
+
+    #LocalHourAngleSun_Orig2 = - LocalHourAngleSun_Orig1
+    
+    # Normalize result for Hour Angles
+    LocalHourAngleSun_Pos = NormalizeZeroBounded(LocalHourAngleSun_Pos, 360)
+    LocalHourAngleSun_Orig = NormalizeZeroBounded(LocalHourAngleSun_Orig, 360)
+
+    return(LocalHourAngleSun_Pos, LocalHourAngleSun_Orig)
+
+
+def CalculateCorrectionsForJ(Planet, Latitude, Longitude, AltitudeOfSun, JAlt_0):
+
+    # Calculate Corrections for LHA of Sun
+    RightAscensionSunCorr, DeclinationSunCorr, EclLongitudeSun, JtransitCorr = SunsCoordinatesCalc(Planet, Longitude, JAlt_0)
+    LocalHourAngleSun_PosCorr, LocalHourAngleSun_OrigCorr = SunsLocalHourAngle(Planet, Latitude, Longitude, DeclinationSunCorr, EclLongitudeSun, AltitudeOfSun)
+
+
+    return(LocalHourAngleSun_PosCorr, LocalHourAngleSun_OrigCorr, RightAscensionSunCorr, DeclinationSunCorr, JtransitCorr)
+
+def CalculateRiseAndSetTime(Planet, Latitude, Longitude, AltitudeOfSun, LocalDateYear, LocalDateMonth, LocalDateDay):
+
+    # Calculate Actual Julian Date
+    # Now UT = 0
+    UnitedHours = 0
+    UnitedMinutes = 0
+    UnitedSeconds = 0
+    JulianDays = CalculateJulianDate(LocalDateYear, LocalDateMonth, LocalDateDay, UnitedHours, UnitedMinutes, UnitedSeconds)
+
+    # Calulate Sun's coordinates on sky
+    RightAscensionSun, DeclinationSun, EclLongitudeSun, Jtransit = SunsCoordinatesCalc(Planet, Longitude, JulianDays)
+    LocalHourAngleSun_Pos, LocalHourAngleSun_Orig = SunsLocalHourAngle(Planet, Latitude, Longitude, DeclinationSun, EclLongitudeSun, AltitudeOfSun)
+
+
+    '''print("LocalHourAngleSun_Pos: ", LocalHourAngleSun_Pos)
+    print("LocalHourAngleSun_Orig: ", LocalHourAngleSun_Orig)'''
+
+    # Calulate Rising and Setting Datetimes of the Sun
+    # JRise is the actual Julian date of sunrise
+    # JSet is the actual Julian date of sunset
+    JRise = Jtransit - LocalHourAngleSun_Orig / 360
+    JSet = Jtransit + LocalHourAngleSun_Orig / 360
+
+    '''LocalHourAngleSun_PosCorrRise, LocalHourAngleSun_OrigCorrRise, RightAscensionSunCorrRise, DeclinationSunCorrRise, JtransitCorrRise =  CalculateCorrectionsForJ(Planet, Latitude, Longitude, AltitudeOfSun, JRise)
+    LocalHourAngleSun_PosCorrSet, LocalHourAngleSun_OrigCorrSet, RightAscensionSunCorrSet, DeclinationSunCorrSet, JtransitCorrSet = CalculateCorrectionsForJ(Planet, Latitude, Longitude, AltitudeOfSun, JSet)
+        
+    print("LocalHourAngleSun_PosCorrRise: ", LocalHourAngleSun_PosCorrRise)
+    print("LocalHourAngleSun_OrigCorrRise: ", LocalHourAngleSun_OrigCorrRise)
+    print("LocalHourAngleSun_PosCorrSet: ", LocalHourAngleSun_PosCorrSet)
+    print("LocalHourAngleSun_OrigCorrSet: ", LocalHourAngleSun_OrigCorrSet)'''
+    
+    # Apply Corrections
+    #JRise -= (LocalHourAngleSun_Orig + LocalHourAngleSun_OrigCorrRise) / 360
+    #JSet -= (LocalHourAngleSun_Orig - LocalHourAngleSun_OrigCorrSet) / 360
+
+    return(JRise, JSet)
+
+
+# Calculate Sunrise and Sunset's Datetime
+def SunSetAndRiseDateTime(Planet, Latitude, Longitude, AltitudeOfSun, LocalDateYear, LocalDateMonth, LocalDateDay):
+
+    JRise, JSet = CalculateRiseAndSetTime(Planet, Latitude, Longitude, AltitudeOfSun, LocalDateYear, LocalDateMonth, LocalDateDay)
+
+    # SUNRISE
+    UTFracDayRise = JRise - int(JRise)
+
+    UTFracDayRise *= 24
+
+    SunRiseUT, SunRiseUTHours, SunRiseUTMinutes, SunRiseUTSeconds, SunRiseUTDateYear, SunRiseUTDateMonth, SunRiseUTDateDay = NormalizeTimeParameters(UTFracDayRise, LocalDateYear, LocalDateMonth, LocalDateDay)
+
+
+    # SUNSET
+    UTFracDaySet = JSet - int(JSet)
+
+    UTFracDaySet *= 24
+
+    SunSetUT, SunSetUTHours, SunSetUTMinutes, SunSetUTSeconds, SunSetUTDateYear, SunSetUTDateMonth, SunSetUTDateDay = NormalizeTimeParameters(UTFracDaySet, LocalDateYear, LocalDateMonth, LocalDateDay)
+
+    # Convert results to Local Time
+    LocalTimeRise, LocalHoursRise, LocalMinutesRise, LocalSecondsRise, LocalDateYearRise, LocalDateMonthRise, LocalDateDayRise = UTtoLT(Longitude, SunRiseUTHours, SunRiseUTMinutes, SunRiseUTSeconds, SunRiseUTDateYear, SunRiseUTDateMonth, SunRiseUTDateDay)
+    LocalTimeSet, LocalHoursSet, LocalMinutesSet, LocalSecondsSet, LocalDateYearSet, LocalDateMonthSet, LocalDateDaySet = UTtoLT(Longitude, SunSetUTHours, SunSetUTMinutes, SunSetUTSeconds, SunSetUTDateYear, SunSetUTDateMonth, SunSetUTDateDay)
+
+    return(LocalTimeSet, LocalHoursSet, LocalMinutesSet, LocalSecondsSet, LocalDateYearSet, LocalDateMonthSet, LocalDateDaySet, LocalTimeRise, LocalHoursRise, LocalMinutesRise, LocalSecondsRise, LocalDateYearRise, LocalDateMonthRise, LocalDateDayRise)
+
+
+def TwilightCalc(Planet, Latitude, Longitude, LocalDateYear, LocalDateMonth, LocalDateDay):
+
+    # Definition of differenc Twilights
+    # Begin/End of Civil Twilight:          m = -6°
+    # Begin/End of Nautical Twilight:       m = -12°
+    # Begin/End of Astronomical Twilight:   m = -18°
+    AltitudeDaylight = 0
+    AltitudeCivil = -6
+    AltitudeNaval = -12
+    AltitudeAstro = -18
+
+    #Daylight
+    (LocalTimeSetDaylight, LocalHoursSetDaylight, LocalMinutesSetDaylight, LocalSecondsSetDaylight, LocalDateYearSetDaylight, LocalDateMonthSetDaylight, LocalDateDaySetDaylight, 
+    LocalTimeRiseDaylight, LocalHoursRiseDaylight, LocalMinutesRiseDaylight, LocalSecondsRiseDaylight, LocalDateYearRiseDaylight, LocalDateMonthRiseDaylight, LocalDateDayRiseDaylight) = SunSetAndRiseDateTime(Planet, Latitude, Longitude, AltitudeDaylight, LocalDateYear, LocalDateMonth, LocalDateDay)
+
+    # Civil Twilight
+    (LocalTimeSetCivil, LocalHoursSetCivil, LocalMinutesSetCivil, LocalSecondsSetCivil, LocalDateYearSetCivil, LocalDateMonthSetCivil, LocalDateDaySetCivil, 
+    LocalTimeRiseCivil, LocalHoursRiseCivil, LocalMinutesRiseCivil, LocalSecondsRiseCivil, LocalDateYearRiseCivil, LocalDateMonthRiseCivil, LocalDateDayRiseCivil) = SunSetAndRiseDateTime(Planet, Latitude, Longitude, AltitudeCivil, LocalDateYear, LocalDateMonth, LocalDateDay)
+
+    # Nautical Twilight
+    (LocalTimeSetNaval, LocalHoursSetNaval, LocalMinutesSetNaval, LocalSecondsSetNaval, LocalDateYearSetNaval, LocalDateMonthSetNaval, LocalDateDaySetNaval, 
+    LocalTimeRiseNaval, LocalHoursRiseNaval, LocalMinutesRiseNaval, LocalSecondsRiseNaval, LocalDateYearRiseNaval, LocalDateMonthRiseNaval, LocalDateDayRiseNaval) = SunSetAndRiseDateTime(Planet, Latitude, Longitude, AltitudeNaval, LocalDateYear, LocalDateMonth, LocalDateDay)
+
+    # Astronomical Twilight
+    (LocalTimeSetAstro, LocalHoursSetAstro, LocalMinutesSetAstro, LocalSecondsSetAstro, LocalDateYearSetAstro, LocalDateMonthSetAstro, LocalDateDaySetAstro, 
+    LocalTimeRiseAstro, LocalHoursRiseAstro, LocalMinutesRiseAstro, LocalSecondsRiseAstro, LocalDateYearRiseAstro, LocalDateMonthRiseAstro, LocalDateDayRiseAstro) = SunSetAndRiseDateTime(Planet, Latitude, Longitude, AltitudeAstro, LocalDateYear, LocalDateMonth, LocalDateDay)
+
+    # Step +1 day
+    LocalDateNextDay = LocalDateDay + 1
+
+    if(LocalDateYear%4 == 0 and (LocalDateYear%100 != 0 or LocalDateYear%400 == 0)):
+        if(LocalDateNextDay > MonthLengthListLeapYear[LocalDateMonth - 1]):
+            LocalDateNextDay = 1
+            LocalDateNextMonth = LocalDateMonth + 1
+        else:
+            LocalDateNextDay = LocalDateDay + 1
+            LocalDateNextMonth = LocalDateMonth
+    
+    else:
+        if(LocalDateNextDay > MonthLengthList[LocalDateMonth - 1]):
+            LocalDateNextDay = 1
+            LocalDateNextMonth = LocalDateMonth + 1
+        else:
+            LocalDateNextDay = LocalDateDay + 1
+            LocalDateNextMonth = LocalDateMonth
+
+    if(LocalDateNextMonth > 12):
+        LocalDateNextMonth = 1
+        LocalDateNextYear = LocalDateYear + 1
+
+    else:
+        LocalDateNextYear = LocalDateYear
+
+    # Astronomical Twilight Next Day
+    (LocalTimeSetAstro2, LocalHoursSetAstro2, LocalMinutesSetAstro2, LocalSecondsSetAstro2, LocalDateYearSetAstro2, LocalDateMonthSetAstro2, LocalDateDaySetAstro2, 
+    LocalTimeRiseAstro2, LocalHoursRiseAstro2, LocalMinutesRiseAstro2, LocalSecondsRiseAstro2, LocalDateYearRiseAstro2, LocalDateMonthRiseAstro2, LocalDateDayRiseAstro2) = SunSetAndRiseDateTime(Planet, Latitude, Longitude, AltitudeAstro, LocalDateNextYear, LocalDateNextMonth, LocalDateNextDay)
+
+    #print(LocalTimeRiseAstro, LocalTimeSetAstro)
+    #print(LocalTimeRiseAstro2, LocalTimeSetAstro2)
+
+    # Noon and Midnight
+    LocalTimeNoon = LocalTimeRiseDaylight + (LocalTimeSetDaylight - LocalTimeRiseDaylight) / 2
+    LocalTimeMidnight = LocalTimeSetAstro + (((24 - LocalTimeSetAstro) + LocalTimeRiseAstro2) / 2)
+
+    #print(LocalTimeMidnight)
+    #LocalTimeMidnight = LocalTimeNoon + 12
+
+    # Calc Noon Date
+    LocalDateDayNoon = LocalDateDayRiseAstro
+    LocalDateMonthNoon = LocalDateMonthRiseAstro
+    LocalDateYearNoon = LocalDateYearRiseAstro
+
+    # Calc initial Midnight Date
+    LocalDateDayMidnight = LocalDateDayRiseAstro
+    LocalDateMonthMidnight = LocalDateMonthRiseAstro
+    LocalDateYearMidnight = LocalDateYearRiseAstro
+
+    #print(LocalDateDayMidnight)
+
+    # LT of Noon and Midnight
+    LocalTimeNoon, LocalHoursNoon, LocalMinutesNoon, LocalSecondsNoon, LocalDateYearNoon, LocalDateMonthNoon, LocalDateDayNoon = NormalizeTimeParameters(LocalTimeNoon, LocalDateYearNoon, LocalDateMonthNoon, LocalDateDayNoon)
+    LocalTimeMidnight, LocalHoursMidnight, LocalMinutesMidnight, LocalSecondsMidnight, LocalDateYearMidnight, LocalDateMonthMidnight, LocalDateDayMidnight = NormalizeTimeParameters(LocalTimeMidnight, LocalDateYearMidnight, LocalDateMonthMidnight, LocalDateDayMidnight)
+
+    return(LocalHoursNoon, LocalMinutesNoon, LocalSecondsNoon, LocalDateYearNoon, LocalDateMonthNoon, LocalDateDayNoon,
+            LocalHoursMidnight, LocalMinutesMidnight, LocalSecondsMidnight, LocalDateYearMidnight, LocalDateMonthMidnight, LocalDateDayMidnight,
+            LocalHoursRiseDaylight, LocalMinutesRiseDaylight, LocalSecondsRiseDaylight, LocalDateYearRiseDaylight, LocalDateMonthRiseDaylight, LocalDateDayRiseDaylight,
+            LocalHoursSetDaylight, LocalMinutesSetDaylight, LocalSecondsSetDaylight, LocalDateYearSetDaylight, LocalDateMonthSetDaylight, LocalDateDaySetDaylight,
+            LocalHoursRiseCivil, LocalMinutesRiseCivil, LocalSecondsRiseCivil, LocalDateYearRiseCivil, LocalDateMonthRiseCivil, LocalDateDayRiseCivil,
+            LocalHoursSetCivil, LocalMinutesSetCivil, LocalSecondsSetCivil, LocalDateYearSetCivil, LocalDateMonthSetCivil, LocalDateDaySetCivil,
+            LocalHoursRiseNaval, LocalMinutesRiseNaval, LocalSecondsRiseNaval, LocalDateYearRiseNaval, LocalDateMonthRiseNaval, LocalDateDayRiseNaval,
+            LocalHoursSetNaval, LocalMinutesSetNaval, LocalSecondsSetNaval, LocalDateYearSetNaval, LocalDateMonthSetNaval, LocalDateDaySetNaval,
+            LocalHoursRiseAstro, LocalMinutesRiseAstro, LocalSecondsRiseAstro, LocalDateYearSetAstro, LocalDateMonthSetAstro, LocalDateDaySetAstro,
+            LocalHoursSetAstro, LocalMinutesSetAstro, LocalSecondsSetAstro, LocalDateYearRiseAstro, LocalDateMonthRiseAstro, LocalDateDayRiseAstro)
+
+
+
+################################################################
+########                                                ########
+########        5. SOLVE ASTRONOMICAL TRIANGLES         ########
+########                                                ########
+################################################################
+
+def AstroTriangles(aValue, bValue, cValue, alphaValue, betaValue, gammaValue):
+
+    if(aValue != 0 and bValue != 0 and cValue != 0):
+        
+        if(((aValue + bValue) > cValue) and ((aValue + cValue) > bValue) and ((bValue + cValue) > aValue) and 
+            (abs(aValue - bValue) < cValue) and (abs(aValue - cValue) < bValue) and (abs(bValue - cValue) < aValue) and
+            ((aValue + bValue + cValue) < 360)):
+            
+            # Calculate angle Alpha
+            alphaValue = math.degrees(math.acos(
+                (math.cos(math.radians(aValue)) - math.cos(math.radians(bValue)) * math.cos(math.radians(cValue))) /
+                (math.sin(math.radians(bValue)) * math.sin(math.radians(cValue)))
+            ))
+
+            # Calculate angle Beta
+            betaValue = math.degrees(math.acos(
+                (math.cos(math.radians(bValue)) - math.cos(math.radians(cValue)) * math.cos(math.radians(aValue))) /
+                (math.sin(math.radians(cValue)) * math.sin(math.radians(aValue)))
+            ))
+
+            # Calculate angle Gamma
+            gammaValue = math.degrees(math.acos(
+                (math.cos(math.radians(cValue)) - math.cos(math.radians(aValue)) * math.cos(math.radians(bValue))) /
+                (math.sin(math.radians(aValue)) * math.sin(math.radians(bValue)))
+            ))
+
+        else:
+            print(">> Length of the sides are invalid!\n>> They violate the triangle inequality!")
+
+
+    elif(aValue != 0 and bValue != 0 and gammaValue != 0):
+
+        # Calculate side C 
+        cValue = math.degrees(math.atan(
+            math.sqrt((math.sin(math.radians(aValue)) * math.cos(math.radians(bValue)) -
+            math.cos(math.radians(aValue)) * math.sin(math.radians(bValue)) * math.cos(math.radians(gammaValue)))**2 + 
+            (math.sin(math.radians(bValue)) * math.sin(math.radians(gammaValue)))**2) /
+            (math.cos(math.radians(aValue)) * math.cos(math.radians(bValue)) + 
+            math.sin(math.radians(aValue)) * math.sin(math.radians(aValue)) * math.cos(math.radians(gammaValue)))
+        ))
+
+        # calculate angle Alpha
+        alphaValue = math.degrees(math.atan(
+            (math.sin(math.radians(aValue) * math.sin(math.radians(gammaValue)))) /
+            (math.sin(math.radians(bValue)) * math.cos(math.radians(aValue)) - 
+            math.cos(math.radians(bValue)) * math.sin(math.radians(aValue)) * math.cos(math.radians(gammaValue)))
+        ))
+
+        # Calculate angle Beta
+        betaValue = math.degrees(math.atan(
+            (math.sin(math.radians(bValue) * math.sin(math.radians(gammaValue)))) /
+            (math.sin(math.radians(aValue)) * math.cos(math.radians(bValue)) - 
+            math.cos(math.radians(aValue)) * math.sin(math.radians(bValue)) * math.cos(math.radians(gammaValue)))
+        ))
+
+    elif(bValue != 0 and cValue != 0 and alphaValue != 0): 
+
+        # Calculate side A 
+        aValue = math.degrees(math.atan(
+            math.sqrt((math.sin(math.radians(bValue)) * math.cos(math.radians(cValue)) -
+            math.cos(math.radians(bValue)) * math.sin(math.radians(cValue)) * math.cos(math.radians(alphaValue)))**2 + 
+            (math.sin(math.radians(cValue)) * math.sin(math.radians(alphaValue)))**2) /
+            (math.cos(math.radians(bValue)) * math.cos(math.radians(cValue)) + 
+            math.sin(math.radians(bValue)) * math.sin(math.radians(bValue)) * math.cos(math.radians(alphaValue)))
+        ))
+
+        # calculate angle Gamma
+        betaValue = math.degrees(math.atan(
+            (math.sin(math.radians(bValue) * math.sin(math.radians(alphaValue)))) /
+            (math.sin(math.radians(cValue)) * math.cos(math.radians(bValue)) - 
+            math.cos(math.radians(cValue)) * math.sin(math.radians(bValue)) * math.cos(math.radians(alphaValue)))
+        ))
+
+        # Calculate angle Alpha
+        gammaValue = math.degrees(math.atan(
+            (math.sin(math.radians(cValue) * math.sin(math.radians(alphaValue)))) /
+            (math.sin(math.radians(bValue)) * math.cos(math.radians(cValue)) - 
+            math.cos(math.radians(bValue)) * math.sin(math.radians(cValue)) * math.cos(math.radians(alphaValue)))
+        ))
+    
+    elif(aValue != 0 and cValue != 0 and betaValue != 0):
+
+        # Calculate side C 
+        bValue = math.degrees(math.atan(
+            math.sqrt((math.sin(math.radians(cValue)) * math.cos(math.radians(aValue)) -
+            math.cos(math.radians(cValue)) * math.sin(math.radians(aValue)) * math.cos(math.radians(betaValue)))**2 + 
+            (math.sin(math.radians(aValue)) * math.sin(math.radians(betaValue)))**2) /
+            (math.cos(math.radians(cValue)) * math.cos(math.radians(aValue)) + 
+            math.sin(math.radians(cValue)) * math.sin(math.radians(cValue)) * math.cos(math.radians(betaValue)))
+        ))
+
+        # calculate angle Alpha
+        gammaValue = math.degrees(math.atan(
+            (math.sin(math.radians(cValue) * math.sin(math.radians(betaValue)))) /
+            (math.sin(math.radians(aValue)) * math.cos(math.radians(cValue)) - 
+            math.cos(math.radians(aValue)) * math.sin(math.radians(cValue)) * math.cos(math.radians(betaValue)))
+        ))
+
+        # Calculate angle Beta
+        alphaValue = math.degrees(math.atan(
+            (math.sin(math.radians(aValue) * math.sin(math.radians(betaValue)))) /
+            (math.sin(math.radians(cValue)) * math.cos(math.radians(aValue)) - 
+            math.cos(math.radians(cValue)) * math.sin(math.radians(aValue)) * math.cos(math.radians(betaValue)))
+        ))
+
+
+    elif((aValue != 0 and bValue != 0 and alphaValue != 0) or (aValue != 0 and bValue != 0 and betaValue != 0) or 
+        (bValue != 0 and cValue != 0 and betaValue != 0) or (bValue != 0 and cValue != 0 and gammaValue != 0) or
+        (aValue != 0 and cValue != 0 and betaValue != 0) or (aValue != 0 and cValue != 0 and gammaValue != 0)):
+        pass
+
+
+    elif((aValue != 0 and betaValue != 0 and gammaValue != 0) or 
+        (bValue != 0 and alphaValue != 0 and gammaValue != 0) or
+        (cValue != 0 and alphaValue != 0 and betaValue != 0)):
+        pass
+
+    
+    elif((aValue != 0 and alphaValue != 0 and betaValue != 0) or (aValue != 0 and alphaValue != 0 and gammaValue != 0) or
+        (bValue != 0 and betaValue != 0 and alphaValue != 0) or (bValue != 0 and betaValue != 0 and gammaValue != 0) or
+        (cValue != 0 and gammaValue != 0 and alphaValue != 0) or (aValue != 0 and gammaValue != 0 and betaValue != 0)):
+        pass
+
+
+    elif(alphaValue != 0 and betaValue != 0 and gammaValue != 0):
+        pass
+
+
+    else:
+        aValue = None
+        bValue = None
+        cValue = None
+        alphaValue = None
+        betaValue = None
+        gammaValue = None
+
+
+    return(aValue, bValue, cValue, alphaValue, betaValue, gammaValue)
+
+
+
+################################################################
+########                                                ########
+########   6. DRAW THE SUN'S ANNUAL PATH ON A SUNDIAL   ########
+########                                                ########
+################################################################
+
+def SundialPrecalculations(Planet, Latitude, Longitude, LocalDateYear, LocalDateMonth, LocalDateDay):
+
+    # We would like to calculate rising and setting time
+    AltitudeOfSun = 0
+
+    # Daylight start and end LT
+    (LocalTimeSetDaylight, LocalHoursSetDaylight, LocalMinutesSetDaylight, LocalSecondsSetDaylight, LocalDateYearSetDaylight, LocalDateMonthSetDaylight, LocalDateDaySetDaylight, 
+    LocalTimeRiseDaylight, LocalHoursRiseDaylight, LocalMinutesRiseDaylight, LocalSecondsRiseDaylight, LocalDateYearRiseDaylight, LocalDateMonthRiseDaylight, LocalDateDayRiseDaylight) = SunSetAndRiseDateTime(Planet, Latitude, Longitude, AltitudeOfSun, LocalDateYear, LocalDateMonth, LocalDateDay)
+
+    # Calculate the Coordinates of the Sun's Apparent Position
+    # Now UT = 0
+    UnitedHours = 0
+    UnitedMinutes = 0
+    UnitedSeconds = 0
+    JulianDays = CalculateJulianDate(LocalDateYear, LocalDateMonth, LocalDateDay, UnitedHours, UnitedMinutes, UnitedSeconds)
+    RightAscensionSun, DeclinationSun, EclLongitudeSun, Jtransit = SunsCoordinatesCalc(Planet, Longitude, JulianDays)
+    LocalHourAngleSun_Pos, LocalHourAngleSun_Orig = SunsLocalHourAngle(Planet, Latitude, Longitude, DeclinationSun, EclLongitudeSun, AltitudeOfSun)
+
+    # Calculate Local Mean Sidereal Time for both Rising and Setting time
+    LocalSiderealHoursRise, LocalSiderealMinutesRise, LocalSiderealSecondsRise, UnitedHoursRise, UnitedMinutesRise, UnitedSecondsRise, GreenwichSiderealHoursRise, GreenwichSiderealMinutesRise, GreenwichSiderealSecondsRise = LocalSiderealTimeCalc(Longitude, LocalHoursRiseDaylight, LocalMinutesRiseDaylight, LocalSecondsRiseDaylight, LocalDateYearRiseDaylight, LocalDateMonthRiseDaylight, LocalDateDayRiseDaylight)
+    LocalSiderealHoursSet, LocalSiderealMinutesSet, LocalSiderealSecondsSet, UnitedHoursSet, UnitedMinutesSet, UnitedSecondsSet, GreenwichSiderealHoursSet, GreenwichSiderealMinutesSet, GreenwichSiderealSecondsSet = LocalSiderealTimeCalc(Longitude, LocalHoursSetDaylight, LocalMinutesSetDaylight, LocalSecondsSetDaylight, LocalDateYearSetDaylight, LocalDateMonthSetDaylight, LocalDateDaySetDaylight)
+
+    # Convert them to Decimal
+    LocalSiderealTimeRise = LocalSiderealHoursRise + LocalSiderealMinutesRise/60 + LocalSiderealSecondsRise/3600
+    LocalSiderealTimeSet = LocalSiderealHoursSet + LocalSiderealMinutesSet/60 + LocalSiderealSecondsSet/3600
+
+    # Calculate Hour Angle of Rising and Setting Sun
+    LocalHourAngleRise = LocalSiderealTimeRise - RightAscensionSun
+    LocalHourAngleSet = LocalSiderealTimeSet - RightAscensionSun
+
+    # Normalize Results
+    LocalHourAngleRise = NormalizeZeroBounded(LocalHourAngleRise, 24)
+    LocalHourAngleSet = NormalizeZeroBounded(LocalHourAngleSet, 24)
+
+    return(LocalHourAngleRise, LocalHourAngleSet, DeclinationSun)
+
+def SundialParametersCalc(Latitude, LocalHourAngle, DeclinationSun):
+
+    # Convert to angles from hours (t -> H)
+    LocalHourAngleDegrees = LocalHourAngle * 15
+
+    # Calculate Altitude (m)
+    # sin(m) = sin(δ) * sin(φ) + cos(δ) * cos(φ) * cos(H)
+    Latitude, sinLat, cosLat = SiteTrigonometry(Latitude)
+    Altsin = math.sin(math.radians(DeclinationSun)) * sinLat + math.cos(math.radians(DeclinationSun)) * cosLat * math.cos(math.radians(LocalHourAngleDegrees))
+    if(Altsin <= 1):
+        Altitude = math.degrees(math.asin(Altsin))
+    else:
+        Altitude = math.degrees(math.asin(2 - Altsin))
+    # Normalize Altitude
+    # Altitude: [-π/2,+π/2]
+    Altitude = NormalizeSymmetricallyBoundedPI_2(Altitude)
+
+    # We should draw 1/tan(m) of the function of (AzimuthMax - AzimuthMin)
+    ShadowLength = 1/math.tan(math.radians(Altitude))
+
+    '''# Calculate Azimuth (A)
+    # sin(A) = - sin(H) * cos(δ) / cos(m)
+    # Azimuth at given H Local Hour Angle
+    Azsin = - math.sin(math.radians(LocalHourAngleDegrees)) * math.cos(math.radians(DeclinationSun)) / math.cos(math.radians(Altitude))
+    if(Azsin <= 1 and Azsin >= -1):
+        Azimuth1 = math.degrees(math.asin(Azsin))
+    elif(Azsin > 1):
+        Azimuth1 = 180 - math.degrees(math.asin(2 - Azsin))
+    else:
+        Azimuth1 = - 180 + math.degrees(math.asin(2 + Azsin))
+
+    Azimuth1 = NormalizeZeroBounded(Azimuth1, 360)
+
+    if(Azimuth1 <= 180):
+        Azimuth2 = 180 - Azimuth1
+
+    elif(Azimuth1 > 180):
+        Azimuth2 = 540 - Azimuth1
+
+    # Calculate Azimuth (A) with a second method, to determine which one is the correct (A_1 or A_2?)
+    # cos(A) = (sin(δ) - sin(φ) * sin(m)) / (cos(φ) * cos(m))
+    Azcos = (math.sin(math.radians(DeclinationSun)) - math.sin(math.radians(Latitude)) * math.sin(math.radians(Altitude))) / (math.cos(math.radians(Latitude)) * math.cos(math.radians(Altitude)))
+    if(Azcos <= 1 and Azcos >= -1):
+        Azimuth3 = math.degrees(math.acos(Azcos))
+
+    elif(Azcos < -1):
+        Azimuth3 = 180 + math.degrees(math.asin(2 + Azcos))
+
+    else:
+        Azimuth3 = math.degrees(math.asin(2 - Azcos))
+
+    Azimuth3 = NormalizeZeroBounded(Azimuth3, 360)
+
+    Azimuth4 = - Azimuth3
+
+    # Normalize negative result
+    # Azimuth: [0,+2π[
+    Azimuth4 = NormalizeZeroBounded(Azimuth4, 360)
+
+    # Compare Azimuth values
+    if(Azimuth1 + 3 > Azimuth3 and Azimuth1 - 3 < Azimuth3):
+        Azimuth = Azimuth1
+
+    elif(Azimuth1 + 3 > Azimuth4 and Azimuth1 - 3 < Azimuth4):
+        Azimuth = Azimuth1
+
+    elif(Azimuth2 + 3 > Azimuth3 and Azimuth2 - 3 < Azimuth3):
+        Azimuth = Azimuth2
+
+    elif(Azimuth2 + 3 > Azimuth4 and Azimuth2 - 3 < Azimuth4):
+        Azimuth = Azimuth2
+
+    # Normalize Azimuth
+    # Azimuth: [0,+2π[
+    Azimuth = NormalizeZeroBounded(Azimuth, 360)'''
+
+    Azimuth = 0
+
+    return(Altitude, Azimuth, ShadowLength)
+
+
+
+################################################################
+########                                                ########
+########             7. DRAW SUN ANALEMMA               ########
+########                                                ########
+################################################################
+
+def SunAnalemma(Planet, Latitude, Longitude, LocalDateYear, LocalDateMonth, LocalDateDay):
+
+    (LocalHoursNoon, LocalMinutesNoon, LocalSecondsNoon, LocalDateYearNoon, LocalDateMonthNoon, LocalDateDayNoon,
+    LocalHoursMidnight, LocalMinutesMidnight, LocalSecondsMidnight, LocalDateYearMidnight, LocalDateMonthMidnight, LocalDateDayMidnight,
+    LocalHoursRiseDaylight, LocalMinutesRiseDaylight, LocalSecondsRiseDaylight, LocalDateYearRiseDaylight, LocalDateMonthRiseDaylight, LocalDateDayRiseDaylight,
+    LocalHoursSetDaylight, LocalMinutesSetDaylight, LocalSecondsSetDaylight, LocalDateYearSetDaylight, LocalDateMonthSetDaylight, LocalDateDaySetDaylight,
+    LocalHoursRiseCivil, LocalMinutesRiseCivil, LocalSecondsRiseCivil, LocalDateYearRiseCivil, LocalDateMonthRiseCivil, LocalDateDayRiseCivil,
+    LocalHoursSetCivil, LocalMinutesSetCivil, LocalSecondsSetCivil, LocalDateYearSetCivil, LocalDateMonthSetCivil, LocalDateDaySetCivil,
+    LocalHoursRiseNaval, LocalMinutesRiseNaval, LocalSecondsRiseNaval, LocalDateYearRiseNaval, LocalDateMonthRiseNaval, LocalDateDayRiseNaval,
+    LocalHoursSetNaval, LocalMinutesSetNaval, LocalSecondsSetNaval, LocalDateYearSetNaval, LocalDateMonthSetNaval, LocalDateDaySetNaval,
+    LocalHoursRiseAstro, LocalMinutesRiseAstro, LocalSecondsRiseAstro, LocalDateYearSetAstro, LocalDateMonthSetAstro, LocalDateDaySetAstro,
+    LocalHoursSetAstro, LocalMinutesSetAstro, LocalSecondsSetAstro, LocalDateYearRiseAstro, LocalDateMonthRiseAstro, LocalDateDayRiseAstro) = TwilightCalc(Planet, Latitude, Longitude, LocalDateYear, LocalDateMonth, LocalDateDay)
+
+    # Calculate Local Mean Sidereal Time
+    (LocalSiderealHours, LocalSiderealMinutes, LocalSiderealSeconds,
+    UnitedHours, UnitedMinutes, UnitedSeconds, 
+    GreenwichSiderealHours, GreenwichSiderealMinutes, GreenwichSiderealSeconds) = LocalSiderealTimeCalc(Longitude, LocalHoursNoon, LocalMinutesNoon, LocalSecondsNoon, LocalDateYearNoon, LocalDateMonthNoon, LocalDateDayNoon)
+
+    # Convert LT noon to UT noon time
+    UnitedTime, UnitedHours, UnitedMinutes, UnitedSeconds, UnitedDateYear, UnitedDateMonth, UnitedDateDay = LTtoUT(Longitude, LocalHoursNoon, LocalMinutesNoon, LocalSecondsNoon, LocalDateYearNoon, LocalDateMonthNoon, LocalDateDayNoon)
+
+    # Calculate corresponding Julian Date
+    JulianDays = CalculateJulianDate(UnitedDateYear, UnitedDateMonth, UnitedDateDay, UnitedHours, UnitedMinutes, UnitedSeconds)
+
+    # Calculate Sun's position at this time
+    RightAscensionSun, DeclinationSun, EclLongitudeSun, Jtransit = SunsCoordinatesCalc(Planet, Longitude, JulianDays)
+
+    # Convert to horizontal
+    LocalSiderealTime = LocalSiderealHours + LocalSiderealMinutes/60 + LocalSiderealSeconds/3600
+    LocalHourAngle = LocalSiderealTime - RightAscensionSun
+    # Normalize output
+    LocalHourAngle = NormalizeZeroBounded(LocalHourAngle, 24)
+    Altitude = None
+    Altitude, Azimuth = EquIToHor(Latitude, RightAscensionSun, DeclinationSun, Altitude, LocalSiderealTime, LocalHourAngle)
+
+    return(LocalHourAngle, Altitude)
@@ -0,0 +1,315 @@
+################################################################
+########                                                ########
+########      LARGE (MEMORY-MAPPED) SITE GAZETTEERS     ########
+########                                                ########
+################################################################
+
+# Gazetteers are stored in a compact structured array, one record per site:
+# Name, normalized Name (Key), Latitude (φ, degrees), Longitude (λ, degrees)
+# and Time zone (hours, without summer time, NaN if unknown, see
+# ObserverContext)
+#
+# Names are normalized by dropping accents, case and every character, which
+# isn't a letter or a digit, so "New York", "new-york" and "NewYork" are the
+# same, like "Győr" and "Gyor"
+# Records are sorted by their Keys, so the Key column is both the exact and
+# the prefix (partial name) index: Names with the same normalized prefix are
+# one contiguous slice, found with two binary searches. Nothing has to be
+# built when a gazetteer is opened, and searches only touch O(log N) pages of
+# memory-mapped gazetteers
+#
+# Gazetteers are saved as .npy files and opened memory-mapped (read-only),
+# like catalogs (see catalog.py). Text (CSV) gazetteers are parsed once, and
+# saved next to the source file
+#
+# LocationDict stays the default mini-gazetteer, and Gazetteer can be used in
+# place of it: Sites["Budapest"] gives [Latitude, Longitude], like
+# LocationDict does
+
+import csv
+import datetime
+import functools
+import itertools
+import os
+import unicodedata
+
+import numpy as np
+
+from .catalog import CacheFileName, EncodeNames
+from .core import LocationDict, ObserverContext
+
+# Maximal length of the Names and Keys in bytes
+NameLength = 64
+
+# Record format of the gazetteers
+GazetteerDType = np.dtype([("Name", "S{0}".format(NameLength)),
+                           ("Key", "S{0}".format(NameLength)),
+                           ("Latitude", np.float64),
+                           ("Longitude", np.float64),
+                           ("TimeZone", np.float32)])
+
+# Number of rows parsed at once from text gazetteers
+ParseChunkSize = 65536
+
+
+################################################################
+########                                                ########
+########                GAZETTEER ARRAYS                ########
+########                                                ########
+################################################################
+
+# Normalized form of a Name, see above
+def NormalizeName(Name):
+
+    Decomposed = unicodedata.normalize("NFKD", Name).casefold()
+
+    return("".join(Character for Character in Decomposed if Character.isalnum()))
+
+# Normalized Keys of Names, as bytes
+# Raises ValueError if a Key is longer than NameLength bytes
+def _Keys(Names):
+
+    return(EncodeNames([NormalizeName(Name) for Name in Names], NameLength))
+
+# Time zone in hours from a text field
+# The field is a number of hours, or a tz database name (eg. Europe/Budapest),
+# then its standard offset (without summer time) is used. Unknown fields
+# give NaN
+@functools.lru_cache(maxsize=None)
+def _TimeZoneHours(Field):
+
+    Field = Field.strip()
+    if(not Field):
+        return(np.nan)
+
+    try:
+        return(float(Field))
+    except ValueError:
+        pass
+
+    try:
+        import zoneinfo
+        Zone = zoneinfo.ZoneInfo(Field)
+    except (ImportError, ValueError, LookupError):
+        return(np.nan)
+
+    Instant = datetime.datetime(2000, 1, 1, tzinfo=Zone)
+
+    return((Instant.utcoffset() - Instant.dst()).total_seconds() / 3600)
+
+# Structured gazetteer array from Names, Latitudes and Longitudes in degrees
+# and optionally Time zones in hours, sorted by the normalized Names
+# Raises ValueError if a Name or its Key is longer than NameLength bytes,
+# so Names are never truncated, and different Names never share a Key by
+# truncation
+def GazetteerRecords(Names, Latitude, Longitude, TimeZone=None):
+
+    Names = np.asarray(Names, dtype=str)
+
+    Records = np.zeros(Names.size, dtype=GazetteerDType)
+    Records["Name"] = EncodeNames(Names, NameLength)
+    Records["Key"] = _Keys(Names.tolist())
+    Records["Latitude"] = Latitude
+    Records["Longitude"] = Longitude
+    Records["TimeZone"] = np.nan if TimeZone is None else TimeZone
+
+    return(Records[np.argsort(Records["Key"], kind="stable")])
+
+# A gazetteer, or a slice of one
+# Slicing (Sites[1000:2000], Sites[Mask]) gives a Gazetteer again, but only
+# sorted slices (eg. of Search()) can be searched
+class Gazetteer:
+
+    def __init__(self, Records):
+
+        self.Records = Records
+
+    # Gazetteer from a dictionary with the format of LocationDict
+    @classmethod
+    def FromDict(cls, Locations=LocationDict):
+
+        Coordinates = np.array(list(Locations.values()), dtype=float).reshape(-1, 2)
+
+        return(cls(GazetteerRecords(list(Locations.keys()), Coordinates[:,0], Coordinates[:,1])))
+
+    def __len__(self):
+
+        return(self.Records.shape[0])
+
+    def __repr__(self):
+
+        return("Gazetteer({0} Sites)".format(len(self)))
+
+    # Sites["Name"] gives [Latitude, Longitude] (like LocationDict), anything
+    # else (slices, masks, index arrays) gives a Gazetteer
+    def __getitem__(self, Key):
+
+        if(isinstance(Key, str)):
+            Record = self.Records[self.Lookup(Key)]
+            return([float(Record["Latitude"]), float(Record["Longitude"])])
+
+        return(Gazetteer(np.atleast_1d(self.Records[Key])))
+
+    def __contains__(self, Name):
+
+        return(self.Matches(Name).size > 0)
+
+    # Indices of the sites with the Key of Name, or with Keys starting with it
+    # Keys longer than NameLength bytes can't be in the gazetteer
+    def _Range(self, Name, Prefix):
+
+        Key = NormalizeName(Name).encode("utf-8")
+        if(len(Key) > NameLength):
+            return(np.arange(0))
+
+        Keys = self.Records["Key"]
+        Start = np.searchsorted(Keys, Key, side="left")
+        # No UTF-8 encoded text contains a 0xFF byte
+        End = np.searchsorted(Keys, Key + b"\xff" if Prefix else Key, side="right")
+
+        return(np.arange(Start, End))
+
+    # Indices of every site with the Name (case, accents and punctuation are
+    # ignored), eg. of towns with the same Name
+    def Matches(self, Name):
+
+        return(self._Range(Name, Prefix=False))
+
+    # Index of a site in the gazetteer, the first one of Matches()
+    # Raises KeyError if the site is not in the gazetteer
+    def Lookup(self, Name):
+
+        Indices = self.Matches(Name)
+        if(Indices.size == 0):
+            raise KeyError(Name)
+
+        return(int(Indices[0]))
+
+    # Indices of the sites with Names starting with Prefix (case, accents and
+    # punctuation are ignored), at most Limit of them
+    def Search(self, Prefix, Limit=None):
+
+        Indices = self._Range(Prefix, Prefix=True)
+
+        return(Indices if Limit is None else Indices[:Limit])
+
+    # Observer at a site of the gazetteer, see ObserverContext
+    # Raises KeyError if the site is not in the gazetteer
+    def Observer(self, Name, TimeZone=None):
+
+        Record = self.Records[self.Lookup(Name)]
+        if(TimeZone is None and not np.isnan(Record["TimeZone"])):
+            TimeZone = float(Record["TimeZone"])
+
+        return(ObserverContext(float(Record["Latitude"]), float(Record["Longitude"]), TimeZone, Record["Name"].decode("utf-8", "ignore")))
+
+    @property
+    def Names(self):
+
+        return(np.char.decode(self.Records["Name"], "utf-8", "ignore"))
+
+    @property
+    def Latitude(self):
+
+        return(self.Records["Latitude"])
+
+    @property
+    def Longitude(self):
+
+        return(self.Records["Longitude"])
+
+    @property
+    def TimeZone(self):
+
+        return(self.Records["TimeZone"])
+
+# The built-in LocationDict as a Gazetteer
+@functools.lru_cache(maxsize=1)
+def DefaultGazetteer():
+
+    return(Gazetteer.FromDict(LocationDict))
+
+
+
+################################################################
+########                                                ########
+########          SAVING AND OPENING GAZETTEERS         ########
+########                                                ########
+################################################################
+
+# Save a gazetteer (Gazetteer or structured array) as a .npy file
+def SaveGazetteer(Sites, FileName):
+
+    Records = Sites.Records if isinstance(Sites, Gazetteer) else Sites
+    np.save(FileName, np.asarray(Records, dtype=GazetteerDType), allow_pickle=False)
+
+# Open a saved .npy gazetteer memory-mapped (read-only)
+def OpenGazetteer(FileName):
+
+    Records = np.load(FileName, mmap_mode="r", allow_pickle=False)
+    if(Records.dtype != GazetteerDType):
+        raise ValueError("{0} is not a gazetteer file!".format(FileName))
+
+    return(Gazetteer(Records))
+
+# Whether a .npy file is a gazetteer of the actual format
+def _IsGazetteerFile(FileName):
+
+    try:
+        return(np.load(FileName, mmap_mode="r", allow_pickle=False).dtype == GazetteerDType)
+    except ValueError:
+        return(False)
+
+# Parse a delimited text (CSV) gazetteer
+# Columns are the column indices of the Name, Latitude (degrees), Longitude
+# (degrees) and Time zone (hours or tz database name). Missing columns are
+# None
+def ReadTextGazetteer(FileName, Delimiter=",", SkipRows=0, Columns=(0, 1, 2, 3)):
+
+    NameColumn, LatitudeColumn, LongitudeColumn, TimeZoneColumn = tuple(Columns) + (None,) * (4 - len(Columns))
+
+    Chunks = []
+    with open(FileName, newline="", encoding="utf-8") as File:
+        Rows = csv.reader(itertools.islice(File, SkipRows, None), delimiter=Delimiter)
+
+        while(True):
+            Chunk = list(itertools.islice(Rows, ParseChunkSize))
+            if(not Chunk):
+                break
+
+            Chunk = [Row for Row in Chunk if Row]
+            Names = [Row[NameColumn].strip() for Row in Chunk]
+            Latitude = np.array([Row[LatitudeColumn] for Row in Chunk], dtype=float)
+            Longitude = np.array([Row[LongitudeColumn] for Row in Chunk], dtype=float)
+            TimeZone = None
+            if(TimeZoneColumn is not None):
+                TimeZone = np.array([_TimeZoneHours(Row[TimeZoneColumn]) if len(Row) > TimeZoneColumn else np.nan for Row in Chunk], dtype=np.float32)
+
+            Chunks.append(GazetteerRecords(Names, Latitude, Longitude, TimeZone))
+
+    if(not Chunks):
+        return(Gazetteer(np.zeros(0, dtype=GazetteerDType)))
+
+    Records = np.concatenate(Chunks)
+
+    return(Gazetteer(Records[np.argsort(Records["Key"], kind="stable")]))
+
+# Open a gazetteer file memory-mapped
+# .npy files are opened directly. Text files are parsed on the first call
+# and saved next to them (see catalog.CacheFileName()), which is reused
+# until the text file changes (or the format of the gazetteers changes)
+def LoadGazetteer(FileName, Delimiter=",", SkipRows=0, Columns=(0, 1, 2, 3)):
+
+    if(FileName.endswith(".npy")):
+        return(OpenGazetteer(FileName))
+
+    Columns = tuple(Columns) + (None,) * (4 - len(Columns))
+    CacheName = CacheFileName(FileName, Delimiter, SkipRows, Columns)
+    if(not os.path.exists(CacheName) or os.path.getmtime(CacheName) < os.path.getmtime(FileName) or not _IsGazetteerFile(CacheName)):
+        # Write to a temporary file first, so other processes never open a
+        # partially written gazetteer
+        TemporaryName = "{0}.{1}.tmp.npy".format(FileName, os.getpid())
+        SaveGazetteer(ReadTextGazetteer(FileName, Delimiter, SkipRows, Columns), TemporaryName)
+        os.replace(TemporaryName, CacheName)
+
+    return(OpenGazetteer(CacheName))
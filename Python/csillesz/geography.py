@@ -0,0 +1,165 @@
+################################################################
+########                                                ########
+########     BATCH GEOGRAPHICAL DISTANCES OF SITES      ########
+########                                                ########
+################################################################
+
+# Vectorized counterparts of GeogDistCalc() and GeogDistLocationCalc()
+# Sites are given by their Latitudes (φ) and Longitudes (λ) in degrees,
+# distances are great-circle distances in meters on a sphere of radius R:
+# d = R * hav_2, where hav_2 is the haversine angle (see
+# separation.HaversineAngleArray())
+#
+# Matrices use the unit vectors (v) of the sites, calculated once, since
+# hav_1 = |v_1 - v_2|^2 / 4, so hav_2 = 2 * asin(|v_1 - v_2| / 2)
+# which needs no trigonometry per pair, except asin()
+#
+# N x N matrices are calculated in blocks of BlockSize x BlockSize, so they
+# can be written into memory-mapped outputs, when N^2 doesn't fit into the
+# memory. The condensed form keeps only the upper triangle (i < j) of the
+# symmetric matrix, row by row, with N * (N - 1) / 2 elements
+
+import functools
+
+import numpy as np
+
+from .batch import NormalizeSymmetricallyBoundedPIArray
+from .core import LocationDict, R
+from .rotation import SphericalToVector
+from .separation import DefaultBlockSize, HaversineAngleArray
+
+
+################################################################
+########                                                ########
+########               UTILITY FUNCTIONS                ########
+########                                                ########
+################################################################
+
+# Names, Latitudes and Longitudes of a location dictionary as arrays
+# Format of the dictionary is the same as LocationDict's
+def LocationArrays(Locations=LocationDict):
+
+    Names = np.array(list(Locations.keys()))
+    Coordinates = np.array(list(Locations.values()), dtype=float).reshape(-1, 2)
+
+    return(Names, Coordinates[:,0], Coordinates[:,1])
+
+# Unit vectors of sites
+def SiteVectors(Latitude, Longitude):
+
+    return(np.atleast_2d(SphericalToVector(Longitude, NormalizeSymmetricallyBoundedPIArray(Latitude))))
+
+# Distance in meters from the chord length |v_1 - v_2| of unit vectors
+# d = R * 2 * asin(|v_1 - v_2| / 2)
+def ChordToDistance(Chord):
+
+    return(R * 2 * np.arcsin(np.minimum(np.asarray(Chord) / 2, 1)))
+
+# Chord length of unit vectors from the distance in meters
+# |v_1 - v_2| = 2 * sin(d / (2 * R))
+def DistanceToChord(Distance):
+
+    return(2 * np.sin(np.minimum(np.asarray(Distance, dtype=float) / (2 * R), np.pi / 2)))
+
+# Squared chord lengths of all pairs of two sets of unit vectors
+def ChordSquaredMatrix(Vectors1, Vectors2):
+
+    ChordSquared = np.zeros((Vectors1.shape[0], Vectors2.shape[0]))
+    for Axis in range(3):
+        Difference = Vectors1[:,Axis,None] - Vectors2[None,:,Axis]
+        ChordSquared += Difference * Difference
+
+    return(ChordSquared)
+
+# Distances in meters of all pairs of two sets of sites, given by their
+# unit vectors
+def _ChordDistances(Vectors1, Vectors2):
+
+    return(ChordToDistance(np.sqrt(ChordSquaredMatrix(Vectors1, Vectors2))))
+
+# Position of the (i, j) element (i < j) of an N x N matrix in its
+# condensed form
+def CondensedIndex(i, j, N):
+
+    i = np.asarray(i)
+    j = np.asarray(j)
+
+    return(N * i - i * (i + 1) // 2 + j - i - 1)
+
+
+
+################################################################
+########                                                ########
+########            2. GEOGRAPHICAL DISTANCE            ########
+########                                                ########
+################################################################
+
+# Distances of sites in meters (broadcasted)
+# Same parameters as GeogDistCalc()
+def GeogDistBatch(Latitude1, Latitude2, Longitude1, Longitude2):
+
+    # Latitude: [-π,+π]
+    Latitude1 = NormalizeSymmetricallyBoundedPIArray(Latitude1)
+    Latitude2 = NormalizeSymmetricallyBoundedPIArray(Latitude2)
+
+    # d = R * hav_2
+    return(R * np.radians(HaversineAngleArray(Latitude1, Latitude2, Longitude1, Longitude2)))
+
+# N x M distance matrix of sites in meters, calculated in blocks
+# If the second set of sites is not given, the matrix of the first set
+# against itself is calculated
+# Out can be a preallocated (N,M) array, eg. a numpy.memmap for matrices
+# larger than the memory
+def GeogDistMatrix(Latitude1, Longitude1, Latitude2=None, Longitude2=None, BlockSize=DefaultBlockSize, Out=None, DType=np.float64):
+
+    Vectors1 = SiteVectors(Latitude1, Longitude1)
+    Vectors2 = Vectors1 if Latitude2 is None else SiteVectors(Latitude2, Longitude2)
+
+    if(Out is None):
+        Out = np.empty((Vectors1.shape[0], Vectors2.shape[0]), dtype=DType)
+
+    for RowStart in range(0, Vectors1.shape[0], BlockSize):
+        for ColumnStart in range(0, Vectors2.shape[0], BlockSize):
+            Out[RowStart:RowStart + BlockSize, ColumnStart:ColumnStart + BlockSize] = _ChordDistances(Vectors1[RowStart:RowStart + BlockSize], Vectors2[ColumnStart:ColumnStart + BlockSize])
+
+    return(Out)
+
+# Condensed distance matrix of N sites in meters (upper triangle, i < j)
+# The element of sites i < j is at CondensedIndex(i, j, N)
+# Rows are calculated in blocks of about BlockSize^2 elements
+# Out can be a preallocated array of N * (N - 1) / 2 elements
+def GeogDistCondensed(Latitude, Longitude, BlockSize=DefaultBlockSize, Out=None, DType=np.float64):
+
+    Vectors = SiteVectors(Latitude, Longitude)
+    N = Vectors.shape[0]
+
+    if(Out is None):
+        Out = np.empty(N * (N - 1) // 2, dtype=DType)
+
+    # Rows RowStart... against columns RowStart..., so the elements with
+    # j > i of the block are a contiguous run of the condensed form
+    RowStart = 0
+    while(RowStart < N - 1):
+        Rows = max(1, min(N - 1 - RowStart, BlockSize**2 // max(N - RowStart, 1)))
+        RowEnd = RowStart + Rows
+
+        Block = _ChordDistances(Vectors[RowStart:RowEnd], Vectors[RowStart:])
+        Upper = np.arange(RowStart, N)[None,:] > np.arange(RowStart, RowEnd)[:,None]
+
+        Start = int(CondensedIndex(RowStart, RowStart + 1, N))
+        Out[Start:Start + int(Upper.sum())] = Block[Upper]
+
+        RowStart = RowEnd
+
+    return(Out)
+
+# Names and the N x N distance matrix (meters) of the sites in LocationDict
+# Calculated on the first call only, the matrix is read-only
+@functools.lru_cache(maxsize=1)
+def LocationDistanceMatrix():
+
+    Names, Latitude, Longitude = LocationArrays(LocationDict)
+    Matrix = GeogDistMatrix(Latitude, Longitude)
+    Matrix.setflags(write=False)
+
+    return(Names, Matrix)
@@ -0,0 +1,217 @@
+################################################################
+########                                                ########
+########     STAR IDENTIFICATION FROM ALT/AZ SIGHTINGS  ########
+########                                                ########
+################################################################
+
+# Measured (m, A) sightings at a site are converted to Equatorial II
+# (δ, α) coordinates at the LMST of every sighting (see HorToEquIIBatch()),
+# and every catalog star within Tolerance of a sighting is a candidate
+# (cone search on a SkyIndex)
+#
+# Candidates are verified by their pattern: angular separations between
+# stars don't depend on the site or the time, so if sightings i and j are
+# stars a and b, then d(a,b) = d(i,j) within the measurement errors
+# Systematic errors (eg. of the clock, or of the Azimuth's zero point) rotate
+# every sighting together, and don't change their separations, so
+# separations can be compared with a tighter PairTolerance than the
+# Tolerance of the positions
+# 1. Every candidate gets one vote from each of the nearest sightings,
+#    which has a candidate at the right separation from it
+# 2. The candidate with the most votes is chosen for every sighting
+# 3. A sighting is identified, if its star forms a triangle of consistent
+#    separations with two other identified sightings, and it is consistent
+#    with at least MinimalSupport of them. This is repeated, until no
+#    more sightings are rejected
+# 4. The common rotation of the identified sightings (systematic errors) is
+#    fitted, and every sighting is matched again to the candidate nearest
+#    to its corrected position, then 3. is repeated
+# So a wrong star, which happens to be near a sighting, is rejected
+
+import numpy as np
+
+from .batch import HorToEquIIBatch
+from .catalog import NameLength
+from .core import ObserverContext
+from .rotation import EquIIToVector
+from .sidereal import LocalSiderealTimeFromUnixTime
+from .skyindex import SkyIndex
+
+# Default matching tolerance of the sightings in degrees
+DefaultTolerance = 0.5
+
+# Default tolerance of the separations, relative to Tolerance
+DefaultPairToleranceRatio = 0.25
+
+# Number of nearest sightings voting on the candidates of a sighting
+VotingNeighbours = 12
+
+# Minimal fraction of the identified sightings, which an identified
+# sighting has to be consistent with
+MinimalSupport = 0.5
+
+
+# Candidates of the sightings from the index
+# Returns the sighting and the catalog index of every candidate, grouped by
+# sightings, and their distances from the sightings in degrees
+def _Candidates(Index, RightAscension, Declination, Tolerance):
+
+    Owners = []
+    Stars = []
+    Distances = []
+    for Sighting, (SightingRA, SightingDec) in enumerate(zip(RightAscension, Declination)):
+        Indices, Separations = Index.ConeSearch(SightingRA, SightingDec, Tolerance, Separations=True)
+        Owners.append(np.full(Indices.size, Sighting))
+        Stars.append(Indices)
+        Distances.append(Separations)
+
+    return(np.concatenate(Owners).astype(np.int64), np.concatenate(Stars).astype(np.int64), np.concatenate(Distances))
+
+# Separations are compared as cosines, so no arccos() is needed:
+# |d - d_measured| <= PairTolerance <=> cos(d_measured + PairTolerance) <= cos(d) <= cos(d_measured - PairTolerance)
+def _CosineBounds(MeasuredSeparations, PairTolerance):
+
+    Lower = np.cos(np.radians(np.minimum(MeasuredSeparations + PairTolerance, 180)))
+    Upper = np.cos(np.radians(np.maximum(MeasuredSeparations - PairTolerance, 0)))
+
+    return(Lower, Upper)
+
+# Number of the nearest sightings supporting every candidate (step 1.)
+def _Votes(Vectors, Owners, MeasuredSeparations, PairTolerance):
+
+    NumberOfSightings = MeasuredSeparations.shape[0]
+    NumberOfNeighbours = min(VotingNeighbours, NumberOfSightings - 1)
+    Neighbours = np.argsort(MeasuredSeparations + np.diag(np.full(NumberOfSightings, np.inf)), axis=1)[:,:NumberOfNeighbours]
+    LowerBounds, UpperBounds = _CosineBounds(MeasuredSeparations, PairTolerance)
+
+    # Candidates of a sighting are one contiguous run
+    Starts = np.searchsorted(Owners, np.arange(NumberOfSightings))
+    Ends = np.searchsorted(Owners, np.arange(NumberOfSightings), side="right")
+
+    Votes = np.zeros(Owners.size, dtype=np.int64)
+    for Sighting in np.flatnonzero(Ends > Starts):
+        Own = slice(Starts[Sighting], Ends[Sighting])
+
+        for Neighbour in Neighbours[Sighting]:
+            if(Ends[Neighbour] == Starts[Neighbour]):
+                continue
+
+            # One vote from a neighbour, even if more of its candidates are
+            # consistent
+            Cosines = Vectors[Own] @ Vectors[Starts[Neighbour]:Ends[Neighbour]].T
+            Votes[Own] += np.any((Cosines >= LowerBounds[Sighting, Neighbour]) & (Cosines <= UpperBounds[Sighting, Neighbour]), axis=1)
+
+    return(Votes)
+
+# Identified sightings among the chosen ones (step 3.)
+def _Consensus(ChosenVectors, MeasuredSeparations, PairTolerance):
+
+    Lower, Upper = _CosineBounds(MeasuredSeparations, PairTolerance)
+    Cosines = ChosenVectors @ ChosenVectors.T
+    Consistent = (Cosines >= Lower) & (Cosines <= Upper)
+    np.fill_diagonal(Consistent, False)
+
+    Accepted = np.ones(Consistent.shape[0], dtype=bool)
+    while(True):
+        Current = Consistent & Accepted[None,:] & Accepted[:,None]
+
+        # i is in a triangle, if it has a consistent neighbour j, which
+        # has a common consistent neighbour k with i
+        Paths = Current.astype(np.float32) @ Current.astype(np.float32)
+        InTriangle = np.any(Current & (Paths > 0), axis=1)
+        Supported = Current.sum(axis=1) >= MinimalSupport * (Accepted.sum() - 1)
+
+        Remaining = Accepted & InTriangle & Supported
+        if(np.array_equal(Remaining, Accepted)):
+            return(Accepted)
+        Accepted = Remaining
+
+# Rotation matrix, which rotates the measured unit vectors onto the stars'
+# ones the best (least squares, Kabsch's algorithm)
+def _FitRotation(MeasuredVectors, StarVectors):
+
+    U, S, Vt = np.linalg.svd(StarVectors.T @ MeasuredVectors)
+    Correction = np.diag([1, 1, np.sign(np.linalg.det(U @ Vt))])
+
+    return(U @ Correction @ Vt)
+
+# Identify sightings of catalog stars
+# Timestamps are UT (see sidereal.ToUnixTime()), Altitudes and Azimuths
+# are in degrees, measured at Latitude and Longitude (Latitude can also be
+# an ObserverContext, then Longitude can be omitted)
+# Catalog is a StarCatalog or a dictionary with the format of StellarDict
+# (StellarDict by default), or a prebuilt SkyIndex can be given as Index
+# Tolerance is the maximal error of the sightings in degrees, and
+# PairTolerance is the maximal error of the separations between sightings
+# (Tolerance / 4 by default, at most 2 * Tolerance is meaningful)
+# If Verify is False, the nearest candidate with the most votes is accepted
+# without steps 3. and 4. (eg. for less than 3 sightings)
+# Returns the catalog indices (-1 if unidentified) and Names ("" if
+# unidentified) of the sightings, and their distances from the stars
+def IdentifySightings(Timestamps, Altitude, Azimuth, Latitude, Longitude=None, Catalog=None, Index=None, Tolerance=DefaultTolerance, PairTolerance=None, Verify=True):
+
+    if(Longitude is None):
+        if(not isinstance(Latitude, ObserverContext)):
+            raise ValueError("Longitude is needed, if Latitude is not an ObserverContext!")
+        Longitude = Latitude
+
+    if(PairTolerance is None):
+        PairTolerance = DefaultPairToleranceRatio * Tolerance
+
+    if(Index is None):
+        Index = SkyIndex(Catalog)
+    Catalog = Index.Catalog
+
+    # Sightings in Equatorial II coordinates
+    LocalSiderealTime = LocalSiderealTimeFromUnixTime(Timestamps, Longitude)
+    Declination, RightAscension, LocalSiderealTime = HorToEquIIBatch(Latitude, Altitude, Azimuth, LocalSiderealTime)
+    RightAscension = np.atleast_1d(np.mod(RightAscension, 24))
+    Declination = np.atleast_1d(Declination)
+    MeasuredVectors = np.asarray(EquIIToVector(RightAscension, Declination), dtype=float)
+    NumberOfSightings = RightAscension.size
+
+    Identified = np.full(NumberOfSightings, -1, dtype=np.int64)
+    Residuals = np.full(NumberOfSightings, np.nan)
+    Names = np.full(NumberOfSightings, "", dtype="U{0}".format(NameLength))
+
+    Owners, Stars, Distances = _Candidates(Index, RightAscension, Declination, Tolerance)
+    if(Owners.size == 0):
+        return(Identified, Names, Residuals)
+
+    # Step 1: votes of the candidates
+    MeasuredSeparations = np.degrees(np.arccos(np.clip(MeasuredVectors @ MeasuredVectors.T, -1, 1)))
+    Vectors = np.asarray(EquIIToVector(Catalog[Stars]), dtype=float)
+    Votes = _Votes(Vectors, Owners, MeasuredSeparations, PairTolerance)
+
+    # Step 2: most votes, then nearest candidate for every sighting
+    Order = np.lexsort((Distances, - Votes, Owners))
+    First = Order[np.concatenate(([True], Owners[Order][1:] != Owners[Order][:-1]))]
+    Chosen = np.full(NumberOfSightings, -1, dtype=np.int64)
+    Chosen[Owners[First]] = First
+
+    Accepted = Chosen >= 0
+    if(Verify):
+        # Step 3: consensus of the chosen candidates
+        Sightings = np.flatnonzero(Accepted)
+        Accepted[Sightings] = _Consensus(Vectors[Chosen[Sightings]], MeasuredSeparations[np.ix_(Sightings, Sightings)], PairTolerance)
+
+        # Step 4: correct the systematic rotation, and match again
+        if(Accepted.sum() >= 3):
+            Sightings = np.flatnonzero(Accepted)
+            Rotation = _FitRotation(MeasuredVectors[Sightings], Vectors[Chosen[Sightings]])
+            Corrected = MeasuredVectors @ Rotation.T
+
+            Order = np.lexsort((- np.einsum("ij,ij->i", Vectors, Corrected[Owners]), Owners))
+            First = Order[np.concatenate(([True], Owners[Order][1:] != Owners[Order][:-1]))]
+            Chosen[Owners[First]] = First
+
+            Sightings = np.flatnonzero(Chosen >= 0)
+            Accepted[:] = False
+            Accepted[Sightings] = _Consensus(Vectors[Chosen[Sightings]], MeasuredSeparations[np.ix_(Sightings, Sightings)], PairTolerance)
+
+    Sightings = np.flatnonzero(Accepted)
+    Identified[Sightings] = Stars[Chosen[Sightings]]
+    Residuals[Sightings] = Distances[Chosen[Sightings]]
+    Names[Sightings] = Catalog[Identified[Sightings]].Names
+
+    return(Identified, Names, Residuals)
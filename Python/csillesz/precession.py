@@ -0,0 +1,181 @@
+################################################################
+########                                                ########
+########  EPOCH PROPAGATION (PRECESSION, PROPER MOTION) ########
+########                                                ########
+################################################################
+
+# Catalog positions (StellarDict, StarCatalog) are given at the J2000.0
+# epoch. Positions at another epoch (Julian year, eg. 2031.5) are
+# calculated in two steps, on the unit vectors of the Objects:
+#
+# 1. Proper motion, linear on the sphere during Δt = epoch - 2000.0 years:
+#    v = v_0 + Δt * (μ_α * cos(δ) * e_α + μ_δ * e_δ), then normalized
+#    e_α = (- sin(α), cos(α), 0)
+#    e_δ = (- sin(δ) * cos(α), - sin(δ) * sin(α), cos(δ))
+# 2. Precession from the J2000.0 equator and equinox to the equator and
+#    equinox of the date, with the IAU 1976 (Lieske) angles:
+#    v' = R_3(-z) * R_2(θ) * R_3(-ζ) * v
+#
+# The precession matrix only depends on the epoch, so it's cached, and whole
+# catalogs are propagated with one matrix multiplication
+# Propagated catalogs are memoized per (catalog, epoch), so repeated queries
+# at the same epoch don't recalculate anything. They are StarCatalogs, so
+# the batch conversions (eg. EquIToHorBatch()) consume them directly
+
+import collections
+import functools
+import math
+import weakref
+
+import numpy as np
+
+from .catalog import DefaultCatalog, StarCatalog
+from .core import StellarDict
+from .rotation import EquIIToVector, VectorToEquII
+from .sidereal import J2000JulianDate, ToUnixTime, UnixEpochJulianDate
+
+# Epoch of the catalogs in Julian years
+CatalogEpoch = 2000.0
+
+# Number of cached precession matrices
+MatrixCacheSize = 1024
+
+# Number of propagated epochs kept for every catalog
+PropagationCacheSize = 16
+
+# Milliarcseconds to radians
+MilliarcsecondsToRadians = math.pi / (180 * 3600 * 1000)
+
+
+################################################################
+########                                                ########
+########             PRECESSION MATRIX                  ########
+########                                                ########
+################################################################
+
+# Rotation of the coordinate frame around the y axis (R_2)
+def _FrameRotationY(Angle):
+
+    return(np.array([[math.cos(Angle), 0.0, - math.sin(Angle)],
+                     [0.0, 1.0, 0.0],
+                     [math.sin(Angle), 0.0, math.cos(Angle)]]))
+
+# Rotation of the coordinate frame around the z axis (R_3)
+def _FrameRotationZ(Angle):
+
+    return(np.array([[math.cos(Angle), math.sin(Angle), 0.0],
+                     [- math.sin(Angle), math.cos(Angle), 0.0],
+                     [0.0, 0.0, 1.0]]))
+
+# Precession matrix from J2000.0 to Epoch (Julian year)
+# Precession angles in arcseconds, T is in Julian centuries since J2000.0:
+# ζ = 2306.2181 * T + 0.30188 * T^2 + 0.017998 * T^3
+# z = 2306.2181 * T + 1.09468 * T^2 + 0.018203 * T^3
+# θ = 2004.3109 * T - 0.42665 * T^2 - 0.041833 * T^3
+@functools.lru_cache(maxsize=MatrixCacheSize)
+def PrecessionMatrix(Epoch):
+
+    T = (Epoch - CatalogEpoch) / 100
+
+    Zeta = math.radians((2306.2181 * T + 0.30188 * T**2 + 0.017998 * T**3) / 3600)
+    z = math.radians((2306.2181 * T + 1.09468 * T**2 + 0.018203 * T**3) / 3600)
+    Theta = math.radians((2004.3109 * T - 0.42665 * T**2 - 0.041833 * T**3) / 3600)
+
+    Matrix = _FrameRotationZ(- z) @ _FrameRotationY(Theta) @ _FrameRotationZ(- Zeta)
+    Matrix.setflags(write=False)
+
+    return(Matrix)
+
+
+
+################################################################
+########                                                ########
+########               PROPAGATION                      ########
+########                                                ########
+################################################################
+
+# Unit vectors of Objects at Epoch (Julian year) from their J2000.0
+# Right Ascensions (hours), Declinations (degrees), unit vectors (if they
+# are already known, eg. from a StarCatalog) and proper motions (mas/year)
+def PropagateVectors(RightAscension, Declination, Epoch, ProperMotionRA=None, ProperMotionDec=None, Vectors=None):
+
+    if(Vectors is None):
+        Vectors = EquIIToVector(RightAscension, Declination)
+    Vectors = np.asarray(Vectors, dtype=float)
+
+    # Step 1: proper motion
+    if(ProperMotionRA is not None or ProperMotionDec is not None):
+        RightAscensionRadians = np.radians(np.asarray(RightAscension, dtype=float) * 15)
+        DeclinationRadians = np.radians(np.asarray(Declination, dtype=float))
+        sinRA = np.sin(RightAscensionRadians)
+        cosRA = np.cos(RightAscensionRadians)
+        sinDec = np.sin(DeclinationRadians)
+
+        Years = Epoch - CatalogEpoch
+        MotionRA = Years * MilliarcsecondsToRadians * np.asarray(0 if ProperMotionRA is None else ProperMotionRA, dtype=float)
+        MotionDec = Years * MilliarcsecondsToRadians * np.asarray(0 if ProperMotionDec is None else ProperMotionDec, dtype=float)
+
+        Vectors = Vectors + np.stack((- MotionRA * sinRA - MotionDec * sinDec * cosRA,
+                                      MotionRA * cosRA - MotionDec * sinDec * sinRA,
+                                      MotionDec * np.cos(DeclinationRadians)), axis=-1)
+        Vectors = Vectors / np.linalg.norm(Vectors, axis=-1, keepdims=True)
+
+    # Step 2: precession
+    return(Vectors @ PrecessionMatrix(float(Epoch)).T)
+
+# Right Ascensions (hours, [0h,24h[) and Declinations (degrees) of Objects
+# at Epoch (Julian year), see PropagateVectors()
+def PropagateCoordinates(RightAscension, Declination, Epoch, ProperMotionRA=None, ProperMotionDec=None):
+
+    Declination, RightAscension = VectorToEquII(PropagateVectors(RightAscension, Declination, Epoch, ProperMotionRA, ProperMotionDec))
+
+    return(RightAscension, Declination)
+
+# Propagated catalogs, per catalog and per epoch
+_PropagatedCatalogs = weakref.WeakKeyDictionary()
+
+# Catalog at Epoch (Julian year) as a StarCatalog
+# Catalog is a StarCatalog or a dictionary with the format of StellarDict
+# (StellarDict by default, which has no proper motions)
+# Results are memoized for the last PropagationCacheSize epochs of every
+# StarCatalog, so the returned catalogs shouldn't be modified
+def PropagateCatalog(Catalog=None, Epoch=CatalogEpoch):
+
+    if(Catalog is None or Catalog is StellarDict):
+        Catalog = DefaultCatalog()
+    elif(not isinstance(Catalog, StarCatalog)):
+        Catalog = StarCatalog.FromDict(Catalog)
+
+    Epoch = float(Epoch)
+    Cache = _PropagatedCatalogs.setdefault(Catalog, collections.OrderedDict())
+    if(Epoch in Cache):
+        Cache.move_to_end(Epoch)
+        return(Cache[Epoch])
+
+    Vectors = PropagateVectors(Catalog.RightAscension, Catalog.Declination, Epoch, Catalog.ProperMotionRA, Catalog.ProperMotionDec, Vectors=Catalog.Vectors)
+    Declination, RightAscension = VectorToEquII(Vectors)
+
+    Records = np.array(Catalog.Records)
+    Records["RightAscension"] = RightAscension
+    Records["Declination"] = Declination
+    Records["Vector"] = Vectors
+    Propagated = StarCatalog(Records)
+
+    Cache[Epoch] = Propagated
+    if(len(Cache) > PropagationCacheSize):
+        Cache.popitem(last=False)
+
+    return(Propagated)
+
+# Julian year of Unix timestamps (see sidereal.ToUnixTime())
+def JulianYearFromUnixTime(Timestamps):
+
+    JulianDays = ToUnixTime(Timestamps) / 86400 + UnixEpochJulianDate - J2000JulianDate
+
+    return(CatalogEpoch + JulianDays / 365.25)
+
+# Clear every cached precession matrix and propagated catalog
+def ClearPropagationCaches():
+
+    PrecessionMatrix.cache_clear()
+    _PropagatedCatalogs.clear()
@@ -0,0 +1,154 @@
+################################################################
+########                                                ########
+########      CHUNKED ALTITUDE RASTER OVER A NIGHT      ########
+########                                                ########
+################################################################
+
+# (time x sky-grid) rasters of the Altitude (m) and Azimuth (A) of fixed
+# Equatorial II points (a grid on the sky, or catalog Objects) at a site
+#
+# The LMST series is calculated once (S = S_0 + λ/15 + dS * UT, see
+# sidereal.LocalSiderealTimeFromUnixTime()), and the conversion is done in
+# (time-chunk x grid-chunk) blocks, written directly into the (preallocated
+# or memory-mapped) output, so peak memory is bounded by the block size
+#
+# No trigonometric function is evaluated per raster cell, because
+# cos(H) = cos(S - α) = cos(S) * cos(α) + sin(S) * sin(α)
+# sin(H) = sin(S - α) = sin(S) * cos(α) - cos(S) * sin(α)
+# and the sines and cosines of S, α and δ are calculated once. Only asin()
+# (and atan2() for the Azimuth) remain per cell:
+# sin(m) = sin(δ) * sin(φ) + cos(δ) * cos(φ) * cos(H)
+# A = atan2(- sin(H) * cos(δ), sin(δ) * cos(φ) - cos(δ) * sin(φ) * cos(H))
+
+import numpy as np
+
+from .batch import CatalogCoordinates, NormalizeSymmetricallyBoundedPI_2Array, SiteTrigonometryArray
+from .sidereal import LocalSiderealTimeFromUnixTime, ToUnixTime
+
+# Default time step of the rasters in seconds
+DefaultTimeStep = 60
+
+# Default number of time steps and grid points in a block
+DefaultTimeChunk = 64
+DefaultGridChunk = 16384
+
+
+################################################################
+########                                                ########
+########             TIMES, GRIDS, OUTPUTS              ########
+########                                                ########
+################################################################
+
+# UT instants from Start to End (Unix timestamps or numpy.datetime64), with
+# Step seconds between them
+def RasterTimestamps(Start, End, Step=DefaultTimeStep):
+
+    return(np.arange(float(ToUnixTime(Start)), float(ToUnixTime(End)) + Step / 2, Step))
+
+# Regular grid on the sky, with RightAscensionStep (hours) and
+# DeclinationStep (degrees) between the points, between MinimalDeclination
+# and MaximalDeclination
+# Returns the flattened Right Ascensions and Declinations of the points, and
+# the shape of the grid (Declinations, Right Ascensions)
+def SkyGrid(RightAscensionStep=0.25, DeclinationStep=2, MinimalDeclination=-90, MaximalDeclination=90):
+
+    RightAscension = np.arange(0, 24, RightAscensionStep)
+    Declination = np.arange(MinimalDeclination, MaximalDeclination + DeclinationStep / 2, DeclinationStep)
+    Declination = Declination[Declination <= MaximalDeclination]
+
+    DeclinationGrid, RightAscensionGrid = np.meshgrid(Declination, RightAscension, indexing="ij")
+
+    return(RightAscensionGrid.ravel(), DeclinationGrid.ravel(), DeclinationGrid.shape)
+
+# Output array of a raster
+# If FileName is given, it's a memory-mapped .npy file, otherwise an array
+# in the memory
+def RasterOutput(Shape, DType=np.float32, FileName=None):
+
+    if(FileName is None):
+        return(np.empty(Shape, dtype=DType))
+
+    return(np.lib.format.open_memmap(FileName, mode="w+", dtype=DType, shape=Shape))
+
+
+
+################################################################
+########                                                ########
+########                 RASTERS                        ########
+########                                                ########
+################################################################
+
+# Altitudes (and Azimuths) of Equatorial II points at UT instants, in blocks
+# Latitude and Longitude can also be ObserverContexts
+# RightAscension can also be a StarCatalog, with Declination = None
+# Yields (TimeSlice, GridSlice, Altitude, Azimuth) for every block, Azimuth
+# is None, if Azimuths is False
+def NightRasterBlocks(Latitude, Longitude, Timestamps, RightAscension, Declination, Azimuths=True, TimeChunk=DefaultTimeChunk, GridChunk=DefaultGridChunk):
+
+    RightAscension, Declination = CatalogCoordinates(RightAscension, Declination)
+
+    # Calculated once for the whole raster
+    LocalSiderealTime = np.atleast_1d(LocalSiderealTimeFromUnixTime(Timestamps, Longitude))
+    LocalSiderealTimeRadians = np.radians(LocalSiderealTime * 15)
+    sinS = np.sin(LocalSiderealTimeRadians)
+    cosS = np.cos(LocalSiderealTimeRadians)
+
+    Latitude, sinLat, cosLat = SiteTrigonometryArray(Latitude)
+    RightAscensionRadians = np.radians(np.atleast_1d(np.asarray(RightAscension, dtype=float)) * 15)
+    DeclinationRadians = np.radians(np.atleast_1d(NormalizeSymmetricallyBoundedPI_2Array(Declination)))
+    sinRA = np.sin(RightAscensionRadians)
+    cosRA = np.cos(RightAscensionRadians)
+    sinDec = np.sin(DeclinationRadians)
+    cosDec = np.cos(DeclinationRadians)
+
+    # Constant parts of the formulas
+    AltitudeConstant = sinDec * sinLat
+    AltitudeFactor = cosDec * cosLat
+    AzimuthConstant = sinDec * cosLat
+    AzimuthFactor = cosDec * sinLat
+
+    for TimeStart in range(0, LocalSiderealTime.size, TimeChunk):
+        Times = slice(TimeStart, TimeStart + TimeChunk)
+        sinSBlock = sinS[Times,None]
+        cosSBlock = cosS[Times,None]
+
+        for GridStart in range(0, RightAscensionRadians.size, GridChunk):
+            Grid = slice(GridStart, GridStart + GridChunk)
+
+            # cos(H) = cos(S) * cos(α) + sin(S) * sin(α)
+            cosLHA = cosSBlock * cosRA[Grid] + sinSBlock * sinRA[Grid]
+
+            # sin(m) = sin(δ) * sin(φ) + cos(δ) * cos(φ) * cos(H)
+            Altitude = np.degrees(np.arcsin(np.clip(AltitudeConstant[Grid] + AltitudeFactor[Grid] * cosLHA, -1, 1)))
+
+            Azimuth = None
+            if(Azimuths):
+                # sin(H) = sin(S) * cos(α) - cos(S) * sin(α)
+                sinLHA = sinSBlock * cosRA[Grid] - cosSBlock * sinRA[Grid]
+                Azimuth = np.degrees(np.arctan2(- sinLHA * cosDec[Grid], AzimuthConstant[Grid] - AzimuthFactor[Grid] * cosLHA))
+                # Azimuth: [0,+2π[
+                Azimuth += 360 * (Azimuth < 0)
+
+            yield(Times, Grid, Altitude, Azimuth)
+
+# (time x grid) rasters of the Altitudes (and Azimuths) of Equatorial II
+# points, see NightRasterBlocks()
+# AltitudeOut and AzimuthOut can be preallocated arrays or memory-mapped
+# files (see RasterOutput()), otherwise they are allocated with DType
+# Returns (Altitude, Azimuth), Azimuth is None, if Azimuths is False
+def NightRaster(Latitude, Longitude, Timestamps, RightAscension, Declination, Azimuths=True, AltitudeOut=None, AzimuthOut=None, DType=np.float32, TimeChunk=DefaultTimeChunk, GridChunk=DefaultGridChunk):
+
+    RightAscension, Declination = CatalogCoordinates(RightAscension, Declination)
+    Shape = (np.size(Timestamps), np.size(RightAscension))
+
+    if(AltitudeOut is None):
+        AltitudeOut = RasterOutput(Shape, DType)
+    if(Azimuths and AzimuthOut is None):
+        AzimuthOut = RasterOutput(Shape, DType)
+
+    for Times, Grid, Altitude, Azimuth in NightRasterBlocks(Latitude, Longitude, Timestamps, RightAscension, Declination, Azimuths, TimeChunk, GridChunk):
+        AltitudeOut[Times, Grid] = Altitude
+        if(Azimuths):
+            AzimuthOut[Times, Grid] = Azimuth
+
+    return(AltitudeOut, AzimuthOut if Azimuths else None)
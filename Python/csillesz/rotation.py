@@ -0,0 +1,282 @@
+################################################################
+########                                                ########
+########   ROTATION MATRIX COORDINATE SYSTEM ENGINE     ########
+########                                                ########
+################################################################
+
+# Directions on the sky are represented as unit 3-vectors, and every
+# conversion between the coordinate systems is a single 3x3 matrix
+# Matrices only depend on the Latitude (φ) and the Local Mean Sidereal
+# Time (S), so they are cached, and N directions are converted by one
+# matrix multiplication
+#
+# Used coordinate systems and their unit vectors:
+# "Hor":   Horizontal (m, A), A is measured from North through East
+#          (cos(m) * cos(A), cos(m) * sin(A), sin(m))
+# "EquI":  Equatorial I (δ, t), t is measured westwards
+#          (cos(δ) * cos(t), - cos(δ) * sin(t), sin(δ))
+# "EquII": Equatorial II (δ, α)
+#          (cos(δ) * cos(α), cos(δ) * sin(α), sin(δ))
+#
+# All matrices are orthogonal, so their inverses are their transposes
+
+import functools
+
+import numpy as np
+
+from .batch import NormalizeSymmetricallyBoundedPIArray, NormalizeZeroBoundedArray
+from .catalog import StarCatalog
+from .core import ObserverContext
+
+# Names of the available coordinate systems
+CoordinateSystems = ("Hor", "EquI", "EquII")
+
+# Number of matrices kept in the caches
+MatrixCacheSize = 4096
+
+
+################################################################
+########                                                ########
+########     DIRECTIONS AS UNIT VECTORS AND BACK        ########
+########                                                ########
+################################################################
+
+# Unit vectors from spherical coordinates, given in degrees
+def SphericalToVector(Longitude, Latitude):
+
+    LongitudeRadians = np.radians(np.asarray(Longitude, dtype=float))
+    LatitudeRadians = np.radians(np.asarray(Latitude, dtype=float))
+    LongitudeRadians, LatitudeRadians = np.broadcast_arrays(LongitudeRadians, LatitudeRadians)
+
+    cosLat = np.cos(LatitudeRadians)
+    Vectors = np.stack((cosLat * np.cos(LongitudeRadians), cosLat * np.sin(LongitudeRadians), np.sin(LatitudeRadians)), axis=-1)
+
+    return(Vectors)
+
+# Spherical coordinates in degrees from (not necessarily unit) vectors
+# Longitude: [0,+2π[
+# Latitude: [-π/2,+π/2]
+def VectorToSpherical(Vectors):
+
+    Vectors = np.asarray(Vectors, dtype=float)
+    x, y, z = Vectors[...,0], Vectors[...,1], Vectors[...,2]
+
+    Longitude = NormalizeZeroBoundedArray(np.degrees(np.arctan2(y, x)), 360)
+    Latitude = np.degrees(np.arctan2(z, np.hypot(x, y)))
+
+    return(Longitude, Latitude)
+
+# Horizontal (m, A) -> unit vector
+def HorToVector(Altitude, Azimuth):
+
+    return(SphericalToVector(Azimuth, Altitude))
+
+# Unit vector -> Horizontal (m, A)
+def VectorToHor(Vectors):
+
+    Azimuth, Altitude = VectorToSpherical(Vectors)
+
+    return(Altitude, Azimuth)
+
+# Equatorial I (δ, t) -> unit vector
+def EquIToVector(LocalHourAngle, Declination):
+
+    return(SphericalToVector(- np.asarray(LocalHourAngle, dtype=float) * 15, Declination))
+
+# Unit vector -> Equatorial I (δ, t)
+def VectorToEquI(Vectors):
+
+    LocalHourAngleDegrees, Declination = VectorToSpherical(Vectors)
+    # Convert to hours from angles (H -> t), t is measured westwards
+    LocalHourAngle = NormalizeZeroBoundedArray(- LocalHourAngleDegrees / 15, 24)
+
+    return(Declination, LocalHourAngle)
+
+# Equatorial II (δ, α) -> unit vector
+# RightAscension can also be a StarCatalog (with Declination = None), then
+# its precalculated unit vectors are used
+def EquIIToVector(RightAscension, Declination=None):
+
+    if(isinstance(RightAscension, StarCatalog)):
+        return(RightAscension.Vectors)
+
+    return(SphericalToVector(np.asarray(RightAscension, dtype=float) * 15, Declination))
+
+# Unit vector -> Equatorial II (δ, α)
+def VectorToEquII(Vectors):
+
+    RightAscensionDegrees, Declination = VectorToSpherical(Vectors)
+    RightAscension = RightAscensionDegrees / 15
+
+    return(Declination, RightAscension)
+
+
+
+################################################################
+########                                                ########
+########               CACHED MATRICES                  ########
+########                                                ########
+################################################################
+
+# Arrays returned by the caches are shared, so they are made read-only
+def _ReadOnly(Matrix):
+
+    Matrix.setflags(write=False)
+
+    return(Matrix)
+
+# Equatorial I -> Horizontal at Latitude (φ)
+# north = - sin(φ) * X + cos(φ) * Z
+# east  = Y
+# up    = cos(φ) * X + sin(φ) * Z
+# The matrix is symmetric, so it also converts Horizontal -> Equatorial I
+@functools.lru_cache(maxsize=MatrixCacheSize)
+def _EquIToHorMatrix(Latitude):
+
+    sinLat = np.sin(np.radians(Latitude))
+    cosLat = np.cos(np.radians(Latitude))
+
+    return(_ReadOnly(np.array([[- sinLat, 0.0, cosLat],
+                               [0.0, 1.0, 0.0],
+                               [cosLat, 0.0, sinLat]])))
+
+# Equatorial I -> Equatorial II at Local Mean Sidereal Time (S)
+# α = S - t, which is a rotation around the celestial pole by S
+@functools.lru_cache(maxsize=MatrixCacheSize)
+def _EquIToEquIIMatrix(LocalSiderealTime):
+
+    sinS = np.sin(np.radians(LocalSiderealTime * 15))
+    cosS = np.cos(np.radians(LocalSiderealTime * 15))
+
+    return(_ReadOnly(np.array([[cosS, - sinS, 0.0],
+                               [sinS, cosS, 0.0],
+                               [0.0, 0.0, 1.0]])))
+
+# Matrix of a single conversion step between neighbouring systems
+def _StepMatrix(FromSystem, ToSystem, Latitude, LocalSiderealTime):
+
+    if(FromSystem == "EquI" and ToSystem == "Hor" or FromSystem == "Hor" and ToSystem == "EquI"):
+        return(_EquIToHorMatrix(Latitude))
+
+    elif(FromSystem == "EquI" and ToSystem == "EquII"):
+        return(_EquIToEquIIMatrix(LocalSiderealTime))
+
+    elif(FromSystem == "EquII" and ToSystem == "EquI"):
+        return(_EquIToEquIIMatrix(LocalSiderealTime).T)
+
+# Chained conversions are fused into one matrix product
+# Hor <-> EquI <-> EquII
+# A conversion to the same system is the identity
+@functools.lru_cache(maxsize=MatrixCacheSize)
+def _FusedMatrix(FromSystem, ToSystem, Latitude, LocalSiderealTime):
+
+    if(FromSystem == ToSystem):
+        return(_ReadOnly(np.eye(3)))
+
+    Path = {("Hor", "EquII"): ("Hor", "EquI", "EquII"),
+            ("EquII", "Hor"): ("EquII", "EquI", "Hor")}.get((FromSystem, ToSystem), (FromSystem, ToSystem))
+
+    Matrix = np.eye(3)
+    for StepFrom, StepTo in zip(Path[:-1], Path[1:]):
+        Matrix = _StepMatrix(StepFrom, StepTo, Latitude, LocalSiderealTime) @ Matrix
+
+    return(_ReadOnly(Matrix))
+
+# Conversion matrix between two coordinate systems (the identity, if they
+# are the same)
+# Latitude is needed, if one of the systems is the Horizontal one
+# LocalSiderealTime is needed, if one of the systems is Equatorial II
+# Latitude can also be an ObserverContext
+def ConversionMatrix(FromSystem, ToSystem, Latitude=None, LocalSiderealTime=None):
+
+    if(FromSystem not in CoordinateSystems or ToSystem not in CoordinateSystems):
+        raise ValueError("Coordinate systems should be one of " + ", ".join(CoordinateSystems) + "!")
+
+    if("Hor" in (FromSystem, ToSystem) and FromSystem != ToSystem):
+        if(Latitude is None):
+            raise ValueError("Latitude is needed for conversions from/to the Horizontal system!")
+        # Latitude: [-π,+π]
+        if(isinstance(Latitude, ObserverContext)):
+            Latitude = Latitude.Latitude
+        Latitude = float(NormalizeSymmetricallyBoundedPIArray(Latitude))
+    else:
+        Latitude = None
+
+    if("EquII" in (FromSystem, ToSystem) and FromSystem != ToSystem):
+        if(LocalSiderealTime is None):
+            raise ValueError("LocalSiderealTime is needed for conversions from/to the Equatorial II system!")
+        # LMST: [0h,24h[
+        LocalSiderealTime = float(NormalizeZeroBoundedArray(LocalSiderealTime, 24))
+    else:
+        LocalSiderealTime = None
+
+    return(_FusedMatrix(FromSystem, ToSystem, Latitude, LocalSiderealTime))
+
+# Apply a conversion matrix on N directions, given as an (N,3) array
+def RotateVectors(Matrix, Vectors):
+
+    return(np.asarray(Vectors, dtype=float) @ np.asarray(Matrix).T)
+
+# Convert unit vectors between two coordinate systems
+def ConvertVectors(Vectors, FromSystem, ToSystem, Latitude=None, LocalSiderealTime=None):
+
+    return(RotateVectors(ConversionMatrix(FromSystem, ToSystem, Latitude, LocalSiderealTime), Vectors))
+
+# Clear all cached matrices
+def ClearMatrixCaches():
+
+    _EquIToHorMatrix.cache_clear()
+    _EquIToEquIIMatrix.cache_clear()
+    _FusedMatrix.cache_clear()
+
+
+
+################################################################
+########                                                ########
+########      1. CONVERSION OF COORDINATE SYSTEMS       ########
+########                                                ########
+################################################################
+
+# 1. Horizontal to Equatorial I
+def HorToEquIRotation(Latitude, Altitude, Azimuth):
+
+    Vectors = ConvertVectors(HorToVector(Altitude, Azimuth), "Hor", "EquI", Latitude)
+
+    return(VectorToEquI(Vectors))
+
+# 2. Horizontal to Equatorial II
+def HorToEquIIRotation(Latitude, Altitude, Azimuth, LocalSiderealTime):
+
+    Vectors = ConvertVectors(HorToVector(Altitude, Azimuth), "Hor", "EquII", Latitude, LocalSiderealTime)
+
+    return(VectorToEquII(Vectors))
+
+# 3. Equatorial I to Horizontal
+def EquIToHorRotation(Latitude, LocalHourAngle, Declination):
+
+    Vectors = ConvertVectors(EquIToVector(LocalHourAngle, Declination), "EquI", "Hor", Latitude)
+
+    return(VectorToHor(Vectors))
+
+# 4. Equatorial I to Equatorial II
+def EquIToEquIIRotation(LocalHourAngle, Declination, LocalSiderealTime):
+
+    Vectors = ConvertVectors(EquIToVector(LocalHourAngle, Declination), "EquI", "EquII", None, LocalSiderealTime)
+
+    return(VectorToEquII(Vectors))
+
+# 5. Equatorial II to Equatorial I
+# RightAscension can also be a StarCatalog, with Declination = None
+def EquIIToEquIRotation(RightAscension, Declination, LocalSiderealTime):
+
+    Vectors = ConvertVectors(EquIIToVector(RightAscension, Declination), "EquII", "EquI", None, LocalSiderealTime)
+
+    return(VectorToEquI(Vectors))
+
+# 6. Equatorial II to Horizontal
+# RightAscension can also be a StarCatalog, with Declination = None
+def EquIIToHorRotation(Latitude, RightAscension, Declination, LocalSiderealTime):
+
+    Vectors = ConvertVectors(EquIIToVector(RightAscension, Declination), "EquII", "Hor", Latitude, LocalSiderealTime)
+
+    return(VectorToHor(Vectors))
@@ -0,0 +1,228 @@
+################################################################
+########                                                ########
+########     ANGULAR SEPARATIONS AND CLOSE PAIRS        ########
+########                                                ########
+################################################################
+
+# Vectorized counterpart of the haversine formula of GeogDistCalc(), without
+# multiplying with Earth's radius, so it gives the angular separation (d)
+# of two points on any sphere, eg. of two stars on the sky
+#
+# Stars are given by their Right Ascensions (α, hours) and Declinations
+# (δ, degrees), or by a StarCatalog (or a slice of one) in place of the
+# Right Ascensions, with the Declinations = None
+#
+# Many-to-many separations are calculated in blocks of BlockSize x BlockSize
+# so memory use is bounded by the block size and not by N x M
+# Close pairs are searched on a grid of unit vectors instead of the full
+# N x N matrix
+
+import itertools
+import math
+
+import numpy as np
+
+from .batch import CatalogCoordinates
+from .catalog import StarCatalog
+from .rotation import EquIIToVector
+
+# Default number of rows and columns of a block
+DefaultBlockSize = 1024
+
+# Number of candidate pairs tested at once by ClosePairs()
+CandidatePairsPerBlock = 4194304
+
+# Maximal number of grid cells along one axis in ClosePairs(), so cell keys
+# of the grid fit into 64 bit integers
+MaximalGridSize = 2000000
+
+
+################################################################
+########                                                ########
+########           ONE-TO-MANY SEPARATIONS              ########
+########                                                ########
+################################################################
+
+# Angular separation in degrees of points on a sphere (broadcasted)
+# Same parameters as GeogDistCalc(), Latitudes and Longitudes in degrees
+def HaversineAngleArray(Latitude1, Latitude2, Longitude1, Longitude2):
+
+    Latitude1 = np.radians(np.asarray(Latitude1, dtype=float))
+    Latitude2 = np.radians(np.asarray(Latitude2, dtype=float))
+    Longitude1 = np.radians(np.asarray(Longitude1, dtype=float))
+    Longitude2 = np.radians(np.asarray(Longitude2, dtype=float))
+
+    # Haversine formula:
+    # Step 1.: hav_1 = (sin((φ2 - φ1) / 2))^2 + cos(φ1) ⋅ cos(φ2) ⋅ (sin((λ2 - λ1) / 2))^2
+    # Step 2.: hav_2 = 2 * atan2(sqrt(hav_1),sqrt(1 - hav_1))
+
+    # Step 1
+    hav_1 = np.sin((Latitude2 - Latitude1) / 2)**2 + np.cos(Latitude1) * np.cos(Latitude2) * np.sin((Longitude2 - Longitude1) / 2)**2
+    hav_1 = np.clip(hav_1, 0, 1)
+
+    # Step 2
+    hav_2 = 2 * np.arctan2(np.sqrt(hav_1), np.sqrt(1 - hav_1))
+
+    return(np.degrees(hav_2))
+
+# Angular separation (d) of stars in degrees (broadcasted)
+# Eg. one star against a catalog:
+# AngularSeparationBatch(6.75, -16.7, Catalog, None)
+def AngularSeparationBatch(RightAscension1, Declination1, RightAscension2, Declination2):
+
+    RightAscension1, Declination1 = CatalogCoordinates(RightAscension1, Declination1)
+    RightAscension2, Declination2 = CatalogCoordinates(RightAscension2, Declination2)
+
+    return(HaversineAngleArray(Declination1, Declination2, np.asarray(RightAscension1, dtype=float) * 15, np.asarray(RightAscension2, dtype=float) * 15))
+
+
+
+################################################################
+########                                                ########
+########          MANY-TO-MANY SEPARATIONS              ########
+########                                                ########
+################################################################
+
+# Separations of N and M stars, in blocks
+# Yields (RowStart, ColumnStart, Block) for every block, where Block is the
+# separation matrix of rows RowStart... and columns ColumnStart...
+def AngularSeparationBlocks(RightAscension1, Declination1, RightAscension2, Declination2, BlockSize=DefaultBlockSize):
+
+    RightAscension1, Declination1 = CatalogCoordinates(RightAscension1, Declination1)
+    RightAscension2, Declination2 = CatalogCoordinates(RightAscension2, Declination2)
+    RightAscension1 = np.atleast_1d(np.asarray(RightAscension1, dtype=float))
+    Declination1 = np.atleast_1d(np.asarray(Declination1, dtype=float))
+    RightAscension2 = np.atleast_1d(np.asarray(RightAscension2, dtype=float))
+    Declination2 = np.atleast_1d(np.asarray(Declination2, dtype=float))
+
+    for RowStart in range(0, RightAscension1.size, BlockSize):
+        Rows = slice(RowStart, RowStart + BlockSize)
+
+        for ColumnStart in range(0, RightAscension2.size, BlockSize):
+            Columns = slice(ColumnStart, ColumnStart + BlockSize)
+
+            Block = AngularSeparationBatch(RightAscension1[Rows,None], Declination1[Rows,None], RightAscension2[None,Columns], Declination2[None,Columns])
+
+            yield(RowStart, ColumnStart, Block)
+
+# N x M separation matrix in degrees, calculated in blocks
+# If the second set of stars is not given, the matrix of the first set
+# against itself is calculated
+# Out can be a preallocated (N,M) array, eg. a numpy.memmap for matrices
+# larger than the memory
+def AngularSeparationMatrix(RightAscension1, Declination1, RightAscension2=None, Declination2=None, BlockSize=DefaultBlockSize, Out=None):
+
+    if(RightAscension2 is None):
+        RightAscension2, Declination2 = RightAscension1, Declination1
+
+    RightAscension1, Declination1 = CatalogCoordinates(RightAscension1, Declination1)
+    RightAscension2, Declination2 = CatalogCoordinates(RightAscension2, Declination2)
+
+    if(Out is None):
+        Out = np.empty((np.size(RightAscension1), np.size(RightAscension2)))
+
+    for RowStart, ColumnStart, Block in AngularSeparationBlocks(RightAscension1, Declination1, RightAscension2, Declination2, BlockSize):
+        Out[RowStart:RowStart + Block.shape[0], ColumnStart:ColumnStart + Block.shape[1]] = Block
+
+    return(Out)
+
+
+
+################################################################
+########                                                ########
+########                CLOSE PAIRS                     ########
+########                                                ########
+################################################################
+
+# Point pairs of (first cell, second cell) pairs of the sorted grid
+# Every cell pair k gives Counts1[k] * Counts2[k] point pairs
+def _ExpandCellPairs(Starts1, Counts1, Starts2, Counts2):
+
+    PairCounts = Counts1 * Counts2
+    CellPair = np.repeat(np.arange(PairCounts.size), PairCounts)
+    Local = np.arange(CellPair.size) - np.repeat(np.cumsum(PairCounts) - PairCounts, PairCounts)
+
+    First = Starts1[CellPair] + Local // Counts2[CellPair]
+    Second = Starts2[CellPair] + Local % Counts2[CellPair]
+
+    return(First, Second)
+
+# Split cell pairs into groups of about CandidatePairsPerBlock point pairs
+def _CellPairGroups(PairCounts):
+
+    if(PairCounts.size == 0):
+        return([])
+
+    Ends = np.cumsum(PairCounts)
+    Borders = np.searchsorted(Ends, np.arange(CandidatePairsPerBlock, Ends[-1], CandidatePairsPerBlock), side="right")
+    Borders = np.unique(np.concatenate(([0], Borders, [PairCounts.size])))
+
+    return(zip(Borders[:-1], Borders[1:]))
+
+# All pairs of stars closer than Separation (degrees)
+# Unit vectors are put on a cubic grid with cells of the pair's chord
+# length (2 * sin(d/2)), so close pairs are always in the same or in
+# neighbouring cells. Only these cell pairs are tested
+# Returns the indices of the stars (I < J) and their separations in degrees
+def ClosePairs(RightAscension, Declination, Separation):
+
+    if(isinstance(RightAscension, StarCatalog)):
+        Vectors = np.asarray(EquIIToVector(RightAscension), dtype=float)
+    else:
+        Vectors = np.asarray(EquIIToVector(RightAscension, Declination), dtype=float).reshape(-1, 3)
+
+    # Chord length of Separation, the size of the cells
+    Chord = 2 * math.sin(math.radians(min(Separation, 180)) / 2)
+    CellSize = max(Chord, 2 / MaximalGridSize)
+    GridSize = int(math.ceil(2 / CellSize)) + 3
+
+    # Cells of the points, shifted by 1, so neighbours of every cell exist
+    Cells = np.floor((Vectors + 1) / CellSize).astype(np.int64) + 1
+    Keys = (Cells[:,0] * GridSize + Cells[:,1]) * GridSize + Cells[:,2]
+
+    Order = np.argsort(Keys, kind="stable")
+    SortedVectors = Vectors[Order]
+    UniqueKeys, Starts, Counts = np.unique(Keys[Order], return_index=True, return_counts=True)
+
+    FirstIndices = []
+    SecondIndices = []
+    Separations = []
+
+    # The cell itself, and half of its 26 neighbours, so every
+    # neighbouring cell pair is tested once
+    Offsets = [Offset for Offset in itertools.product((-1, 0, 1), repeat=3) if Offset >= (0, 0, 0)]
+    for Offset in Offsets:
+        if(Offset == (0, 0, 0)):
+            Cells1 = np.flatnonzero(Counts > 1)
+            Cells2 = Cells1
+        else:
+            NeighbourKeys = UniqueKeys + (Offset[0] * GridSize + Offset[1]) * GridSize + Offset[2]
+            Positions = np.minimum(np.searchsorted(UniqueKeys, NeighbourKeys), UniqueKeys.size - 1)
+            Cells1 = np.flatnonzero(UniqueKeys[Positions] == NeighbourKeys)
+            Cells2 = Positions[Cells1]
+
+        for GroupStart, GroupEnd in _CellPairGroups(Counts[Cells1] * Counts[Cells2]):
+            Group1 = Cells1[GroupStart:GroupEnd]
+            Group2 = Cells2[GroupStart:GroupEnd]
+            First, Second = _ExpandCellPairs(Starts[Group1], Counts[Group1], Starts[Group2], Counts[Group2])
+
+            if(Offset == (0, 0, 0)):
+                Inside = First < Second
+                First, Second = First[Inside], Second[Inside]
+
+            # |v_1 - v_2| <= 2 * sin(d/2)
+            Chords = np.linalg.norm(SortedVectors[First] - SortedVectors[Second], axis=1)
+            Close = Chords <= Chord
+
+            FirstIndices.append(Order[First[Close]])
+            SecondIndices.append(Order[Second[Close]])
+            Separations.append(np.degrees(2 * np.arcsin(np.minimum(Chords[Close] / 2, 1))))
+
+    I = np.concatenate(FirstIndices) if FirstIndices else np.empty(0, dtype=np.int64)
+    J = np.concatenate(SecondIndices) if SecondIndices else np.empty(0, dtype=np.int64)
+    Separations = np.concatenate(Separations) if Separations else np.empty(0)
+
+    I, J = np.minimum(I, J), np.maximum(I, J)
+    Order = np.lexsort((J, I))
+
+    return(I[Order], J[Order], Separations[Order])
@@ -0,0 +1,167 @@
+################################################################
+########                                                ########
+########   BATCH LOCAL MEAN SIDEREAL TIME (LMST)        ########
+########                                                ########
+################################################################
+
+# Vectorized counterparts of CalculateGMST() and LocalSiderealTimeCalc()
+# Instants are given as Unix timestamps (seconds since 1970.01.01 00:00 UT)
+# or as numpy.datetime64 values, both in UT, or as local dates and times
+# with their time zones
+# Results are float arrays of hours, the decomposition to hours, minutes
+# and seconds (like in LocalSiderealTimeCalc()) is optional
+
+import numpy as np
+
+from .core import ObserverContext, dS
+
+# Julian Date of the Unix epoch (1970.01.01 00:00 UT) and of J2000.0
+UnixEpochJulianDate = 2440587.5
+J2000JulianDate = 2451545.0
+
+
+################################################################
+########                                                ########
+########               UTILITY FUNCTIONS                ########
+########                                                ########
+################################################################
+
+# Unix timestamps in seconds from Unix timestamps or numpy.datetime64 values
+def ToUnixTime(Timestamps):
+
+    Timestamps = np.asarray(Timestamps)
+    if(np.issubdtype(Timestamps.dtype, np.datetime64)):
+        Timestamps = Timestamps.astype("datetime64[us]").astype(np.int64) / 1e06
+
+    return(np.asarray(Timestamps, dtype=float))
+
+# Days since J2000.0 (JulianDays in core.py) at 00:00 UT of the date, and
+# the UT of the day in hours
+def UnixTimeToJulianDays(Timestamps):
+
+    Timestamps = ToUnixTime(Timestamps)
+
+    DaysSinceEpoch = np.floor(Timestamps / 86400)
+    UnitedTime = (Timestamps - DaysSinceEpoch * 86400) / 3600
+    JulianDaysAtMidnight = DaysSinceEpoch + UnixEpochJulianDate - J2000JulianDate
+
+    return(JulianDaysAtMidnight, UnitedTime)
+
+# Time zones of sites in hours (without summer time), see SiteTimeZone()
+# Longitude can also be an ObserverContext
+def SiteTimeZoneArray(Longitude):
+
+    if(isinstance(Longitude, ObserverContext)):
+        return(np.asarray(Longitude.TimeZone, dtype=float))
+
+    return(np.round(np.asarray(Longitude, dtype=float) / 15))
+
+# Summer time correction in hours of local dates, with the rule of LTtoUT()
+# Summer: March 25 - October 14 LT+1
+def SummerTimeArray(Months, Days):
+
+    Months = np.asarray(Months)
+    Days = np.asarray(Days)
+
+    return((((Months > 3) & (Months < 10)) | ((Months == 3) & (Days >= 25)) | ((Months == 10) & (Days >= 8) & (Days <= 14))).astype(float))
+
+# Unix timestamps of local dates and times of the day
+# TimeZone is in hours (eg. +1 for CET), if SummerTime is True, the summer
+# time correction of LTtoUT() is added to it
+# Every parameter can be an array (broadcasted)
+def LocalTimeToUnixTime(Years, Months, Days, Hours, Minutes=0, Seconds=0, TimeZone=0, SummerTime=False):
+
+    Years = np.asarray(Years, dtype=np.int64)
+    Months = np.asarray(Months, dtype=np.int64)
+    Days = np.asarray(Days, dtype=np.int64)
+
+    # Days since the Unix epoch of the dates
+    Dates = (Years - 1970).astype("datetime64[Y]") + (Months - 1).astype("timedelta64[M]") + (Days - 1).astype("timedelta64[D]")
+    DaysSinceEpoch = Dates.astype("datetime64[D]").astype(np.int64)
+
+    TimeZone = np.asarray(TimeZone, dtype=float)
+    if(SummerTime):
+        TimeZone = TimeZone + SummerTimeArray(Months, Days)
+
+    LocalTime = np.asarray(Hours, dtype=float) + np.asarray(Minutes, dtype=float) / 60 + np.asarray(Seconds, dtype=float) / 3600
+
+    return(DaysSinceEpoch * 86400 + (LocalTime - TimeZone) * 3600)
+
+# Hours, Minutes and Seconds (integers) of times in hours, normalized to
+# [0h,24h[, like NormalizeTimeParameters() gives them
+def HoursToHMSArray(Time):
+
+    Time = np.mod(np.asarray(Time, dtype=float), 24)
+
+    Hours = np.floor(Time)
+    Minutes = np.floor((Time - Hours) * 60)
+    Seconds = np.floor(((Time - Hours) * 60 - Minutes) * 60)
+
+    return(Hours.astype(np.int64), Minutes.astype(np.int64), Seconds.astype(np.int64))
+
+
+
+################################################################
+########                                                ########
+######## 3. CALCULATE LOCAL MEAN SIDEREAL TIME (LMST)   ########
+########                                                ########
+################################################################
+
+# Greenwich Mean Sidereal Time (GMST = S_0) in hours
+# Same as CalculateGMST(), JulianDays are days since J2000.0
+def CalculateGMSTBatch(JulianDays):
+
+    JulianDays = np.asarray(JulianDays, dtype=float)
+
+    # Number of Julian centuries since J2000.0
+    JulianCenturies = JulianDays / 36525
+
+    # Calculate GMST in Degrees
+    GMSTDegrees = 280.46061837 + 360.98564736629 * JulianDays + 0.000388 * JulianCenturies**2
+
+    # Normalize between to [0,+2π[ and convert GMST to Hours
+    GMST = np.mod(GMSTDegrees, 360) / 15
+
+    return(GMST)
+
+# Local Mean Sidereal Time in hours at UT instants and Longitudes
+# Same formula as LocalSiderealTimeCalc():
+# S = S_0 + λ/15 + dS * UT, with S_0 at 00:00 UT of the date
+# Longitude can also be an ObserverContext
+# If HMS is True, returns (LMST, Hours, Minutes, Seconds), see
+# HoursToHMSArray()
+def LocalSiderealTimeFromUnixTime(Timestamps, Longitude, HMS=False):
+
+    JulianDaysAtMidnight, UnitedTime = UnixTimeToJulianDays(Timestamps)
+
+    if(isinstance(Longitude, ObserverContext)):
+        Longitude = Longitude.Longitude
+
+    # Longitude: [0,+2π[
+    Longitude = np.mod(np.asarray(Longitude, dtype=float), 360)
+
+    S_0 = CalculateGMSTBatch(JulianDaysAtMidnight)
+    LocalSiderealTime = np.mod(S_0 + Longitude / 15 + dS * UnitedTime, 24)
+
+    if(HMS):
+        return((LocalSiderealTime,) + HoursToHMSArray(LocalSiderealTime))
+
+    return(LocalSiderealTime)
+
+# Local Mean Sidereal Time in hours at local dates and times and Longitudes
+# Array counterpart of LocalSiderealTimeCalc()
+# TimeZone is in hours, by default it's derived from the Longitude, like in
+# LTtoUT() (or it's the TimeZone of an ObserverContext). By default the
+# summer time rule of LTtoUT() is applied too, like in LocalSiderealTimeCalc().
+# With SummerTime=False the local times are taken as standard time, and the
+# results differ by one hour of UT during summer time
+# Every parameter can be an array (broadcasted)
+# If HMS is True, returns (LMST, Hours, Minutes, Seconds)
+def LocalSiderealTimeFromLocalTime(Longitude, Years, Months, Days, Hours, Minutes=0, Seconds=0, TimeZone=None, SummerTime=True, HMS=False):
+
+    if(TimeZone is None):
+        TimeZone = SiteTimeZoneArray(Longitude)
+
+    Timestamps = LocalTimeToUnixTime(Years, Months, Days, Hours, Minutes, Seconds, TimeZone, SummerTime)
+
+    return(LocalSiderealTimeFromUnixTime(Timestamps, Longitude, HMS))
@@ -0,0 +1,324 @@
+################################################################
+########                                                ########
+########        NEAREST-SITE INDEX ON THE SPHERE        ########
+########                                                ########
+################################################################
+
+# k-nearest sites of arbitrary Latitudes (φ) and Longitudes (λ), eg. to
+# reuse the precalculated almanac of the nearest known site
+#
+# Sites are put on a cubic grid of their unit vectors (like in
+# separation.ClosePairs()), with about SitesPerCell sites in the cells.
+# Sites are sorted by their cells, so every cell is one contiguous slice
+# If a site is at chord length |v_1 - v_2| <= r * CellSize from a point, it's
+# in a cell at most r cells away along every axis, so searching the
+# (2r + 1)^3 cells around the point's cell finds every site within
+# r * CellSize. Points, whose k-th nearest site found is farther than that,
+# are searched again with twice as many Rings, until the grid is covered
+#
+# Sites within a distance (d) of a point are searched the same way: they're
+# inside the cap of chord length 2 * sin(d / (2 * R)) around the point, so
+# every one of them is in the cells within ceil(chord / CellSize) Rings.
+# Candidates of these cells are pruned by their chord lengths, and only the
+# ones inside the cap get the exact haversine distance (see GeogDistBatch())
+#
+# Points in the same cell share their candidate sites, so they're tested
+# together, with one (points x candidates) block of chord lengths
+# Distances are in meters, the same as GeogDistCalc()'s:
+# d = R * 2 * asin(|v_1 - v_2| / 2)
+
+import functools
+import itertools
+import math
+
+import numpy as np
+
+from .core import LocationDict
+from .gazetteer import Gazetteer
+from .geography import ChordSquaredMatrix, ChordToDistance, DistanceToChord, GeogDistBatch, LocationArrays, SiteVectors
+
+# Average number of sites in a cell
+DefaultSitesPerCell = 16
+
+# Rings of cells searched around the cell of a point in the first pass
+FirstSearchRings = 1
+
+# Number of (point, candidate) pairs tested at once
+CandidatePairsPerBlock = 4194304
+
+# Safety margin of the chord pruning, so rounding never drops sites at the
+# edge of the cap
+PruningMargin = 1e-09
+
+
+# Neighbourhood of a cell, with Rings cells in every direction
+@functools.lru_cache(maxsize=None)
+def _CellOffsets(Rings):
+
+    Offsets = np.array(list(itertools.product(range(- Rings, Rings + 1), repeat=3)), dtype=np.int64)
+    Offsets.setflags(write=False)
+
+    return(Offsets)
+
+# Nearest-site index of sites
+# Latitude and Longitude are arrays in degrees, or Latitude is a Gazetteer
+# or a dictionary with the format of LocationDict (LocationDict by default).
+# Names of the sites are optional for arrays
+class SiteIndex:
+
+    def __init__(self, Latitude=None, Longitude=None, Names=None, SitesPerCell=DefaultSitesPerCell):
+
+        if(Latitude is None):
+            Latitude = LocationDict
+        if(isinstance(Latitude, Gazetteer)):
+            Names, Latitude, Longitude = Latitude.Names, Latitude.Latitude, Latitude.Longitude
+        elif(isinstance(Latitude, dict)):
+            Names, Latitude, Longitude = LocationArrays(Latitude)
+
+        self.Latitude = np.atleast_1d(np.asarray(Latitude, dtype=float))
+        self.Longitude = np.atleast_1d(np.asarray(Longitude, dtype=float))
+        self.Names = None if Names is None else np.asarray(Names)
+        if(self.Latitude.size == 0):
+            raise ValueError("Index needs at least one site!")
+
+        Vectors = SiteVectors(self.Latitude, self.Longitude).reshape(-1, 3)
+
+        # Cells of about SitesPerCell sites, if they were uniformly
+        # distributed on the 4π area of the unit sphere
+        self.CellSize = min(2.0, math.sqrt(4 * math.pi * SitesPerCell / Vectors.shape[0]))
+        self.GridSize = int(math.ceil(2 / self.CellSize)) + 1
+
+        Keys = self._Keys(self._Cells(Vectors))
+        Order = np.argsort(Keys, kind="stable")
+
+        # Sorted sites, their indices in the input, and the cells
+        self.Indices = Order
+        self.Vectors = np.ascontiguousarray(Vectors[Order])
+        self.CellKeys, self.CellStarts, self.CellCounts = np.unique(Keys[Order], return_index=True, return_counts=True)
+        self.CellCoordinates = np.stack((self.CellKeys // self.GridSize**2, self.CellKeys // self.GridSize % self.GridSize, self.CellKeys % self.GridSize), axis=-1)
+
+    def __len__(self):
+
+        return(self.Indices.size)
+
+    # Cells of unit vectors along the three axes
+    def _Cells(self, Vectors):
+
+        return(np.clip(np.floor((Vectors + 1) / self.CellSize), 0, self.GridSize - 1).astype(np.int64))
+
+    def _Keys(self, Cells):
+
+        return((Cells[...,0] * self.GridSize + Cells[...,1]) * self.GridSize + Cells[...,2])
+
+    # Sorted positions of the sites in the cells around Cell
+    # Neighbouring cells are looked up one by one, or if there are more of
+    # them than nonempty cells, every nonempty cell is tested
+    def _Candidates(self, Cell, Rings):
+
+        if((2 * Rings + 1)**3 > self.CellKeys.size):
+            Positions = np.flatnonzero(np.all(np.abs(self.CellCoordinates - Cell) <= Rings, axis=1))
+        else:
+            Neighbours = Cell + _CellOffsets(Rings)
+            Neighbours = Neighbours[np.all((Neighbours >= 0) & (Neighbours < self.GridSize), axis=1)]
+            Keys = self._Keys(Neighbours)
+
+            Positions = np.minimum(np.searchsorted(self.CellKeys, Keys), self.CellKeys.size - 1)
+            Positions = Positions[self.CellKeys[Positions] == Keys]
+
+        Starts = self.CellStarts[Positions]
+        Counts = self.CellCounts[Positions]
+        Local = np.arange(Counts.sum()) - np.repeat(np.cumsum(Counts) - Counts, Counts)
+
+        return(np.repeat(Starts, Counts) + Local)
+
+    # Nearest k of the Candidates (sorted positions) of Points (unit vectors)
+    # Returns the sorted positions and squared chord lengths, nearest first
+    @staticmethod
+    def _Nearest(Points, Vectors, Candidates, k):
+
+        ChordSquared = ChordSquaredMatrix(Points, Vectors[Candidates])
+        if(Candidates.size > k):
+            Nearest = np.argpartition(ChordSquared, k - 1, axis=1)[:,:k]
+            ChordSquared = np.take_along_axis(ChordSquared, Nearest, axis=1)
+        else:
+            Nearest = np.broadcast_to(np.arange(Candidates.size), ChordSquared.shape)
+
+        Order = np.argsort(ChordSquared, axis=1)
+
+        return(Candidates[np.take_along_axis(Nearest, Order, axis=1)], np.take_along_axis(ChordSquared, Order, axis=1))
+
+    # Points (indices of unit vectors) grouped by their cells
+    # Yields the cell and the points of every group
+    def _CellGroups(self, Points, Pending):
+
+        Cells = self._Cells(Points[Pending])
+        PointKeys, Groups = np.unique(self._Keys(Cells), return_inverse=True)
+        Groups = Groups.ravel()
+        GroupOrder = np.argsort(Groups, kind="stable")
+        GroupStarts = np.searchsorted(Groups[GroupOrder], np.arange(PointKeys.size + 1))
+
+        for Group in range(PointKeys.size):
+            Members = GroupOrder[GroupStarts[Group]:GroupStarts[Group + 1]]
+            yield(Cells[Members[0]], Pending[Members])
+
+    # Search Points (unit vectors) with Rings around their cells
+    # Results are written into Positions and ChordSquared
+    # Returns the points, which need a wider search
+    def _SearchCells(self, Points, Pending, Rings, k, Positions, ChordSquared):
+
+        Radius = Rings * self.CellSize
+
+        Remaining = []
+        for Cell, Members in self._CellGroups(Points, Pending):
+            Candidates = self._Candidates(Cell, Rings)
+            if(Candidates.size < k):
+                Remaining.append(Members)
+                continue
+
+            Rows = max(1, CandidatePairsPerBlock // Candidates.size)
+            for RowStart in range(0, Members.size, Rows):
+                Block = Members[RowStart:RowStart + Rows]
+                BlockPositions, BlockChordSquared = self._Nearest(Points[Block], self.Vectors, Candidates, k)
+
+                # Nearest sites are certain, if they're inside the searched
+                # cells' radius
+                Found = BlockChordSquared[:,-1] <= Radius**2
+                Positions[Block[Found]] = BlockPositions[Found]
+                ChordSquared[Block[Found]] = BlockChordSquared[Found]
+                Remaining.append(Block[~ Found])
+
+        return(np.concatenate(Remaining) if Remaining else np.empty(0, dtype=np.int64))
+
+    # Search Points (unit vectors) against every site
+    def _SearchAll(self, Points, Pending, k, Positions, ChordSquared):
+
+        Candidates = np.arange(len(self))
+        Rows = max(1, CandidatePairsPerBlock // Candidates.size)
+        for RowStart in range(0, Pending.size, Rows):
+            Block = Pending[RowStart:RowStart + Rows]
+            Positions[Block], ChordSquared[Block] = self._Nearest(Points[Block], self.Vectors, Candidates, k)
+
+    # k nearest sites of points at Latitudes and Longitudes (degrees)
+    # Returns the indices of the sites and their distances in meters, with
+    # the shape of the points and a last axis of k, nearest first
+    # If there are less than k sites, the missing ones have index -1 and
+    # infinite distance
+    def Query(self, Latitude, Longitude, k=1):
+
+        Shape = np.broadcast(np.asarray(Latitude), np.asarray(Longitude)).shape
+        Points = SiteVectors(Latitude, Longitude).reshape(-1, 3)
+
+        Found = min(k, len(self))
+        Positions = np.zeros((Points.shape[0], Found), dtype=np.int64)
+        ChordSquared = np.zeros((Points.shape[0], Found))
+
+        Pending = np.arange(Points.shape[0])
+        Rings = FirstSearchRings
+        while(Pending.size and Rings < self.GridSize):
+            Pending = self._SearchCells(Points, Pending, Rings, Found, Positions, ChordSquared)
+            Rings *= 2
+        if(Pending.size):
+            self._SearchAll(Points, Pending, Found, Positions, ChordSquared)
+
+        Indices = np.full((Points.shape[0], k), -1, dtype=np.int64)
+        Distances = np.full((Points.shape[0], k), np.inf)
+        Indices[:,:Found] = self.Indices[Positions]
+        Distances[:,:Found] = ChordToDistance(np.sqrt(ChordSquared))
+
+        return(Indices.reshape(Shape + (k,)), Distances.reshape(Shape + (k,)))
+
+    # Nearest site of points at Latitudes and Longitudes (degrees)
+    # Returns the indices of the sites and their distances in meters, with
+    # the shape of the points
+    def Nearest(self, Latitude, Longitude):
+
+        Indices, Distances = self.Query(Latitude, Longitude, k=1)
+
+        return(Indices[...,0], Distances[...,0])
+
+    # Sites within Distance (meters) of points at Latitudes and Longitudes
+    # (degrees), in blocks, so results larger than the memory can be
+    # processed block by block. Distance can also be an array, one for every
+    # point
+    # Yields the indices of the points (flattened) and of the sites, and
+    # their distances in meters for every block
+    def QueryRadiusBlocks(self, Latitude, Longitude, Distance):
+
+        Shape = np.broadcast(np.asarray(Latitude), np.asarray(Longitude)).shape
+        PointLatitude = np.broadcast_to(np.asarray(Latitude, dtype=float), Shape).ravel()
+        PointLongitude = np.broadcast_to(np.asarray(Longitude, dtype=float), Shape).ravel()
+        Points = SiteVectors(PointLatitude, PointLongitude).reshape(-1, 3)
+        Distance = np.broadcast_to(np.asarray(Distance, dtype=float), (Points.shape[0],))
+
+        # Chord lengths of the caps
+        Chords = DistanceToChord(Distance) + PruningMargin
+
+        for Cell, Members in self._CellGroups(Points, np.arange(Points.shape[0])):
+            Rings = int(math.ceil(Chords[Members].max() / self.CellSize))
+            Candidates = self._Candidates(Cell, min(Rings, self.GridSize))
+            if(Candidates.size == 0):
+                continue
+
+            Rows = max(1, CandidatePairsPerBlock // Candidates.size)
+            for RowStart in range(0, Members.size, Rows):
+                Block = Members[RowStart:RowStart + Rows]
+
+                # Pruning by the chord lengths, then the exact distances of
+                # the sites inside the caps
+                PairRows, PairColumns = np.nonzero(ChordSquaredMatrix(Points[Block], self.Vectors[Candidates]) <= Chords[Block,None]**2)
+                Sites = self.Indices[Candidates[PairColumns]]
+                Block = Block[PairRows]
+                Distances = GeogDistBatch(PointLatitude[Block], self.Latitude[Sites], PointLongitude[Block], self.Longitude[Sites])
+
+                Inside = Distances <= Distance[Block]
+                yield(Block[Inside], Sites[Inside], Distances[Inside])
+
+    # Sites within Distance (meters) of points at Latitudes and Longitudes
+    # (degrees), see QueryRadiusBlocks()
+    # Returns the indices of the points (flattened) and of the sites, and
+    # their distances in meters, sorted by the points, then by the distances
+    def QueryRadiusBatch(self, Latitude, Longitude, Distance):
+
+        PointIndices = []
+        SiteIndices = []
+        Distances = []
+        for BlockPoints, BlockSites, BlockDistances in self.QueryRadiusBlocks(Latitude, Longitude, Distance):
+            PointIndices.append(BlockPoints)
+            SiteIndices.append(BlockSites)
+            Distances.append(BlockDistances)
+
+        if(not PointIndices):
+            return(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0))
+
+        PointIndices = np.concatenate(PointIndices)
+        SiteIndices = np.concatenate(SiteIndices)
+        Distances = np.concatenate(Distances)
+        Order = np.lexsort((Distances, PointIndices))
+
+        return(PointIndices[Order], SiteIndices[Order], Distances[Order])
+
+    # Sites within Distance (meters) of a point at Latitude and Longitude
+    # (degrees)
+    # Returns the indices of the sites and their distances in meters, nearest
+    # first
+    def QueryRadius(self, Latitude, Longitude, Distance):
+
+        PointIndices, SiteIndices, Distances = self.QueryRadiusBatch(Latitude, Longitude, Distance)
+
+        return(SiteIndices, Distances)
+
+# Index of the sites in LocationDict
+# Built on the first call only
+@functools.lru_cache(maxsize=1)
+def DefaultSiteIndex():
+
+    return(SiteIndex(LocationDict))
+
+# Names of the nearest sites in LocationDict to points at Latitudes and
+# Longitudes (degrees), and their distances in meters
+def NearestLocation(Latitude, Longitude):
+
+    Index = DefaultSiteIndex()
+    Indices, Distances = Index.Nearest(Latitude, Longitude)
+
+    return(Index.Names[Indices], Distances)
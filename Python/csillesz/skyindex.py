@@ -0,0 +1,159 @@
+################################################################
+########                                                ########
+########       SKY-GRID SPATIAL INDEX, CONE SEARCHES    ########
+########                                                ########
+################################################################
+
+# The sky is cut into equal-area cells: NumberOfBands bands of equal width
+# in z = sin(δ), and every band into NumberOfSectors sectors of equal width
+# in Right Ascension (α). Equal dz * dα means equal area on the sphere
+# (Lambert's cylindrical projection)
+#
+# Objects are sorted by their cells, so every cell, and every run of
+# neighbouring cells in a band, is one contiguous slice of the sorted
+# unit vectors. A cone search only looks at the bands overlapping the cone,
+# and at the sectors inside the cone's Right Ascension range:
+# Δα = asin(sin(r) / cos(δ)), if the cone doesn't contain a pole
+# so one or two slices per band are tested with a dot product:
+# cos(d) = v_object · v_center >= cos(r)
+#
+# Cones around Horizontal (m, A) pointings are rotated into Equatorial II
+# coordinates with rotation.ConversionMatrix(), so only the center of the
+# cone is converted, not the catalog
+
+import math
+
+import numpy as np
+
+from .catalog import DefaultCatalog, StarCatalog
+from .rotation import ConversionMatrix, EquIIToVector, HorToVector
+
+# Average number of Objects in a cell
+DefaultObjectsPerCell = 16
+
+# Safety margin of the pruning in radians, so rounding never drops Objects
+# near the edges of the cells
+PruningMargin = 1e-09
+
+
+# Spatial index of a catalog
+# Catalog is a StarCatalog or a dictionary with the format of StellarDict
+# (StellarDict by default)
+class SkyIndex:
+
+    def __init__(self, Catalog=None, ObjectsPerCell=DefaultObjectsPerCell):
+
+        if(Catalog is None):
+            Catalog = DefaultCatalog()
+        elif(not isinstance(Catalog, StarCatalog)):
+            Catalog = StarCatalog.FromDict(Catalog)
+        self.Catalog = Catalog
+
+        Vectors = np.asarray(EquIIToVector(Catalog), dtype=float)
+
+        # Grid of about 2 * NumberOfBands^2 cells
+        NumberOfCells = max(1, len(Catalog) // ObjectsPerCell)
+        self.NumberOfBands = max(1, int(math.sqrt(NumberOfCells / 2)))
+        self.NumberOfSectors = 2 * self.NumberOfBands
+
+        Cells = self._Bands(Vectors[:,2]) * self.NumberOfSectors + self._Sectors(np.arctan2(Vectors[:,1], Vectors[:,0]))
+        Order = np.argsort(Cells, kind="stable")
+
+        # Sorted Objects, their indices in the catalog, and the first Object
+        # of every cell in the sorted arrays
+        self.Indices = Order
+        self.Vectors = np.ascontiguousarray(Vectors[Order])
+        self.CellStarts = np.searchsorted(Cells[Order], np.arange(self.NumberOfBands * self.NumberOfSectors + 1))
+
+    def __len__(self):
+
+        return(self.Indices.size)
+
+    # Band of z = sin(δ) values
+    def _Bands(self, z):
+
+        return(np.clip(np.floor((np.asarray(z) + 1) / 2 * self.NumberOfBands), 0, self.NumberOfBands - 1).astype(np.int64))
+
+    # Sector of α values in radians
+    def _Sectors(self, RightAscensionRadians):
+
+        Sectors = np.floor(np.mod(RightAscensionRadians, 2 * math.pi) / (2 * math.pi) * self.NumberOfSectors)
+
+        return(np.clip(Sectors, 0, self.NumberOfSectors - 1).astype(np.int64))
+
+    # Slices of the sorted arrays, that may contain Objects of the cone
+    def _CandidateSlices(self, Center, Radius):
+
+        x, y, z = Center
+        Declination = math.asin(max(-1, min(1, z)))
+        Radius = Radius + PruningMargin
+
+        LowerBand = int(self._Bands(math.sin(max(- math.pi / 2, Declination - Radius))))
+        UpperBand = int(self._Bands(math.sin(min(math.pi / 2, Declination + Radius))))
+
+        # Cones containing a pole cover every Right Ascension
+        if(Declination + Radius >= math.pi / 2 or Declination - Radius <= - math.pi / 2):
+            Sectors = [(0, self.NumberOfSectors - 1)]
+        else:
+            RightAscension = math.atan2(y, x)
+            HalfWidth = math.asin(min(1, math.sin(Radius) / math.cos(Declination)))
+            LowerSector = int(self._Sectors(RightAscension - HalfWidth))
+            UpperSector = int(self._Sectors(RightAscension + HalfWidth))
+            if(LowerSector <= UpperSector):
+                Sectors = [(LowerSector, UpperSector)]
+            else:
+                Sectors = [(0, UpperSector), (LowerSector, self.NumberOfSectors - 1)]
+
+        Slices = []
+        for Band in range(LowerBand, UpperBand + 1):
+            for LowerSector, UpperSector in Sectors:
+                Start = self.CellStarts[Band * self.NumberOfSectors + LowerSector]
+                End = self.CellStarts[Band * self.NumberOfSectors + UpperSector + 1]
+                if(Start < End):
+                    Slices.append((Start, End))
+
+        return(Slices)
+
+    # Objects within Radius (degrees) of the unit vector Center (Equatorial II)
+    # Returns the indices of the Objects in the catalog, and their angular
+    # distances from the center in degrees, if Separations is True
+    def ConeSearchVector(self, Center, Radius, Separations=False):
+
+        Center = np.asarray(Center, dtype=float)
+        Center = Center / np.linalg.norm(Center)
+        RadiusRadians = math.radians(Radius)
+
+        if(RadiusRadians >= math.pi):
+            Candidates = np.arange(len(self))
+        else:
+            Slices = self._CandidateSlices(Center, RadiusRadians)
+            if(len(Slices) == 1):
+                Candidates = np.arange(*Slices[0])
+            elif(Slices):
+                Candidates = np.concatenate([np.arange(Start, End) for Start, End in Slices])
+            else:
+                Candidates = np.empty(0, dtype=np.int64)
+
+        # cos(d) = v_object · v_center
+        Cosines = self.Vectors[Candidates] @ Center
+        Inside = Cosines >= math.cos(RadiusRadians)
+        Indices = self.Indices[Candidates[Inside]]
+
+        if(not Separations):
+            return(Indices)
+
+        return(Indices, np.degrees(np.arccos(np.clip(Cosines[Inside], -1, 1))))
+
+    # Objects within Radius (degrees) of Right Ascension (α) and Declination (δ)
+    def ConeSearch(self, RightAscension, Declination, Radius, Separations=False):
+
+        return(self.ConeSearchVector(EquIIToVector(RightAscension, Declination), Radius, Separations))
+
+    # Objects within Radius (degrees) of an Altitude (m) and Azimuth (A)
+    # pointing at Latitude (φ) and LMST (S)
+    # Latitude can also be an ObserverContext
+    def ConeSearchHorizontal(self, Latitude, Altitude, Azimuth, Radius, LocalSiderealTime, Separations=False):
+
+        Center = ConversionMatrix("Hor", "EquII", Latitude, LocalSiderealTime) @ HorToVector(Altitude, Azimuth)
+
+        return(self.ConeSearchVector(Center, Radius, Separations))
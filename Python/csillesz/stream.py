@@ -0,0 +1,201 @@
+################################################################
+########                                                ########
+########        STREAMING (CHUNKED) CONVERSIONS         ########
+########                                                ########
+################################################################
+
+# Large record files are processed in chunks of fixed size, so memory use
+# is bounded by the chunk size and not by the length of the file
+# Every stage is a generator, that consumes and yields chunks, and results
+# are written out chunk by chunk
+
+import itertools
+import os
+
+import numpy as np
+
+from .batch import HorToEquIIBatch, NormalizeZeroBoundedArray
+from .geography import GeogDistBatch
+from .sidereal import LocalSiderealTimeFromUnixTime
+
+# Default number of records in a chunk
+DefaultChunkSize = 65536
+
+
+################################################################
+########                                                ########
+########            READING RECORDS IN CHUNKS           ########
+########                                                ########
+################################################################
+
+# Group an iterable of records (eg. tuples) into 2D arrays with at most
+# ChunkSize rows
+def ChunkRecords(Records, ChunkSize=DefaultChunkSize):
+
+    Iterator = iter(Records)
+    while(True):
+        Rows = list(itertools.islice(Iterator, ChunkSize))
+        if(not Rows):
+            return
+        yield(np.asarray(Rows, dtype=float))
+
+# Read a delimited text file (eg. CSV) in chunks of 2D arrays
+# SkipRows header lines are skipped, UseColumns selects the columns
+def ReadTextChunks(FileName, ChunkSize=DefaultChunkSize, Delimiter=",", SkipRows=0, UseColumns=None):
+
+    with open(FileName) as File:
+        for Line in itertools.islice(File, SkipRows):
+            pass
+
+        while(True):
+            Lines = list(itertools.islice(File, ChunkSize))
+            if(not Lines):
+                return
+            yield(np.loadtxt(Lines, delimiter=Delimiter, usecols=UseColumns, ndmin=2))
+
+# Read a binary file of records with Columns values of DType each, in
+# chunks of 2D arrays
+# The file is memory-mapped, so only the actual chunk is read into memory
+# Raises ValueError if the file is not a whole number of records (eg. it's
+# truncated)
+def ReadBinaryChunks(FileName, Columns, ChunkSize=DefaultChunkSize, DType=np.float64):
+
+    RecordSize = Columns * np.dtype(DType).itemsize
+    FileSize = os.path.getsize(FileName)
+    if(FileSize % RecordSize != 0):
+        raise ValueError("{0} is not a whole number of {1} byte records ({2} trailing bytes)!".format(FileName, RecordSize, FileSize % RecordSize))
+    if(FileSize == 0):
+        return
+
+    Records = np.memmap(FileName, dtype=DType, mode="r").reshape(-1, Columns)
+
+    for Start in range(0, Records.shape[0], ChunkSize):
+        yield(np.array(Records[Start:Start + ChunkSize], dtype=float))
+
+# Join the columns of a chunk into a 2D array
+def _Rows(Chunk):
+
+    if(isinstance(Chunk, tuple)):
+        return(np.column_stack(Chunk))
+
+    return(np.asarray(Chunk).reshape(len(Chunk), -1))
+
+# Split a chunk into its columns
+# Chunks are either 2D arrays, or tuples of 1D arrays (eg. to keep
+# numpy.datetime64 timestamps)
+def _Columns(Chunk, NumberOfColumns):
+
+    if(isinstance(Chunk, tuple)):
+        return(Chunk[:NumberOfColumns])
+
+    Chunk = np.asarray(Chunk, dtype=float)
+
+    return(tuple(Chunk[:,Column] for Column in range(NumberOfColumns)))
+
+
+
+################################################################
+########                                                ########
+########            WRITING RESULTS IN CHUNKS           ########
+########                                                ########
+################################################################
+
+# Write chunks (2D arrays, 1D arrays or tuples of columns) into a delimited
+# text file, every value with Format
+# Header is written as the first line, if it's given
+# Returns the number of written records
+def WriteTextChunks(Chunks, FileName, Delimiter=",", Format="%.6f", Header=None):
+
+    Records = 0
+    with open(FileName, "w") as File:
+        if(Header is not None):
+            File.write(Header + "\n")
+
+        for Chunk in Chunks:
+            Rows = _Rows(Chunk)
+            # The whole chunk is formatted with one % operation, instead of
+            # one per row (numpy.char.mod() formats the values one by one)
+            ChunkFormat = (Delimiter.join([Format] * Rows.shape[1]) + "\n") * Rows.shape[0]
+            File.write(ChunkFormat % tuple(Rows.ravel().tolist()))
+            Records += Rows.shape[0]
+
+    return(Records)
+
+# Write chunks (2D arrays, 1D arrays or tuples of columns) into a binary file
+# of records, with values of DType (see ReadBinaryChunks())
+# Returns the number of written records
+def WriteBinaryChunks(Chunks, FileName, DType=np.float64):
+
+    Records = 0
+    with open(FileName, "wb") as File:
+        for Chunk in Chunks:
+            Rows = np.ascontiguousarray(_Rows(Chunk), dtype=DType)
+            File.write(Rows.tobytes())
+            Records += Rows.shape[0]
+
+    return(Records)
+
+
+
+################################################################
+########                                                ########
+########      1. CONVERSION OF COORDINATE SYSTEMS       ########
+########                                                ########
+################################################################
+
+# 2. Horizontal to Equatorial II, streaming
+# Consumes chunks of (Timestamp, Altitude, Azimuth) records, measured at
+# the given site. Timestamps are UT, see sidereal.ToUnixTime()
+# LMST of a chunk is calculated in one vectorized step
+# Yields (Timestamps, Declination, RightAscension, LocalSiderealTime) for
+# every chunk
+def HorToEquIIStream(Chunks, Latitude, Longitude):
+
+    for Chunk in Chunks:
+        Timestamps, Altitude, Azimuth = _Columns(Chunk, 3)
+
+        LocalSiderealTime = LocalSiderealTimeFromUnixTime(Timestamps, Longitude)
+        Declination, RightAscension, LocalSiderealTime = HorToEquIIBatch(Latitude, Altitude, Azimuth, LocalSiderealTime)
+        # Right Ascension: [0h,24h[
+        RightAscension = NormalizeZeroBoundedArray(RightAscension, 24)
+
+        yield(Timestamps, Declination, RightAscension, LocalSiderealTime)
+
+
+
+################################################################
+########                                                ########
+########            2. GEOGRAPHICAL DISTANCE            ########
+########                                                ########
+################################################################
+
+# Distances of site pairs, streaming
+# Consumes chunks of (Latitude1, Longitude1, Latitude2, Longitude2) records
+# in degrees, and calculates the haversine of GeogDistCalc() in one
+# vectorized step for every chunk (see geography.GeogDistBatch())
+# Yields the Distances in meters for every chunk
+def GeogDistStream(Chunks):
+
+    for Chunk in Chunks:
+        Latitude1, Longitude1, Latitude2, Longitude2 = _Columns(Chunk, 4)
+
+        yield(GeogDistBatch(Latitude1, Latitude2, Longitude1, Longitude2))
+
+# Distances of site pairs from a file into a file, in chunks
+# The input is a delimited text file, or if Binary is True, a binary file of
+# float64 records (see ReadBinaryChunks()). UseColumns selects the
+# Latitude1, Longitude1, Latitude2 and Longitude2 columns of the records
+# The output is a text file of Distances (meters), or if OutputBinary is
+# True, a binary file of float64 Distances
+# Returns the number of site pairs
+def GeogDistFile(InputFileName, OutputFileName, ChunkSize=DefaultChunkSize, Delimiter=",", SkipRows=0, UseColumns=(0, 1, 2, 3), Binary=False, NumberOfColumns=4, OutputBinary=False, Format="%.3f"):
+
+    if(Binary):
+        Chunks = (Chunk[:,list(UseColumns)] for Chunk in ReadBinaryChunks(InputFileName, NumberOfColumns, ChunkSize))
+    else:
+        Chunks = ReadTextChunks(InputFileName, ChunkSize, Delimiter, SkipRows, UseColumns)
+
+    if(OutputBinary):
+        return(WriteBinaryChunks(GeogDistStream(Chunks), OutputFileName))
+
+    return(WriteTextChunks(GeogDistStream(Chunks), OutputFileName, Delimiter, Format))
@@ -0,0 +1,209 @@
+################################################################
+########                                                ########
+########     HIGH-CADENCE TRACKING (INCREMENTAL)        ########
+########                                                ########
+################################################################
+
+# Altitude (m) and Azimuth (A) of a target at a fixed tick rate (eg. for
+# mount control), without recalculating the LMST for every tick
+#
+# At a sync point the Local Hour Angle (H = S - α) is calculated exactly
+# (see sidereal.LocalSiderealTimeFromUnixTime()). Between sync points the
+# Earth rotates by a fixed angle in every tick:
+# ΔH = dS * Δt * 15°/3600s
+# so H is advanced with the angle-addition recurrence
+# cos(H + ΔH) = cos(H) * cos(ΔH) - sin(H) * sin(ΔH)
+# sin(H + ΔH) = sin(H) * cos(ΔH) + cos(H) * sin(ΔH)
+# with the precalculated sin(ΔH) and cos(ΔH), and then
+# sin(m) = sin(δ) * sin(φ) + cos(δ) * cos(φ) * cos(H)
+# A = atan2(- sin(H) * cos(δ), sin(δ) * cos(φ) - cos(δ) * sin(φ) * cos(H))
+# Rounding errors of the recurrence grow slowly, and they are removed by
+# the next sync point, every ResyncTicks ticks
+#
+# The sidereal clock works the same way, without a target: LMST is
+# calculated exactly at the sync points, and advanced by
+# ΔS = dS * Δt
+# in every tick between them. Its drift from the exact formula (see
+# SiderealClock()) stays below MaximalClockDrift
+
+import collections
+import math
+import time
+
+import numpy as np
+
+from .core import NormalizeSymmetricallyBoundedPI_2, SiteTrigonometry, dS
+from .sidereal import LocalSiderealTimeFromUnixTime, ToUnixTime
+
+# Default number of ticks between two sync points
+DefaultResyncTicks = 6000
+
+# Default number of the latest ticks kept for latency percentiles
+DefaultLatencyWindow = 4096
+
+# Bound of the sidereal clock's drift from the exact LMST in seconds, for
+# at most 10^6 ticks between the sync points. Both sources are far below it:
+# - rounding of the accumulation: < 0.5 ulp(24h) = 6.4e-12 s per tick
+# - the exact formula jumps at 00:00 UT, because S_0 of the next date is
+#   larger by 360.98564736629°/15 - 24h, not by (dS - 1) * 24h: 7e-08 s
+MaximalClockDrift = 1e-05
+
+
+# Per-tick latency statistics of a tracking generator
+# Latencies are the calculation times of the ticks in nanoseconds, the
+# time spent by the consumer of the generator is not included
+class TrackingStatistics:
+
+    def __init__(self, Window=DefaultLatencyWindow):
+
+        self.Ticks = 0
+        self.Resyncs = 0
+        self.TotalNanoseconds = 0
+        self.MaximalNanoseconds = 0
+        self.Recent = collections.deque(maxlen=Window)
+
+    def Record(self, Nanoseconds, Resync=False):
+
+        self.Ticks += 1
+        self.Resyncs += Resync
+        self.TotalNanoseconds += Nanoseconds
+        self.MaximalNanoseconds = max(self.MaximalNanoseconds, Nanoseconds)
+        self.Recent.append(Nanoseconds)
+
+    @property
+    def MeanMicroseconds(self):
+
+        return(self.TotalNanoseconds / max(self.Ticks, 1) / 1e03)
+
+    @property
+    def MaximalMicroseconds(self):
+
+        return(self.MaximalNanoseconds / 1e03)
+
+    # Percentile of the latencies of the latest ticks in microseconds
+    def PercentileMicroseconds(self, Percentile):
+
+        if(not self.Recent):
+            return(math.nan)
+
+        return(float(np.percentile(self.Recent, Percentile)) / 1e03)
+
+    def __repr__(self):
+
+        return("TrackingStatistics(Ticks={0}, Resyncs={1}, Mean={2:.2f} µs, p99={3:.2f} µs, Max={4:.2f} µs)".format(
+               self.Ticks, self.Resyncs, self.MeanMicroseconds, self.PercentileMicroseconds(99), self.MaximalMicroseconds))
+
+# Track a target at Right Ascension (α, hours) and Declination (δ, degrees)
+# from the UT instant Start (Unix timestamp), with Frequency ticks/second
+# Latitude and Longitude can also be ObserverContexts
+# Ticks is the number of ticks (endless if None), and the exact state is
+# recalculated in every ResyncTicks ticks. Raises ValueError if ResyncTicks
+# is less than 1
+# If Statistics (a TrackingStatistics) is given, the latency of every tick
+# is recorded into it
+# Yields (Timestamp, Altitude, Azimuth) for every tick
+def TrackTarget(Latitude, Longitude, RightAscension, Declination, Start, Frequency=10, Ticks=None, ResyncTicks=DefaultResyncTicks, Statistics=None):
+
+    if(ResyncTicks < 1):
+        raise ValueError("ResyncTicks must be at least 1, not {0}!".format(ResyncTicks))
+
+    Latitude, sinLat, cosLat = SiteTrigonometry(Latitude)
+    Declination = NormalizeSymmetricallyBoundedPI_2(Declination)
+    sinDec = math.sin(math.radians(Declination))
+    cosDec = math.cos(math.radians(Declination))
+
+    # Constant parts of the formulas
+    AltitudeConstant = sinDec * sinLat
+    AltitudeFactor = cosDec * cosLat
+    AzimuthConstant = sinDec * cosLat
+    AzimuthFactor = cosDec * sinLat
+
+    # Rotation of the Earth in one tick
+    # ΔH = dS * Δt * 15°/3600s
+    Step = 1 / Frequency
+    StepRadians = math.radians(dS * Step * 15 / 3600)
+    cosStep = math.cos(StepRadians)
+    sinStep = math.sin(StepRadians)
+
+    Start = float(Start)
+    cosLHA = sinLHA = 0.0
+    Tick = 0
+    while(Ticks is None or Tick < Ticks):
+        TickStart = time.perf_counter_ns()
+
+        Timestamp = Start + Tick * Step
+        Resync = Tick % ResyncTicks == 0
+        if(Resync):
+            # Exact Local Hour Angle at the sync point
+            # t = S - α
+            LocalSiderealTime = float(LocalSiderealTimeFromUnixTime(Timestamp, Longitude))
+            LocalHourAngleRadians = math.radians((LocalSiderealTime - RightAscension) * 15)
+            cosLHA = math.cos(LocalHourAngleRadians)
+            sinLHA = math.sin(LocalHourAngleRadians)
+        else:
+            cosLHA, sinLHA = cosLHA * cosStep - sinLHA * sinStep, sinLHA * cosStep + cosLHA * sinStep
+
+        Altitude = math.degrees(math.asin(max(-1, min(1, AltitudeConstant + AltitudeFactor * cosLHA))))
+        Azimuth = math.degrees(math.atan2(- sinLHA * cosDec, AzimuthConstant - AzimuthFactor * cosLHA)) % 360
+
+        if(Statistics is not None):
+            Statistics.Record(time.perf_counter_ns() - TickStart, Resync)
+
+        yield(Timestamp, Altitude, Azimuth)
+        Tick += 1
+
+# Local Mean Sidereal Time of a site at Frequency ticks/second, from the UT
+# instant Start (Unix timestamp or numpy.datetime64, now if None)
+# Longitude can also be an ObserverContext
+# Ticks is the number of ticks (endless if None), and the exact LMST is
+# recalculated in every ResyncTicks ticks (see MaximalClockDrift). Raises
+# ValueError if ResyncTicks is less than 1
+# If RealTime is True, every tick is yielded at its instant (for displays),
+# otherwise immediately
+# If Statistics (a TrackingStatistics) is given, the latency of every tick
+# is recorded into it
+# Yields (Timestamp, LMST) for every tick, or (Timestamp, LMST, Hours,
+# Minutes, Seconds) if HMS is True
+def SiderealClock(Longitude, Start=None, Frequency=1, Ticks=None, ResyncTicks=DefaultResyncTicks, RealTime=False, HMS=False, Statistics=None):
+
+    if(ResyncTicks < 1):
+        raise ValueError("ResyncTicks must be at least 1, not {0}!".format(ResyncTicks))
+
+    Start = time.time() if Start is None else float(ToUnixTime(Start))
+
+    # Rotation of the Earth in one tick in sidereal hours
+    # ΔS = dS * Δt
+    Step = 1 / Frequency
+    SiderealStep = dS * Step / 3600
+
+    LocalSiderealTime = 0.0
+    Tick = 0
+    while(Ticks is None or Tick < Ticks):
+        Timestamp = Start + Tick * Step
+        if(RealTime):
+            time.sleep(max(0, Timestamp - time.time()))
+
+        TickStart = time.perf_counter_ns()
+
+        Resync = Tick % ResyncTicks == 0
+        if(Resync):
+            LocalSiderealTime = float(LocalSiderealTimeFromUnixTime(Timestamp, Longitude))
+        else:
+            LocalSiderealTime += SiderealStep
+            # LMST: [0h,24h[
+            if(LocalSiderealTime >= 24):
+                LocalSiderealTime -= 24
+
+        if(HMS):
+            Hours = int(LocalSiderealTime)
+            Minutes = int((LocalSiderealTime - Hours) * 60)
+            Seconds = int(((LocalSiderealTime - Hours) * 60 - Minutes) * 60)
+            Values = (Timestamp, LocalSiderealTime, Hours, Minutes, Seconds)
+        else:
+            Values = (Timestamp, LocalSiderealTime)
+
+        if(Statistics is not None):
+            Statistics.Record(time.perf_counter_ns() - TickStart, Resync)
+
+        yield(Values)
+        Tick += 1
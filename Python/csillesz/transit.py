@@ -0,0 +1,122 @@
+################################################################
+########                                                ########
+########      MERIDIAN TRANSIT TABLES OF CATALOGS       ########
+########                                                ########
+################################################################
+
+# Upper transit (culmination) of an Object is the instant, when its Local
+# Hour Angle is zero, so the LMST equals its Right Ascension: S = α
+#
+# LMST is inverted with the formulas of LocalSiderealTimeCalc():
+# S = S_0 + λ/15 + dS * UT
+# For every night, the LMST (S_w) is calculated once, at the start of the
+# night's window (WindowStart local time of the date), and every Object
+# transits
+# Δt = ((α - S_w) mod 24h) / dS
+# later, at its first transit in the window. So a whole (Objects x nights)
+# table needs one LMST per night and no iteration
+#
+# The Altitude of the upper culmination doesn't depend on the date:
+# sin(m) = sin(δ) * sin(φ) + cos(δ) * cos(φ) * cos(0) = cos(φ - δ)
+# m = 90° - |φ - δ|
+# which is negative for Objects, that never rise at the site
+
+import numpy as np
+
+from .batch import NormalizeSymmetricallyBoundedPI_2Array, NormalizeSymmetricallyBoundedPIArray, StellarArrays
+from .catalog import StarCatalog
+from .core import ObserverContext, StellarDict, dS
+from .sidereal import HoursToHMSArray, LocalSiderealTimeFromUnixTime, LocalTimeToUnixTime, SiteTimeZoneArray
+
+# Default start of the nights' windows in local hours (local noon, so the
+# window of a date contains the whole night after it)
+DefaultWindowStart = 12
+
+
+# Dates from StartDate to EndDate (both included), as numpy.datetime64
+# dates. Dates are given as "YYYY-MM-DD" strings or numpy.datetime64 values
+def NightDates(StartDate, EndDate):
+
+    StartDate = np.datetime64(StartDate, "D")
+    EndDate = np.datetime64(EndDate, "D")
+
+    return(np.arange(StartDate, EndDate + 1, dtype="datetime64[D]"))
+
+# Years, Months and Days of numpy.datetime64 dates
+def _DateParts(Dates):
+
+    Dates = np.asarray(Dates, dtype="datetime64[D]")
+    Months = Dates.astype("datetime64[M]")
+
+    Years = Months.astype("datetime64[Y]").astype(np.int64) + 1970
+    MonthNumbers = Months.astype(np.int64) % 12 + 1
+    Days = (Dates - Months).astype(np.int64) + 1
+
+    return(Years, MonthNumbers, Days)
+
+# Names, Right Ascensions and Declinations of the selected Objects
+# Stars is a dictionary with the format of StellarDict or a StarCatalog, and
+# Names selects Objects of it (every Object if None)
+def _Objects(Stars, Names):
+
+    if(Names is None):
+        return(StellarArrays(Stars))
+
+    Names = [Names] if isinstance(Names, str) else list(Names)
+    if(isinstance(Stars, StarCatalog)):
+        Selected = Stars[np.array([Stars.Lookup(Name) for Name in Names], dtype=np.int64)]
+        return(StellarArrays(Selected))
+
+    Coordinates = np.array([Stars[Name] for Name in Names], dtype=float).reshape(-1, 2)
+
+    return(np.array(Names), Coordinates[:,0], Coordinates[:,1])
+
+# Upper transits of Objects on nights
+# Latitude and Longitude can also be ObserverContexts
+# Dates are the local dates of the nights (see NightDates()), every night is
+# the 24 hour window from WindowStart local time of its date
+# Stars is a dictionary with the format of StellarDict or a StarCatalog
+# (eg. from LoadCatalog()), Names selects Objects of it (every Object if
+# None). Raises KeyError if a Name is not in Stars
+# TimeZone is in hours, by default it's derived from the Longitude. By
+# default the summer time rule of LTtoUT() is applied too, like in the
+# scalar program (see sidereal.LocalSiderealTimeFromLocalTime()). With
+# SummerTime=False local times are standard times, one hour off during
+# summer time
+# Returns (Names, LocalTime, Timestamps, Altitude):
+# LocalTime: local times of the transits in hours, (Objects x Dates)
+# Timestamps: UT instants of the transits (Unix timestamps), (Objects x Dates)
+# Altitude: culmination Altitudes in degrees, (Objects x Dates) read-only
+# view of one value per Object
+# If HMS is True, the Hours, Minutes and Seconds of LocalTime are returned
+# too, after Altitude
+def TransitTable(Latitude, Longitude, Dates, Stars=StellarDict, Names=None, TimeZone=None, SummerTime=True, WindowStart=DefaultWindowStart, HMS=False):
+
+    Names, RightAscension, Declination = _Objects(Stars, Names)
+    RightAscension = np.asarray(RightAscension, dtype=float)
+    Declination = NormalizeSymmetricallyBoundedPI_2Array(np.asarray(Declination, dtype=float))
+
+    if(TimeZone is None):
+        TimeZone = SiteTimeZoneArray(Longitude)
+
+    # Start of the windows, and LMST at them (S_w)
+    Years, Months, Days = _DateParts(Dates)
+    WindowTimestamps = np.atleast_1d(LocalTimeToUnixTime(Years, Months, Days, WindowStart, 0, 0, TimeZone, SummerTime))
+    WindowSiderealTime = np.atleast_1d(LocalSiderealTimeFromUnixTime(WindowTimestamps, Longitude))
+
+    # Δt = ((α - S_w) mod 24h) / dS, in solar hours
+    Delay = np.mod(RightAscension[:,None] - WindowSiderealTime[None,:], 24) / dS
+
+    Timestamps = WindowTimestamps[None,:] + Delay * 3600
+    LocalTime = np.mod(WindowStart + Delay, 24)
+
+    # m = 90° - |φ - δ|
+    if(isinstance(Latitude, ObserverContext)):
+        Latitude = Latitude.Latitude
+    Latitude = NormalizeSymmetricallyBoundedPIArray(Latitude)
+    Altitude = np.broadcast_to((90 - np.abs(Latitude - Declination))[:,None], Timestamps.shape)
+
+    if(HMS):
+        return((Names, LocalTime, Timestamps, Altitude) + HoursToHMSArray(LocalTime))
+
+    return(Names, LocalTime, Timestamps, Altitude)
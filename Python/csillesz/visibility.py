@@ -0,0 +1,143 @@
+################################################################
+########                                                ########
+########     VISIBILITY QUERY ("WHAT IS ABOVE NOW")     ########
+########                                                ########
+################################################################
+
+# An Object at Declination (δ) is above the Altitude (m) at Latitude (φ),
+# if its Local Hour Angle (H) satisfies
+# cos(H) >= (sin(m) - sin(δ) * sin(φ)) / cos(δ) * cos(φ)
+# (see the rising/setting branch of EquIToHor())
+# For a fixed site and threshold Altitude the right side only depends on δ,
+# so every Object has a fixed half-width (H_0) of its visible arc:
+# it is visible at LMST (S), if |S - α| <= H_0 (measured on the 24h circle)
+#
+# VisibilityIndex precalculates H_0 for the whole catalog once, separates
+# the circumpolar and the never rising Objects, and sorts the rest into
+# Declination bands by Right Ascension. A query only looks at the
+# [S - H_0,max; S + H_0,max] Right Ascension window of every band, so no
+# trigonometry is done at query time, and the cost scales with the number
+# of visible Objects instead of the size of the catalog
+
+import numpy as np
+
+from .batch import EquIToHorBatch, NormalizeZeroBoundedArray, NormalizeSymmetricallyBoundedPI_2Array, SiteTrigonometryArray, StellarArrays
+from .core import ObserverContext, StellarDict
+from .sidereal import LocalSiderealTimeFromUnixTime
+
+# Default width of the Declination bands in degrees
+DefaultBandWidth = 5
+
+
+# Precalculated visibility index of a catalog at a site
+# Latitude can also be an ObserverContext
+# Altitude is the threshold Altitude (m) in degrees (eg. 0 for the horizon)
+# Format of Stars is the same as StellarDict's
+class VisibilityIndex:
+
+    def __init__(self, Latitude, Altitude=0, Stars=StellarDict, BandWidth=DefaultBandWidth):
+
+        self.Observer = Latitude if isinstance(Latitude, ObserverContext) else None
+        self.Altitude = Altitude
+
+        self.Names, RightAscension, Declination = StellarArrays(Stars)
+        # Right Ascension: [0h,24h[
+        # Declination: [-π/2,+π/2]
+        self.RightAscension = NormalizeZeroBoundedArray(RightAscension, 24)
+        self.Declination = NormalizeSymmetricallyBoundedPI_2Array(Declination)
+
+        self.Latitude, sinLat, cosLat = SiteTrigonometryArray(Latitude)
+        DeclinationRadians = np.radians(self.Declination)
+
+        # cos(H) = (sin(m) - sin(δ) * sin(φ)) / cos(δ) * cos(φ)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            LHAcos = (np.sin(np.radians(Altitude)) - np.sin(DeclinationRadians) * sinLat) / (np.cos(DeclinationRadians) * cosLat)
+
+        # Objects, which never go below / never reach the threshold Altitude
+        # Same boundaries as in EquIToHorRiseSetBatch()
+        self.Circumpolar = np.flatnonzero(LHAcos < -1)
+        self.NeverRises = np.flatnonzero(LHAcos > 1)
+
+        # Half-width of the visible arc in hours (H_0)
+        Rest = np.flatnonzero((LHAcos >= -1) & (LHAcos <= 1))
+        HalfWidth = np.degrees(np.arccos(LHAcos[Rest])) / 15
+
+        # Sort the rest into Declination bands, and by Right Ascension in a band
+        Bands = np.floor((self.Declination[Rest] + 90) / BandWidth).astype(int)
+        Order = np.lexsort((self.RightAscension[Rest], Bands))
+        Rest, HalfWidth, Bands = Rest[Order], HalfWidth[Order], Bands[Order]
+
+        # Band borders in the sorted arrays
+        Borders = np.flatnonzero(np.diff(Bands)) + 1
+        self._BandStarts = np.concatenate(([0], Borders)).astype(int)
+        self._BandEnds = np.concatenate((Borders, [Rest.size])).astype(int)
+        self._BandHalfWidths = np.array([HalfWidth[Start:End].max(initial=0) for Start, End in zip(self._BandStarts, self._BandEnds)])
+
+        self._Indices = Rest
+        self._SortedRightAscension = self.RightAscension[Rest]
+        self._HalfWidth = HalfWidth
+
+    # Indices (into Names) of the Objects above the threshold Altitude at LMST
+    def QueryIndices(self, LocalSiderealTime):
+
+        # LMST: [0h,24h[
+        LocalSiderealTime = LocalSiderealTime % 24
+
+        Candidates = []
+        for Start, End, Width in zip(self._BandStarts, self._BandEnds, self._BandHalfWidths):
+            if(Width >= 12):
+                Candidates.append(np.arange(Start, End))
+                continue
+
+            # Right Ascension window of the band, which can wrap around 0h
+            Lower = (LocalSiderealTime - Width) % 24
+            Upper = (LocalSiderealTime + Width) % 24
+            RightAscension = self._SortedRightAscension[Start:End]
+            LowerIndex = Start + np.searchsorted(RightAscension, Lower, side="left")
+            UpperIndex = Start + np.searchsorted(RightAscension, Upper, side="right")
+
+            if(Lower <= Upper):
+                Candidates.append(np.arange(LowerIndex, UpperIndex))
+            else:
+                Candidates.append(np.arange(Start, UpperIndex))
+                Candidates.append(np.arange(LowerIndex, End))
+
+        Candidates = np.concatenate(Candidates) if Candidates else np.empty(0, dtype=int)
+
+        # Exact test of the candidates: |S - α| <= H_0
+        LocalHourAngle = np.abs(LocalSiderealTime - self._SortedRightAscension[Candidates])
+        LocalHourAngle = np.minimum(LocalHourAngle, 24 - LocalHourAngle)
+        Visible = Candidates[LocalHourAngle <= self._HalfWidth[Candidates]]
+
+        return(np.concatenate((self.Circumpolar, np.sort(self._Indices[Visible]))))
+
+    # Names of the Objects above the threshold Altitude at LMST
+    # If Coordinates is True, their Altitudes and Azimuths are also returned
+    def Query(self, LocalSiderealTime, Coordinates=False):
+
+        Indices = self.QueryIndices(LocalSiderealTime)
+
+        if(not Coordinates):
+            return(self.Names[Indices])
+
+        Latitude = self.Observer if self.Observer is not None else self.Latitude
+        Altitude, Azimuth = EquIToHorBatch(Latitude, self.RightAscension[Indices], self.Declination[Indices], LocalSiderealTime)
+
+        return(self.Names[Indices], Altitude, Azimuth)
+
+    # Same as Query(), at a UT instant (see sidereal.ToUnixTime())
+    # Longitude is taken from the ObserverContext, if it's not given
+    def QueryAtTime(self, Timestamp, Longitude=None, Coordinates=False):
+
+        if(Longitude is None):
+            if(self.Observer is None):
+                raise ValueError("Longitude is needed, if the index wasn't built with an ObserverContext!")
+            Longitude = self.Observer
+
+        return(self.Query(float(LocalSiderealTimeFromUnixTime(Timestamp, Longitude)), Coordinates))
+
+# Names of the Objects above Altitude (m) at Latitude (φ) and LMST (S)
+# Builds a VisibilityIndex, so for repeated queries build one and reuse it
+def VisibleObjects(Latitude, LocalSiderealTime, Altitude=0, Stars=StellarDict, Coordinates=False):
+
+    return(VisibilityIndex(Latitude, Altitude, Stars).Query(LocalSiderealTime, Coordinates))